@@ -0,0 +1,136 @@
+"""
+Measures how many websocket frames per second a bot receives and dispatches, with the
+`frame_prefilter` on and off.
+
+A fixed mix of frames, most of which no handler wants like on a busy community, is fed to
+`WSClient.on_websocket_message` and timed until the dispatch workers have handled every
+queued frame. The bot only has an `on_text_message` handler registered.
+
+    PYTHONPATH=. python benchmarks/frame_benchmark.py --frames 50000
+    PYTHONPATH=. python benchmarks/frame_benchmark.py --codec msgspec
+"""
+from os import chdir
+from json import dumps
+from time import perf_counter, sleep
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
+
+DEVICE_KEY = "E7309ECC0953C6FA60005B2765F99DBBC965C8E9"
+SIGNATURE_KEY = "DFA5ED192DDA6E88A12FE12130DC6206B1251E44"
+BOT_ID = "00000000-0000-0000-0000-000000000000"
+
+def chat_message(index: int, type: int = 0, mediaType: int = 0, uid: str = "user", content: Optional[str] = "hello") -> str:
+    return dumps({
+        "t": 1000,
+        "o": {
+            "ndcId": 1,
+            "alertOption": 1,
+            "membershipStatus": 1,
+            "chatMessage": {
+                "messageId": f"message-{index}",
+                "threadId": f"chat-{index % 16}",
+                "type": type,
+                "mediaType": mediaType,
+                "content": content,
+                "clientRefId": index,
+                "createdTime": "2024-01-01T00:00:00Z",
+                "isHidden": False,
+                "includedInSummary": True,
+                "mediaValue": None,
+                "extensions": {"mentionedArray": []},
+                "author": {
+                    "uid": uid,
+                    "nickname": "member",
+                    "icon": "http://pm1.aminoapps.com/icon.jpg",
+                    "level": 10,
+                    "reputation": 1000,
+                    "role": 0,
+                    "status": 0,
+                    "membershipStatus": 0,
+                    "accountMembershipStatus": 0,
+                    "isNicknameVerified": False,
+                    "avatarFrame": None
+                    }
+                }
+            }
+        })
+
+
+def frame_mix(count: int) -> List[str]:
+    """Returns `count` frames: one in eight is a text message the bot handles, the rest are frames it ignores."""
+    kinds = (
+        lambda index: chat_message(index),
+        lambda index: chat_message(index, uid=BOT_ID),
+        lambda index: chat_message(index, mediaType=100, content=None),
+        lambda index: chat_message(index, type=101, content=None),
+        lambda index: dumps({"t": 304, "o": {"actions": ["Typing"], "target": f"ndc://x1/chat-thread/chat-{index % 16}", "ndcId": 1, "id": index}}),
+        lambda index: dumps({"t": 306, "o": {"actions": ["Typing"], "target": f"ndc://x1/chat-thread/chat-{index % 16}", "ndcId": 1, "id": index}}),
+        lambda index: dumps({"t": 400, "o": {"topic": "ndtopic:x1:online-members", "ndcId": 1, "userProfileCount": 1, "userProfileList": []}}),
+        lambda index: chat_message(index, uid=BOT_ID, content="echo"),
+        )
+    return [kinds[index % len(kinds)](index) for index in range(count)]
+
+
+def run(bot, frames: List[str], prefilter: bool) -> Dict[str, float]:
+    bot.frame_prefilter = prefilter
+    bot.skipped_frames = 0
+    executor = bot.executor
+    processed = executor.processed + executor.errors
+
+    started = perf_counter()
+    for frame in frames:
+        bot.on_websocket_message(None, frame)
+
+    queued = len(frames) - bot.skipped_frames
+    while executor.processed + executor.errors - processed < queued:
+        sleep(0.001)
+    elapsed = perf_counter() - started
+
+    return {
+        "frames_per_second": len(frames) / elapsed,
+        "skipped": bot.skipped_frames,
+        "queued": queued
+        }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--codec", default=None, help="The JSON codec, e.g. orjson, msgspec or json.")
+    args = parser.parse_args()
+
+    from pymino import Bot
+    from pymino.ext.utilities.codec import set_codec
+
+    if args.codec:
+        set_codec(args.codec)
+
+    with TemporaryDirectory() as directory:
+        chdir(directory)
+        bot = Bot(device_key=DEVICE_KEY, signature_key=SIGNATURE_KEY, intents=True)
+        bot.userId = BOT_ID
+
+        @bot.on_text_message()
+        def text_message(ctx):
+            return None
+
+        frames = frame_mix(args.frames)
+        print(f"{len(frames)} frames, codec {bot.codec.name}, {bot.executor.workers} dispatch workers\n")
+        print(f"{'prefilter':<11}{'frames/s':>12}{'skipped':>10}{'queued':>9}")
+
+        results: Dict[bool, List[float]] = {True: [], False: []}
+        for _ in range(args.rounds):
+            for prefilter in (False, True):
+                result = run(bot, frames, prefilter)
+                results[prefilter].append(result["frames_per_second"])
+                print(f"{'on' if prefilter else 'off':<11}{result['frames_per_second']:>12.0f}{result['skipped']:>10}{result['queued']:>9}")
+
+        off, on = max(results[False]), max(results[True])
+        print(f"\nbest of {args.rounds}: off {off:.0f} frames/s, on {on:.0f} frames/s ({on / off:.2f}x)")
+        bot.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
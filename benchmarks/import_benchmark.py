@@ -0,0 +1,88 @@
+"""
+Checks that importing pymino stays fast, small and free of side effects.
+
+Every measurement runs in a fresh interpreter, so nothing is already imported or cached in
+memory. Wall time is the best of `--repeat` runs without tracing, peak memory is measured in a
+separate run with `tracemalloc`. The script exits with an error if a limit is exceeded or if a
+module that should be loaded lazily was imported.
+
+    PYTHONPATH=. python benchmarks/import_benchmark.py
+    PYTHONPATH=. python benchmarks/import_benchmark.py --repeat 10 --package-time 50
+"""
+import sys
+from json import loads
+from subprocess import run
+from argparse import ArgumentParser
+from typing import Dict, List, Tuple
+
+TIMED = """
+import sys, json
+from time import perf_counter
+started = perf_counter()
+{statement}
+elapsed = perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+TRACED = """
+import json, tracemalloc
+tracemalloc.start()
+{statement}
+print(json.dumps({{"peak": tracemalloc.get_traced_memory()[1]}}))
+"""
+
+def measure(statement: str, repeat: int) -> Tuple[float, int, List[str]]:
+    """Returns the best wall time in ms, the peak traced memory in bytes and the modules loaded by `statement`."""
+    def child(source: str) -> dict:
+        result = run([sys.executable, "-c", source.format(statement=statement)], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise SystemExit(f"`{statement}` failed:\n{result.stderr}")
+        return loads(result.stdout.strip().splitlines()[-1])
+
+    timings = [child(TIMED) for _ in range(repeat)]
+    peak = child(TRACED)["peak"]
+    return min(timing["seconds"] for timing in timings) * 1000, peak, timings[0]["modules"]
+
+
+def check(name: str, statement: str, max_ms: float, max_mb: float, forbidden: Tuple[str, ...], repeat: int) -> List[str]:
+    milliseconds, peak, modules = measure(statement, repeat)
+    megabytes = peak / (1024 * 1024)
+    loaded = [module for module in forbidden if module in modules]
+
+    print(f"{name:<26}{milliseconds:>10.1f} ms (limit {max_ms:g}){megabytes:>10.2f} MB (limit {max_mb:g})")
+
+    failures = []
+    if milliseconds > max_ms:
+        failures.append(f"{name}: {milliseconds:.1f} ms is over the {max_ms:g} ms limit")
+    if megabytes > max_mb:
+        failures.append(f"{name}: {megabytes:.2f} MB is over the {max_mb:g} MB limit")
+    if loaded:
+        failures.append(f"{name}: imported {', '.join(loaded)}")
+    return failures
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--package-time", type=float, default=50.0, help="The ms `import pymino` may take.")
+    parser.add_argument("--package-memory", type=float, default=1.0, help="The MB `import pymino` may allocate.")
+    parser.add_argument("--bot-time", type=float, default=1000.0, help="The ms `from pymino import Bot` may take.")
+    parser.add_argument("--bot-memory", type=float, default=32.0, help="The MB `from pymino import Bot` may allocate.")
+    args = parser.parse_args()
+
+    checks: Dict[str, Tuple[str, float, float, Tuple[str, ...]]] = {
+        "import pymino": ("import pymino", args.package_time, args.package_memory, ("requests", "aiohttp", "pip")),
+        "from pymino import Bot": ("from pymino import Bot", args.bot_time, args.bot_memory, ("aiohttp", "pip")),
+        }
+
+    failures: List[str] = []
+    for name, (statement, max_ms, max_mb, forbidden) in checks.items():
+        failures.extend(check(name, statement, max_ms, max_mb, forbidden, args.repeat))
+
+    if failures:
+        raise SystemExit("\n" + "\n".join(failures))
+    print("\nAll import limits met.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+A local stand-in for `service.aminoapps.com` that answers every request with a small JSON body.
+
+It speaks HTTP/1.1 and cleartext HTTP/2 with prior knowledge (h2c) on the same port, so the
+`RequestsTransport` and an `HTTP2Transport(tls=False)` can be compared against one server.
+HTTP/2 needs the `h2` package, which `pip install "httpx[http2]"` installs.
+
+    python benchmarks/stub_server.py --port 8080 --delay 0.005
+"""
+from time import sleep
+from json import dumps
+from argparse import ArgumentParser
+from threading import Lock, Thread
+from socket import IPPROTO_TCP, MSG_PEEK, MSG_WAITALL, TCP_NODELAY
+from socketserver import BaseRequestHandler, ThreadingTCPServer
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, Optional, Tuple
+
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+BODY = dumps({"api:statuscode": 0, "api:message": "OK", "api:duration": "0.001s"}).encode("utf-8")
+
+class _HTTP1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        self.server.count("http1_requests")
+        sleep(self.server.delay)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    do_GET = do_POST = do_DELETE = _respond
+
+    def log_message(self, *args) -> None:
+        return None
+
+
+class _ConnectionHandler(BaseRequestHandler):
+    def handle(self) -> None:
+        self.server.count("connections")
+        self.request.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+
+        if self.request.recv(len(PREFACE), MSG_PEEK | MSG_WAITALL) == PREFACE:
+            return self._handle_http2()
+
+        _HTTP1Handler(self.request, self.client_address, self.server)
+
+    def _handle_http2(self) -> None:
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+        from h2.events import ConnectionTerminated, DataReceived, StreamEnded
+
+        connection = H2Connection(config=H2Configuration(client_side=False))
+        connection.initiate_connection()
+        lock = Lock()
+
+        def flush() -> None:
+            data = connection.data_to_send()
+            if data:
+                self.request.sendall(data)
+
+        def respond(stream_id: int) -> None:
+            sleep(self.server.delay)
+            with lock:
+                connection.send_headers(stream_id, [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(BODY)))
+                    ])
+                connection.send_data(stream_id, BODY, end_stream=True)
+                flush()
+
+        with lock:
+            flush()
+
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                break
+
+            with lock:
+                events = connection.receive_data(data)
+                for event in events:
+                    if isinstance(event, DataReceived):
+                        connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, StreamEnded):
+                        self.server.count("http2_requests")
+                        Thread(target=respond, args=(event.stream_id,), daemon=True).start()
+                    elif isinstance(event, ConnectionTerminated):
+                        return None
+                flush()
+
+
+class StubServer(ThreadingTCPServer):
+    """
+    `StubServer` - Answers HTTP/1.1 and h2c requests after `delay` seconds, counting connections and requests.
+
+    `**Parameters**``
+    - `address` - The host and port to listen on, port `0` picks a free one. `Defaults` to `("127.0.0.1", 0)`.
+    - `delay` - The seconds the server takes to answer, like the API's processing time. `Defaults` to `0.005`.
+
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 256
+
+    def __init__(self, address: Tuple[str, int] = ("127.0.0.1", 0), delay: float = 0.005) -> None:
+        super().__init__(address, _ConnectionHandler)
+        self.delay:     float = delay
+        self.counters:  Dict[str, int] = {}
+        self._lock:     Lock = Lock()
+        self._thread:   Optional[Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The api url of the server, to use as `RequestHandler.api_url`."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def reset(self) -> Dict[str, int]:
+        """`reset` - Returns the counters and starts them over."""
+        with self._lock:
+            counters, self.counters = self.counters, {}
+        return counters
+
+    def start(self) -> "StubServer":
+        """`start` - Serves requests on a background thread."""
+        self._thread = Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """`stop` - Stops serving and closes the listening socket."""
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay", type=float, default=0.005)
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), delay=args.delay)
+    print(f"Serving HTTP/1.1 and h2c on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
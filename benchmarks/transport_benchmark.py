@@ -0,0 +1,96 @@
+"""
+Compares the latency and throughput of the request transports against a local stub server.
+
+Every caller is a thread sending signed requests through one shared `RequestHandler`, the way
+event handlers of a bot do. The rate limiter is disabled so only the transport is measured.
+
+    pip install "httpx[http2]"
+    PYTHONPATH=. python benchmarks/transport_benchmark.py --concurrency 1 10 100 --requests 2000
+
+`conns` is the number of connections opened during the measured requests, after a warm-up.
+"""
+from time import perf_counter
+from argparse import ArgumentParser
+from statistics import median, quantiles
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from pymino.ext.utilities.generate import Generator
+from pymino.ext.utilities.rate_limit import RateLimiter
+from pymino.ext.utilities.request_handler import RequestHandler
+from pymino.ext.utilities.transport import HTTP2Transport, RequestsTransport, Transport
+
+from stub_server import StubServer
+
+DEVICE_KEY = "E7309ECC0953C6FA60005B2765F99DBBC965C8E9"
+SIGNATURE_KEY = "DFA5ED192DDA6E88A12FE12130DC6206B1251E44"
+
+class _Bot:
+    debug = False
+
+    def _log(self, *args) -> None:
+        return None
+
+
+def run(server: StubServer, transport: Transport, callers: int, requests: int) -> Dict[str, float]:
+    generator = Generator("19", DEVICE_KEY, SIGNATURE_KEY)
+    handler = RequestHandler(_Bot(), generator, rate_limiter=RateLimiter(enabled=False), transport=transport)
+    handler.api_url = server.url
+    handler.device, handler.sid, handler.userId = generator.device_id(), "stub", "stub"
+
+    def send(_) -> float:
+        started = perf_counter()
+        handler.handler("POST", "/g/s/chat/thread/stub/message", data={"content": "benchmark", "type": 0})
+        return perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(send, range(callers)))
+        server.reset()
+
+        started = perf_counter()
+        latencies = list(pool.map(send, range(requests)))
+        elapsed = perf_counter() - started
+
+    counters = server.reset()
+    transport.close()
+
+    percentiles = quantiles(latencies, n=100)
+    return {
+        "p50": median(latencies) * 1000,
+        "p95": percentiles[94] * 1000,
+        "p99": percentiles[98] * 1000,
+        "throughput": requests / elapsed,
+        "connections": counters.get("connections", 0)
+        }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--delay", type=float, default=0.005)
+    parser.add_argument("--connections", type=int, default=2, help="The connections HTTP2Transport may open.")
+    args = parser.parse_args()
+
+    transports: Dict[str, Callable[[], Transport]] = {
+        "requests (HTTP/1.1)": RequestsTransport,
+        "httpx (HTTP/2, h2c)": lambda: HTTP2Transport(max_connections=args.connections, tls=False)
+        }
+
+    server = StubServer(delay=args.delay).start()
+    print(f"{args.requests} requests per run, {args.delay * 1000:.1f} ms server delay\n")
+    print(f"{'transport':<22}{'callers':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>10}{'conns':>7}")
+
+    for callers in args.concurrency:
+        for name, transport in transports.items():
+            result = run(server, transport(), callers, max(args.requests, callers))
+            print(
+                f"{name:<22}{callers:>8}{result['p50']:>9.2f}{result['p95']:>9.2f}"
+                f"{result['p99']:>9.2f}{result['throughput']:>10.0f}{result['connections']:>7}"
+                )
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,4 @@
 from typing import List
-from requests import get
-from colorama import Fore, Style
 
 __title__ = 'pymino'
 __author__ = 'cynical'
@@ -9,20 +7,27 @@ __copyright__ = 'Copyright 2023 Cynical'
 __version__ = '1.2.6.6'
 __description__ = 'A Python wrapper for the aminoapps.com API'
 
-from .bot import Bot
-from .client import Client
-
 __all__: List[str] = [
     'Bot',
     'Client',
+    'Fleet',
 ]
 
-print("Join the pymino discord server: https://discord.gg/RuRzyya55Z")
+_LAZY_IMPORTS = {
+    'Bot': '.bot',
+    'Client': '.client',
+    'Fleet': '.fleet',
+}
+
+def __getattr__(name: str):
+    """Imports `Bot`, `Client` and `Fleet` on first use, so `import pymino` stays cheap."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
 
-try:
-    latest_version = get("https://pypi.org/pypi/pymino/json").json()["info"]["version"]
-except Exception as e:
-    print(f"Failed to check the latest version: {e}")
-else:
-    if __version__ != latest_version:
-        print(f"{Fore.RED}WARNING:{Style.RESET_ALL} You are using an outdated version of pymino ({__version__}). The latest version is {latest_version}.")
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,18 +1,25 @@
 from os import path
 from threading import Thread
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from time import perf_counter, time
 from logging.handlers import RotatingFileHandler
 from logging import Logger, getLogger, Formatter, DEBUG
 
 from .ext.console import *
+from . import __version__
 from .ext.entities import *
 from .ext.account import Account
+from .ext.intents import Intents
+from .ext.outbox import MessagePipeline
 from .ext.socket import WSClient
 from .ext.community import Community
 from .ext.global_client import Global
+from .ext.async_community import AsyncCommunity
+from .ext.async_global_client import AsyncGlobal
+from .ext.utilities.cache import TieredCache
 from .ext.utilities.generate import Generator
-from .ext.utilities.request_handler import RequestHandler
+from .ext.utilities.device import DeviceIdPool
+from .ext.utilities.request_handler import RequestHandler, AsyncRequestHandler
 
 __all__ = (
     'Bot',
@@ -36,8 +43,8 @@ class Bot(WSClient, Global):
         Whether or not the CONSOLE is enabled.
     _cooldown_message : str
         The default cooldown message used when a command is on cooldown.
-    _intents : bool
-        Whether or not intents are enabled.
+    _intents : Union[bool, Intents]
+        Whether or not intents are enabled, or the event families the bot receives.
     _is_ready : bool
         Whether the bot is ready after successful login.
     _userId : str
@@ -48,8 +55,8 @@ class Bot(WSClient, Global):
         Whether the login credentials are cached.
     logger : Logger
         The logger object.
-    cache : Cache
-        An instance of the Cache class for caching data.
+    cache : TieredCache
+        An in-memory cache in front of the disk cache, split into namespaces.
     command_prefix : Optional[str]
         The prefix used for bot commands.
     community_id : Union[str, int]
@@ -58,16 +65,34 @@ class Bot(WSClient, Global):
         An instance of the Generator class for generating data.
     online_status : bool
         Whether the bot's online status is enabled.
+    dispatch_workers : int
+        The number of threads that handle websocket events.
+    dispatch_queue_size : int
+        The maximum number of websocket events waiting to be handled.
+    dispatch_policy : str
+        What to do when the event queue is full.
+    websocket_shards : int
+        The number of websocket connections, spread over the ws1-ws4 endpoints.
     device_id : Optional[str]
         The device ID used for logging in. If not provided, it will be generated using the Generator class.
+    device_pool : DeviceIdPool
+        Pre-generated device IDs and the device IDs pinned to each logged in account.
     _is_authenticated : bool
         Whether the bot is authenticated.
     request : RequestHandler
         An instance of the RequestHandler class for handling API requests.
+    async_request : AsyncRequestHandler
+        An instance of the AsyncRequestHandler class for handling API requests with asyncio.
     community : Community
         An instance of the Community class for community-related actions.
+    async_community : AsyncCommunity
+        An instance of the AsyncCommunity class for awaitable community-related actions.
+    async_global : AsyncGlobal
+        An instance of the AsyncGlobal class for awaitable global actions.
     account : Account
         An instance of the Account class for account-related actions.
+    outbox : MessagePipeline
+        The ordered, rate-limited per-chat queue outgoing chat messages are sent through.
     profile : UserProfile
         An instance of the UserProfile class representing the bot's user profile.
     """
@@ -88,10 +113,19 @@ class Bot(WSClient, Global):
         'debug_log',
         'generate',
         'online_status',
+        'dispatch_workers',
+        'dispatch_queue_size',
+        'dispatch_policy',
+        'websocket_shards',
         'device_id',
+        'device_pool',
+        'outbox',
         '_is_authenticated'
         'request',
+        'async_request',
         'community',
+        'async_community',
+        'async_global',
         'account',
         'profile',
     )
@@ -102,12 +136,16 @@ class Bot(WSClient, Global):
         console_enabled: bool = False,
         debug_log: bool = False,
         device_id: str = None,
-        intents: bool = False,
+        intents: Union[bool, Intents] = False,
         online_status: bool = False,
         proxy: str = None,
         hash_prefix: Union[str, int] = 19,
         device_key: str = None,
-        signature_key: str  = None
+        signature_key: str  = None,
+        dispatch_workers: int = 8,
+        dispatch_queue_size: int = 1000,
+        dispatch_policy: str = "block",
+        websocket_shards: int = 1
         ) -> None:
         """
         `Bot` - This is the main client.
@@ -118,12 +156,16 @@ class Bot(WSClient, Global):
         - `console_enabled` - Whether to enable the console. `Defaults` to `True`.
         - `debug_log` - Whether to enable logging to file. `Defaults` to `False`.
         - `device_id` - The device id to use for the bot. `Defaults` to `None`.
-        - `intents` - Avoids receiving events that you do not need. `Defaults` to `False`.
+        - `intents` - Avoids receiving events that you do not need, an `Intents` mask also limits the event families received. `Defaults` to `False`.
         - `online_status` - Whether to set the bot's online status to `online`. `Defaults` to `True`.
         - `proxy` - The proxy to use for the bot. `Defaults` to `None`.
         - `hash_prefix` - The hash prefix to use for the bot. `Defaults` to `19`.
         - `device_key` - The device key to use for the bot.
         - `signature_key` - The signature key to use for the bot.
+        - `dispatch_workers` - The number of threads that handle websocket events. `Defaults` to `8`.
+        - `dispatch_queue_size` - The maximum number of websocket events waiting to be handled. `Defaults` to `1000`.
+        - `dispatch_policy` - What to do when the event queue is full: `block`, `drop_oldest` or `drop_newest`. `Defaults` to `block`.
+        - `websocket_shards` - The number of websocket connections to receive events on, deduplicated into one stream. `Defaults` to `1`.
 
         ----------------------------
         When should I use `Bot` instead of `Client`?
@@ -320,12 +362,12 @@ class Bot(WSClient, Global):
         self._console_enabled:  bool = console_enabled
         self._cooldown_message: Optional[str] = None
         self._is_authenticated: bool = False
-        self._intents:          bool = intents
+        self._intents:          Union[bool, Intents] = intents
         self._is_ready:         bool = False
         self._userId:           str = None
         self._sid:              str = None
         self._cached:           bool = False
-        self.cache:             Cache = Cache("cache")
+        self.cache:             TieredCache = TieredCache("cache")
 
         self.command_prefix:    Optional[str] = command_prefix
         if self.command_prefix == "":
@@ -335,11 +377,18 @@ class Bot(WSClient, Global):
         self.community_id:      Union[str, int] = community_id
         self.generate:          Generator = Generator(hash_prefix, self.__device_key__, self.__signature_key__)
         self.online_status:     bool = online_status
-        self.device_id:         Optional[str] = device_id or self.generate.device_id()
+        self.dispatch_workers:  int = dispatch_workers
+        self.dispatch_queue_size: int = dispatch_queue_size
+        self.dispatch_policy:   str = dispatch_policy
+        self.websocket_shards:  int = websocket_shards
+        self.device_pool:       DeviceIdPool = DeviceIdPool(self.generate)
+        self.device_id:         Optional[str] = device_id or self.device_pool.get()
         self.request:           RequestHandler = RequestHandler(
                                 bot = self,
                                 proxy=proxy,
-                                generator=self.generate
+                                generator=self.generate,
+                                device_pool=self.device_pool,
+                                media_cache=self.cache.namespace("media")
                                 )
         self.community:         Community = Community(
                                 bot = self,
@@ -349,6 +398,18 @@ class Bot(WSClient, Global):
         self.account:           Account = Account(
                                 session=self.request
                                 )
+        self.async_request:     AsyncRequestHandler = AsyncRequestHandler(
+                                session=self.request
+                                )
+        self.async_community:   AsyncCommunity = AsyncCommunity(
+                                community=self.community,
+                                session=self.async_request
+                                )
+        self.async_global:      AsyncGlobal = AsyncGlobal(
+                                bot=self,
+                                session=self.async_request
+                                )
+        self.outbox:            MessagePipeline = MessagePipeline(bot=self)
 
         if self.community_id:   self.set_community_id(community_id)
 
@@ -448,12 +509,12 @@ class Bot(WSClient, Global):
         self._console_enabled = value
 
     @property
-    def intents(self) -> bool:
+    def intents(self) -> Union[bool, Intents]:
         """
         Whether or not intents are enabled.
 
-        :return: True if intents are enabled, False otherwise.
-        :rtype: bool
+        :return: True if intents are enabled, False otherwise, or the `Intents` the bot was limited to.
+        :rtype: Union[bool, Intents]
 
         This property returns whether or not intents are enabled. Intents allow the bot to use additional features such as
         `ctx.wait_for_message()`.
@@ -464,12 +525,12 @@ class Bot(WSClient, Global):
         return self._intents
 
     @intents.setter
-    def intents(self, value: bool) -> None:
+    def intents(self, value: Union[bool, Intents]) -> None:
         """
         Sets the intents state.
 
-        :param value: True to enable intents, False to disable them.
-        :type value: bool
+        :param value: True to enable intents, False to disable them, or an `Intents` mask to limit the event families received.
+        :type value: Union[bool, Intents]
         :return: None
 
         This setter sets the intents state. Intents allow the bot to use additional features such as `ctx.wait_for_message()`.
@@ -478,6 +539,7 @@ class Bot(WSClient, Global):
         intents state, use the `self.intents` property.
         """
         self._intents = value
+        self._active_intents = None
 
     @property
     def is_ready(self) -> bool:
@@ -625,6 +687,19 @@ class Bot(WSClient, Global):
         """
         self._cooldown_message = message
 
+    def set_cooldown_backend(self, backend: Any) -> None:
+        """
+        Shares the bot's command cooldowns through a backend.
+
+        :param backend: An object with an atomic `add(key, value, expire=None)` and `get(key, default=None)`, such as `diskcache.Cache`, or `None` to keep cooldowns in this process.
+        :type backend: Any
+        :return: None
+
+        This method lets several bot processes enforce the same command cooldowns. Running cooldowns are kept locally as well,
+        so the backend is only asked when a command is not on cooldown in this process.
+        """
+        self._commands.cooldowns.backend = backend
+
     @property
     def is_authenticated(self) -> bool:
         """
@@ -778,7 +853,7 @@ class Bot(WSClient, Global):
                 email=email,
                 password=password,
                 secret=secret,
-                device_id=device_id
+                device_id=device_id or self.device_pool.pin(email, self.device_id)
                 )
 
         for key, value in {"email": email, "password": password}.items():
@@ -823,6 +898,8 @@ class Bot(WSClient, Global):
         if not any([email and password, sid, secret]):
             raise MissingEmailPasswordOrSid
 
+        check_version(__version__)
+
         if sid:
             self.sid = sid
             self.request.sid = sid
@@ -879,7 +956,7 @@ class Bot(WSClient, Global):
         self._secret: str = response.get("secret")
         
         if hasattr(self.request, "email") and self._cached:
-            cache_login(email=self.request.email, device=self.device_id, sid=self.sid)
+            self.device_pool.bind(self.request.email, self.device_id, sid=self.sid)
 
         if not self.is_ready:
             self._is_ready = True
@@ -893,7 +970,7 @@ class Bot(WSClient, Global):
             print(f"\n{Fore.MAGENTA}[LOGGED IN] {Style.RESET_ALL}{self.profile.username} ({Fore.YELLOW}{self.profile.userId}{Style.RESET_ALL})\n")
 
         Thread(target=self.__run_console__).start()
-        self.cache.set(key=f"{self.userId}-account", value=response, expire=21600)
+        self.cache.namespace("accounts").set(key=f"{self.userId}-account", value=response, expire=21600)
 
         self.__set_keys__()
         return response
@@ -950,7 +1027,7 @@ class Bot(WSClient, Global):
 
         The method returns a dictionary containing the user's account information.
         """
-        if cached_info := self.cache.get(f"{self.userId}-account"):
+        if cached_info := self.cache.namespace("accounts").get(f"{self.userId}-account"):
             return cached_info
 
         profile = self.make_request(
@@ -964,7 +1041,7 @@ class Bot(WSClient, Global):
             )
 
         account.update(profile)
-        self.cache.set(key=f"{self.userId}-account", value=account, expire=21600)
+        self.cache.namespace("accounts").set(key=f"{self.userId}-account", value=account, expire=21600)
 
         return account
 
@@ -992,12 +1069,13 @@ class Bot(WSClient, Global):
         retrieving posts. It is recommended to use this function if you do not already know the community ID.
         """
         KEY = str((community_link, "comId"))
-        if not self.cache.get(KEY):
-            self.cache.set(KEY, CCommunity(self.request.handler(
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, CCommunity(self.request.handler(
                 method="GET", url=f"/g/s/link-resolution?q={community_link}")
                 ).comId)
             
-        community_id = self.cache.get(KEY)
+        community_id = cache.get(KEY)
 
         if set_community_id:
             self.set_community_id(community_id)
@@ -5,10 +5,13 @@ from logging import Logger, getLogger, Formatter, DEBUG
 from typing import Any, Callable, Optional, TypeVar, Union
 
 
+from . import __version__
 from .ext.entities import *
 from .ext.global_client import Global
+from .ext.utilities.cache import TieredCache
 from .ext.utilities.generate import Generator
-from .ext import RequestHandler, Account, Community
+from .ext.utilities.device import DeviceIdPool
+from .ext import RequestHandler, AsyncRequestHandler, Account, Community, AsyncCommunity, AsyncGlobal
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -38,8 +41,8 @@ class Client(Global):
         Whether the login credentials are cached.
     _is_authenticated : bool
         Whether or not the client is authenticated.
-    cache : Cache
-        An instance of the Cache class for caching data.
+    cache : TieredCache
+        An in-memory cache in front of the disk cache, split into namespaces.
     logger : Logger
         An instance of the Logger class for logging.
     is_logging : bool
@@ -50,12 +53,20 @@ class Client(Global):
         An instance of the Generator class for generating data.
     device_id : Optional[str]
         The device ID used for logging in. If not provided, it will be generated using the Generator class.
+    device_pool : DeviceIdPool
+        Pre-generated device IDs and the device IDs pinned to each logged in account.
     request : RequestHandler
         An instance of the RequestHandler class for handling API requests.
+    async_request : AsyncRequestHandler
+        An instance of the AsyncRequestHandler class for handling API requests with asyncio.
     account : Account
         An instance of the Account class for account-related actions.
     community : Community
         An instance of the Community class for community-related actions.
+    async_community : AsyncCommunity
+        An instance of the AsyncCommunity class for awaitable community-related actions.
+    async_global : AsyncGlobal
+        An instance of the AsyncGlobal class for awaitable global actions.
     profile : UserProfile
         An instance of the UserProfile class representing the bot's user profile.
     """
@@ -72,9 +83,13 @@ class Client(Global):
         'community_id',
         'generate',
         'device_id',
+        'device_pool',
         'request',
+        'async_request',
         'account',
         'community',
+        'async_community',
+        'async_global',
         'profile'
     )
     def __init__(
@@ -200,7 +215,7 @@ class Client(Global):
         self._sid:              str = None
         self._secret:           str = None
         self._cached:           bool = False
-        self.cache:             Cache = Cache("cache")
+        self.cache:             TieredCache = TieredCache("cache")
         self.logger:            Logger = self._create_logger() if kwargs.get("debug_log") else None
         self.is_logging:        bool = bool(self.logger)
         self.community_id:      Optional[str] = community_id or kwargs.get("comId")
@@ -209,11 +224,14 @@ class Client(Global):
                                 device_key=self.__device_key__,
                                 signature_key=self.__signature_key__
                                 )
-        self.device_id:         Optional[str] = kwargs.get("device_id") or self.generate.device_id()
+        self.device_pool:       DeviceIdPool = DeviceIdPool(self.generate)
+        self.device_id:         Optional[str] = kwargs.get("device_id") or self.device_pool.get()
         self.request:           RequestHandler = RequestHandler(
                                 self,
                                 proxy=kwargs.get("proxy"),
-                                generator=self.generate
+                                generator=self.generate,
+                                device_pool=self.device_pool,
+                                media_cache=self.cache.namespace("media")
                                 )
         self.account:           Account = Account(
                                 session=self.request
@@ -223,6 +241,17 @@ class Client(Global):
                                 session=self.request,
                                 community_id=self.community_id
                                 )
+        self.async_request:     AsyncRequestHandler = AsyncRequestHandler(
+                                session=self.request
+                                )
+        self.async_community:   AsyncCommunity = AsyncCommunity(
+                                community=self.community,
+                                session=self.async_request
+                                )
+        self.async_global:      AsyncGlobal = AsyncGlobal(
+                                bot=self,
+                                session=self.async_request
+                                )
         
         super().__init__()
 
@@ -509,12 +538,13 @@ class Client(Global):
         retrieving posts. It is recommended to use this function if you do not already know the community ID.
         """
         KEY = str((community_link, "comId"))
-        if not self.cache.get(KEY):
-            self.cache.set(KEY, CCommunity(self.request.handler(
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, CCommunity(self.request.handler(
                 method="GET", url=f"/g/s/link-resolution?q={community_link}")
                 ).comId)
             
-        community_id = self.cache.get(KEY)
+        community_id = cache.get(KEY)
 
         if set_community_id:
             self.set_community_id(community_id)
@@ -648,7 +678,7 @@ class Client(Global):
                 email=email,
                 password=password,
                 secret=secret,
-                device_id=device_id
+                device_id=device_id or self.device_pool.pin(email, self.device_id)
                 )
 
         for key, value in {"email": email, "password": password}.items():
@@ -745,6 +775,7 @@ class Client(Global):
         >>> client = Client()
         >>> client.run(email="example@example.com", password="password")
         """
+        check_version(__version__)
         return self.login(email=email, password=password, sid=sid, device_id=device_id, use_cache=use_cache)
 
     def _run(self, response: dict) -> dict:
@@ -784,7 +815,7 @@ class Client(Global):
         self._secret: str = response.get("secret")
         
         if hasattr(self.request, "email") and self._cached:
-            cache_login(email=self.request.email, device=self.device_id, sid=self.sid)
+            self.device_pool.bind(self.request.email, self.device_id, sid=self.sid)
 
         if not self.is_authenticated:
             self._is_authenticated = True
@@ -795,7 +826,7 @@ class Client(Global):
         if self.debug:
             print(f"{Fore.MAGENTA}Logged in as {self.profile.username} ({self.profile.userId}){Style.RESET_ALL}")
 
-        self.cache.set(key=f"{self.userId}-account", value=response, expire=21600)
+        self.cache.namespace("accounts").set(key=f"{self.userId}-account", value=response, expire=21600)
 
         self.__set_keys__()
         return response
@@ -955,7 +986,7 @@ class Client(Global):
 
         The method returns a dictionary containing the user's account information.
         """
-        if cached_info := self.cache.get(f"{self.userId}-account"):
+        if cached_info := self.cache.namespace("accounts").get(f"{self.userId}-account"):
             return cached_info
 
         profile = self.make_request(
@@ -969,7 +1000,7 @@ class Client(Global):
             )
 
         account.update(profile)
-        self.cache.set(key=f"{self.userId}-account", value=account, expire=21600)
+        self.cache.namespace("accounts").set(key=f"{self.userId}-account", value=account, expire=21600)
 
         return account
 
@@ -2,7 +2,13 @@ from .entities.chat_threads import *
 from .entities.general import *
 from .entities.messages import *
 from .entities.wsevents import *
+from .utilities.bulk import *
+from .utilities.cache import *
 from .utilities.generate import *
+from .utilities.pagination import *
+from .utilities.rate_limit import *
+from .utilities.device import *
+from .utilities.retry import *
 from .entities.userprofile import *
 
 from .console import *
@@ -11,6 +17,14 @@ from .account import *
 from .context import *
 from .global_client import *
 from .community import *
+from .async_community import *
+from .async_global_client import *
 from .dispatcher import *
+from .executor import *
+from .waiters import *
+from .intents import *
+from .outbox import *
+from .keepalive import *
+from .supervisor import *
 from .handle_queue import *
 from .utilities.request_handler import *
\ No newline at end of file
@@ -44,7 +44,7 @@ class Account:
             url="/g/s/auth/register",
             data={
                 "secret": f"0 {password}",
-                "deviceID": self.session.generate.device_id(),
+                "deviceID": self.session.device_pool.get(),
                 "email": email,
                 "clientType": 100,
                 "nickname": username,
@@ -80,7 +80,7 @@ class Account:
             url="/g/s/account/delete-request",
             data={
                 "secret": f"0 {password}",
-                "deviceID": self.session.generate.device_id(),
+                "deviceID": self.session.device_pool.get(),
                 "email": email,
                 "timestamp": int(time() * 1000)
             }))
@@ -111,7 +111,7 @@ class Account:
             url="/g/s/account/delete-request/cancel",
             data={
                 "secret": f"0 {password}",
-                "deviceID": self.session.generate.device_id(),
+                "deviceID": self.session.device_pool.get(),
                 "email": email,
                 "timestamp": int(time() * 1000)
             }))
@@ -181,8 +181,7 @@ class Account:
         print(response)
         ```
         """
-        return ApiResponse(self.session.handler(method="POST", url="/g/s/media/upload",
-            data=open(image, "rb").read(), content_type="image/jpg")).mediaValue
+        return ApiResponse(self.session.upload_media(image, content_type="image/jpg")).mediaValue
 
     def fetch_profile(self, userId: str) -> UserProfile:
         """
@@ -267,7 +266,7 @@ class Account:
             data={
                 "identity": email,
                 "type": 1,
-                "deviceID": self.session.generate.device_id(),
+                "deviceID": self.session.device_pool.get(),
                 "level": 2 if resetPassword else None,
                 "purpose": "reset-password" if resetPassword else None,
                 "timestamp": int(time() * 1000)
@@ -300,7 +299,7 @@ class Account:
                 "type": 1,
                 "identity": email,
                 "data": {"code":code},
-                "deviceID": self.session.generate.device_id(),
+                "deviceID": self.session.device_pool.get(),
                 "timestamp": int(time() * 1000)
             }))
     
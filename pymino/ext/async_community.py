@@ -0,0 +1,979 @@
+from time import time, timezone
+from typing import AsyncIterator, BinaryIO, Callable, List, Optional, Union, TypeVar, Any
+
+from .entities import *
+from .community import Community
+from .utilities.bulk import BulkResult, afetch_bulk
+from .utilities.pagination import apaginate
+from .utilities.request_handler import AsyncRequestHandler
+
+__all__ = (
+    "AsyncCommunity",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class AsyncCommunity:
+    """
+    The `AsyncCommunity` class provides awaitable versions of the most used `Community` methods.
+
+    Requests are sent through an `AsyncRequestHandler`, so a single event loop can drive many
+    concurrent calls over one pooled connection set instead of one thread per call. The community ID
+    and user ID are read from the wrapped `Community`, so `set_community_id` applies to both.
+
+    **Parameters:**
+
+    - `community` (`Community`): The synchronous community instance to share state with.
+    - `session` (`AsyncRequestHandler`): The async request handler used to make requests.
+
+    **Example usage:**
+
+    >>> bot = Bot()
+    >>> async def main():
+    ...     users = await bot.async_community.fetch_users(size=100)
+    ...     chats = await asyncio.gather(*(bot.async_community.fetch_chat(chatId) for chatId in chatIds))
+    """
+
+    def __init__(self, community: Community, session: AsyncRequestHandler) -> None:
+        self._community = community
+        self.session = session
+
+
+    @property
+    def community_id(self) -> Union[str, int]:
+        """The community ID set on the wrapped `Community`."""
+        return self._community.community_id
+
+    @property
+    def userId(self) -> Optional[str]:
+        """The user ID set on the wrapped `Community`."""
+        return self._community.userId
+
+    @property
+    def cache(self):
+        """
+        The cache object used by the client.
+        """
+        return self._community.cache
+
+    def community(func: F) -> F:
+        """
+        A decorator that ensures the user is logged in and a community ID is present before awaiting the decorated coroutine.
+
+        :param func: The coroutine function to be decorated.
+        :type func: Callable
+        :raises NotLoggedIn: If the user is not logged in.
+        :raises MissingCommunityId: If the community ID is missing.
+        :return: The result of awaiting the decorated coroutine.
+        :rtype: Any
+        """
+        async def community_func(*args, **kwargs) -> Any:
+
+            if not args[0].userId:
+                raise NotLoggedIn()
+            if not any([args[0].community_id, kwargs.get("comId")]):
+                raise MissingCommunityId()
+            return await func(*args, **kwargs)
+
+        community_func.__annotations__ = func.__annotations__
+        community_func.__doc__ = func.__doc__
+        return community_func
+
+
+    @community
+    async def fetch_object(self, object_id: str, object_type: ObjectTypes = ObjectTypes.USER, comId: Union[str, int] = None) -> LinkInfo:
+        """
+        Awaitable version of `Community.fetch_object`. The link information is cached like the synchronous method.
+
+        :param object_id: The ID of the object whose link information is to be fetched.
+        :type object_id: str
+        :param object_type: The type of the object, defaults to ObjectTypes.USER.
+        :type object_type: ObjectTypes, optional
+        :param comId: The ID of the community, defaults to None.
+        :type comId: Union[str, int], optional
+        :return: A LinkInfo object containing the link information of the object.
+        :rtype: LinkInfo
+        """
+        KEY = str((object_id, self.community_id if comId is None else comId))
+        cache = self.cache.namespace("links")
+
+        if not cache.get(KEY):
+            cache.set(KEY, await self.session.handler(
+                method = "POST",
+                url = f"/g/s-x{self.community_id if comId is None else comId}/link-resolution",
+                data = {
+                    "objectId": object_id,
+                    "targetCode": 1,
+                    "objectType": object_type.value if isinstance(object_type, ObjectTypes) else object_type,
+                    "timestamp": int(time() * 1000)
+                    }
+                ))
+        return LinkInfo(cache.get(KEY))
+
+
+    async def fetch_object_id(self, link: str) -> str:
+        """
+        Awaitable version of `Community.fetch_object_id`.
+
+        :param link: The link to the object.
+        :type link: str
+        :return: The ID of the object.
+        :rtype: str
+        """
+        KEY = str((link, "OBJECT_ID"))
+        cache = self.cache.namespace("links")
+
+        if not cache.get(KEY):
+            cache.set(KEY, await self.session.handler(
+                method = "GET",
+                url = f"/g/s/link-resolution?q={link}"
+                ))
+        return LinkInfo(cache.get(KEY)).objectId
+
+
+    async def fetch_community(self, comId: Union[str, int] = None) -> CCommunity:
+        """
+        Awaitable version of `Community.fetch_community`.
+
+        :param comId: The ID of the community to fetch. If None, the current community ID is used.
+        :type comId: Union[str, int], optional
+        :return: A CCommunity object containing information about the community.
+        :rtype: CCommunity
+        """
+        KEY = str((comId, "COMMUNITY_INFO"))
+        cache = self.cache.namespace("communities")
+
+        if not cache.get(KEY):
+            cache.set(KEY, await self.session.handler(
+                method = "GET",
+                url = f"/g/s-x{self.community_id if comId is None else comId}/community/info"
+                ))
+        return CCommunity(cache.get(KEY))
+
+
+    @community
+    async def fetch_user(self, userId: str, comId: Union[str, int] = None) -> UserProfile:
+        """
+        Awaitable version of `Community.fetch_user`.
+
+        :param userId: The ID of the user to fetch the profile for.
+        :type userId: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `UserProfile` object containing information about the user's profile.
+        :rtype: UserProfile
+        """
+        return UserProfile(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/user-profile/{userId}"
+            ))
+
+
+    @community
+    async def fetch_users_bulk(
+        self,
+        userIds: List[str],
+        comId: Union[str, int] = None,
+        concurrency: int = 8,
+        rate_limit: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[BulkResult]:
+        """
+        Awaitable version of `Community.fetch_users_bulk`. Requests share the async session.
+
+        :param userIds: The IDs of the user profiles to fetch.
+        :type userIds: List[str]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :param concurrency: The maximum number of requests in flight. Defaults to `8`.
+        :type concurrency: int
+        :param rate_limit: The maximum number of requests started per second. Defaults to `None`.
+        :type rate_limit: Optional[float]
+        :param use_cache: Whether to reuse and store resolved user profiles. Defaults to `True`.
+        :type use_cache: bool
+        :return: A list of `BulkResult` objects whose `value` is a `UserProfile`, in input order.
+        :rtype: List[BulkResult]
+
+        **Example usage:**
+
+        >>> results = await client.async_community.fetch_users_bulk(userIds=["0000-0000-0000-0000", "0000-0000-0000-0001"])
+        >>> for result in results:
+        ...     print(result.id, result.value.nickname if result.ok else result.error)
+        """
+        comId = self.community_id if comId is None else comId
+
+        return await afetch_bulk(
+            lambda userId: self.fetch_user(userId=userId, comId=comId),
+            userIds,
+            concurrency = concurrency,
+            rate_limit = rate_limit,
+            cache = self.cache.namespace("users") if use_cache else None,
+            cache_key = lambda userId: (comId, userId),
+            load = UserProfile
+            )
+
+
+    @community
+    async def fetch_users(self, userType: UserTypes = UserTypes.RECENT, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
+        """
+        Awaitable version of `Community.fetch_users`.
+
+        :param userType: The type of users to fetch. Defaults to `UserTypes.RECENT`.
+        :type userType: UserTypes
+        :param start: The starting point to fetch users from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of users to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `UserProfileList` object containing the users.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/user-profile?type={userType.value if isinstance(userType, UserTypes) else userType}&start={start}&size={size}"
+            ))
+
+
+    def iter_users(
+        self,
+        userType: UserTypes = UserTypes.RECENT,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the users in the current or specified community based on the specified user type, page by page.
+
+        :param userType: The type of users to iterate over. Defaults to `UserTypes.RECENT`.
+        :type userType: UserTypes
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for user in client.async_community.iter_users(userType=UserTypes.CURATORS):
+        ...     print(user.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_users(userType=userType, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_online_users(self, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
+        """
+        Awaitable version of `Community.fetch_online_users`.
+
+        :param start: The starting point to fetch users from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of users to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `UserProfileList` object containing the online users.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/live-layer?topic=ndtopic:x{self.community_id if comId is None else comId}:online-members&start={start}&size={size}"
+            ))
+
+
+    def iter_online_users(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the online users in the current or specified community, page by page.
+
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for user in client.async_community.iter_online_users(limit=200):
+        ...     print(user.userId)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_online_users(start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_followers(self, userId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
+        """
+        Awaitable version of `Community.fetch_followers`.
+
+        :param userId: The ID of the user to fetch the followers for.
+        :type userId: str
+        :param start: The starting point to fetch users from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of users to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `UserProfileList` object containing the followers.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/user-profile/{userId}/member?start={start}&size={size}"
+            ))
+
+
+    def iter_followers(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the followers of the specified user, page by page.
+
+        :param userId: The ID of the user whose followers to iterate over.
+        :type userId: str
+        :param size: The amount of followers to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of followers to yield. Defaults to `None`, which yields every follower.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for follower in client.async_community.iter_followers(userId="0000-0000-0000-0000"):
+        ...     print(follower.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_followers(userId=userId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_following(self, userId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
+        """
+        Awaitable version of `Community.fetch_following`.
+
+        :param userId: The ID of the user to fetch the followed users for.
+        :type userId: str
+        :param start: The starting point to fetch users from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of users to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `UserProfileList` object containing the followed users.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/user-profile/{userId}/joined?start={start}&size={size}"
+            ))
+
+
+    def iter_following(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the users the specified user is following, page by page.
+
+        :param userId: The ID of the user whose followings to iterate over.
+        :type userId: str
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for user in client.async_community.iter_following(userId="0000-0000-0000-0000"):
+        ...     print(user.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_following(userId=userId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_chat(self, chatId: str, comId: Union[str, int] = None) -> ChatThread:
+        """
+        Awaitable version of `Community.fetch_chat`.
+
+        :param chatId: The ID of the chat thread to fetch.
+        :type chatId: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `ChatThread` object containing information about the chat thread.
+        :rtype: ChatThread
+        """
+        return ChatThread(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}"
+            ))
+
+
+    @community
+    async def fetch_chats_bulk(
+        self,
+        chatIds: List[str],
+        comId: Union[str, int] = None,
+        concurrency: int = 8,
+        rate_limit: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[BulkResult]:
+        """
+        Awaitable version of `Community.fetch_chats_bulk`. Requests share the async session.
+
+        :param chatIds: The IDs of the chat threads to fetch.
+        :type chatIds: List[str]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :param concurrency: The maximum number of requests in flight. Defaults to `8`.
+        :type concurrency: int
+        :param rate_limit: The maximum number of requests started per second. Defaults to `None`.
+        :type rate_limit: Optional[float]
+        :param use_cache: Whether to reuse and store resolved chat threads. Defaults to `True`.
+        :type use_cache: bool
+        :return: A list of `BulkResult` objects whose `value` is a `ChatThread`, in input order.
+        :rtype: List[BulkResult]
+
+        **Example usage:**
+
+        >>> results = await client.async_community.fetch_chats_bulk(chatIds=["0000-0000-0000-0000", "0000-0000-0000-0001"])
+        >>> for result in results:
+        ...     print(result.id, result.value.title if result.ok else result.error)
+        """
+        comId = self.community_id if comId is None else comId
+
+        return await afetch_bulk(
+            lambda chatId: self.fetch_chat(chatId=chatId, comId=comId),
+            chatIds,
+            concurrency = concurrency,
+            rate_limit = rate_limit,
+            cache = self.cache.namespace("chats") if use_cache else None,
+            cache_key = lambda chatId: (comId, chatId),
+            load = ChatThread
+            )
+
+
+    @community
+    async def fetch_chats(self, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> ChatThreadList:
+        """
+        Awaitable version of `Community.fetch_chats`.
+
+        :param start: The starting point to fetch chat threads from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of chat threads to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `ChatThreadList` object containing information about the chat threads.
+        :rtype: ChatThreadList
+        """
+        return ChatThreadList(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread?type=joined-me&start={start}&size={size}"
+            ))
+
+
+    def iter_chats(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[ChatThread]:
+        """
+        Iterates over the chats the user has joined in the current or specified community, page by page.
+
+        :param size: The amount of chats to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of chats to yield. Defaults to `None`, which yields every chat.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `ChatThread` objects.
+        :rtype: AsyncIterator[ChatThread]
+
+        **Example usage:**
+
+        >>> async for chat in client.async_community.iter_chats():
+        ...     print(chat.title)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_chats(start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_chat_members(self, chatId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> CChatMembers:
+        """
+        Awaitable version of `Community.fetch_chat_members`.
+
+        :param chatId: The ID of the chat thread to fetch the members from.
+        :type chatId: str
+        :param start: The starting point to fetch members from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of members to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `CChatMembers` object containing the chat members.
+        :rtype: CChatMembers
+        """
+        return CChatMembers(await self.session.handler(
+            method = "GET",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2"
+            ))
+
+
+    def iter_chat_members(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the members of a chat thread, page by page.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param size: The amount of members to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of members to yield. Defaults to `None`, which yields every member.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for member in client.async_community.iter_chat_members(chatId="0000-00000-000000-0000"):
+        ...     print(member.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_chat_members(chatId=chatId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_messages(self, chatId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> CMessages:
+        """
+        Awaitable version of `Community.fetch_messages`.
+
+        :param chatId: The ID of the chat thread to fetch the messages from.
+        :type chatId: str
+        :param start: The starting point to fetch messages from. Defaults to `0`.
+        :type start: int
+        :param size: The amount of messages to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `CMessages` object containing the chat thread's messages.
+        :rtype: CMessages
+        """
+        return CMessages(await self.session.handler(
+            method="GET",
+            url=f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message?start={start}&size={size}&type=default"
+            ))
+
+
+    def iter_messages(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[CMessage]:
+        """
+        Iterates over the messages of a chat thread, newest first, page by page.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param size: The amount of messages to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of messages to yield. Defaults to `None`, which yields every message.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `CMessage` objects.
+        :rtype: AsyncIterator[CMessage]
+
+        **Example usage:**
+
+        >>> async for message in client.async_community.iter_messages(chatId="0000-00000-000000-0000", limit=1000):
+        ...     print(message.content)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_messages(chatId=chatId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def fetch_message(self, chatId: str, messageId: str, comId: Union[str, int] = None) -> Message:
+        """
+        Awaitable version of `Community.fetch_message`.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param messageId: The ID of the message to fetch.
+        :type messageId: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `Message` object representing the fetched message.
+        :rtype: Message
+        """
+        return Message(await self.session.handler(
+            method = "GET",
+            url = f"/x{comId or self.community_id}/s/chat/thread/{chatId}/message/{messageId}"
+            ))
+
+
+    @community
+    async def fetch_comments(
+        self,
+        userId: Optional[str] = None,
+        blogId: Optional[str] = None,
+        wikiId: Optional[str] = None,
+        start: int = 0,
+        size: int = 25,
+        comId: Union[str, int] = None) -> CommentList:
+        """
+        Awaitable version of `Community.fetch_comments`.
+
+        :param userId: The ID of the user whose comments to fetch. Defaults to `None`.
+        :type userId: Optional[str]
+        :param blogId: The ID of the blog whose comments to fetch. Defaults to `None`.
+        :type blogId: Optional[str]
+        :param wikiId: The ID of the wiki whose comments to fetch. Defaults to `None`.
+        :type wikiId: Optional[str]
+        :param start: The starting index of the comments to fetch. Defaults to `0`.
+        :type start: int
+        :param size: The number of comments to fetch. Defaults to `25`.
+        :type size: int
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `CommentList` object containing the comments.
+        :rtype: CommentList
+        :raises NoDataProvided: If none of `userId`, `blogId`, or `wikiId` is provided.
+        """
+        for value, path in (
+            (userId, "user-profile/{}"),
+            (blogId, "blog/{}"),
+            (wikiId, "item/{}")
+        ):
+            if value:
+                return CommentList(await self.session.handler(
+                    method="GET",
+                    url=f"/x{self.community_id if comId is None else comId}/s/{path.format(value)}/comment?sort=newest&start={start}&size={size}"
+                    ))
+
+        raise NoDataProvided
+
+
+    def iter_comments(
+        self,
+        userId: Optional[str] = None,
+        blogId: Optional[str] = None,
+        wikiId: Optional[str] = None,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> AsyncIterator[Comment]:
+        """
+        Iterates over the comments of the specified user, blog, or wiki, page by page.
+
+        :param userId: The ID of the user whose comments to iterate over. Defaults to `None`.
+        :type userId: Optional[str]
+        :param blogId: The ID of the blog whose comments to iterate over. Defaults to `None`.
+        :type blogId: Optional[str]
+        :param wikiId: The ID of the wiki whose comments to iterate over. Defaults to `None`.
+        :type wikiId: Optional[str]
+        :param size: The amount of comments to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of comments to yield. Defaults to `None`, which yields every comment.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An async iterator of `Comment` objects.
+        :rtype: AsyncIterator[Comment]
+
+        **Example usage:**
+
+        >>> async for comment in client.async_community.iter_comments(blogId="0000-0000-0000-0000"):
+        ...     print(comment.content)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_comments(userId=userId, blogId=blogId, wikiId=wikiId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @community
+    async def send_message(self, chatId: str, content: str, comId: Union[str, int] = None) -> CMessage:
+        """
+        Awaitable version of `Community.send_message`.
+
+        :param chatId: The ID of the chat to send the message to.
+        :type chatId: str
+        :param content: The content of the message.
+        :type content: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `CMessage` object containing the sent message.
+        :rtype: CMessage
+        """
+        return CMessage(await self.session.handler(
+            method = "POST", url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message",
+            data = PrepareMessage(content=content).json()
+            ))
+
+
+    @community
+    async def reply_message(self, chatId: str, messageId: str, content: str, comId: Union[str, int] = None) -> CMessage:
+        """
+        Awaitable version of `Community.reply_message`.
+
+        :param chatId: The ID of the chat to send the reply to.
+        :type chatId: str
+        :param messageId: The ID of the message to reply to.
+        :type messageId: str
+        :param content: The content of the reply.
+        :type content: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: A `CMessage` object containing the sent reply.
+        :rtype: CMessage
+        """
+        return CMessage(await self.session.handler(
+            method = "POST", url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message",
+            data = PrepareMessage(content=content, replyMessageId=messageId).json()
+            ))
+
+
+    @community
+    async def delete_message(self, chatId: str, messageId: str, asStaff: bool = False, reason: str = None, comId: Union[str, int] = None) -> ApiResponse:
+        """
+        Awaitable version of `Community.delete_message`.
+
+        :param chatId: The ID of the chat that contains the message.
+        :type chatId: str
+        :param messageId: The ID of the message to delete.
+        :type messageId: str
+        :param asStaff: If `True`, the message is deleted as a staff member. Defaults to `False`.
+        :type asStaff: bool
+        :param reason: The reason for deleting the message, if being deleted as a staff member. Defaults to `None`.
+        :type reason: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An `ApiResponse` object containing information about the request status.
+        :rtype: ApiResponse
+        """
+        if asStaff:
+            request_method = "POST"
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message/{messageId}/admin"
+            data = {
+                "adminOpName": 102,
+                "adminOpNote": {"content": reason},
+                "timestamp": int(time() * 1000)
+            } if reason is not None else {
+                "adminOpName": 102,
+                "timestamp": int(time() * 1000)
+            }
+        else:
+            request_method = "DELETE"
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message/{messageId}"
+            data = None
+
+        return ApiResponse(await self.session.handler(method=request_method, url=url, data=data))
+
+
+    @community
+    async def join_chat(self, chatId: str, comId: Union[str, int] = None) -> ApiResponse:
+        """
+        Awaitable version of `Community.join_chat`.
+
+        :param chatId: The ID of the chat to join.
+        :type chatId: str
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An `ApiResponse` object containing information about the request status.
+        :rtype: ApiResponse
+        """
+        return ApiResponse(await self.session.handler(
+            method = "POST",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/member/{self.userId}"
+            ))
+
+
+    @community
+    async def leave_chat(self, chatId: Union[str, List[str]], comId: Union[str, int] = None) -> ApiResponse:
+        """
+        Awaitable version of `Community.leave_chat`.
+
+        :param chatId: A list of chat thread IDs to leave or a single chat thread ID to leave.
+        :type chatId: Union[str, List[str]]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An `ApiResponse` object containing information about the request status.
+        :rtype: ApiResponse
+        """
+        return ApiResponse(await self.session.handler(
+            method = "DELETE",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/leave?threadIds={','.join(chatId) if isinstance(chatId, list) else chatId}"
+            ))
+
+
+    @community
+    async def kick(self, userId: str, chatId: str, allowRejoin: bool = True, comId: Union[str, int] = None) -> ApiResponse:
+        """
+        Awaitable version of `Community.kick`.
+
+        :param userId: The ID of the user to kick from the chat.
+        :type userId: str
+        :param chatId: The ID of the chat to kick the user from.
+        :type chatId: str
+        :param allowRejoin: Whether the user is allowed to rejoin the chat. Defaults to `True`.
+        :type allowRejoin: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An `ApiResponse` object containing information about the request status.
+        :rtype: ApiResponse
+        """
+        return ApiResponse(await self.session.handler(
+            method = "DELETE",
+            url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/member/{userId}?allowRejoin={1 if allowRejoin else 0}"
+            ))
+
+
+    @community
+    async def send_active(
+        self,
+        tz: int = -timezone // 1000,
+        start: int = None,
+        end: int = None,
+        timers: list = None,
+        comId: Union[str, int] = None
+        ) -> ApiResponse:
+        """
+        Awaitable version of `Community.send_active`.
+
+        :param tz: The timezone offset in seconds from UTC. Defaults to the local timezone.
+        :type tz: int
+        :param start: The start time of a user activity session. Required if `timers` is not provided.
+        :type start: int
+        :param end: The end time of a user activity session. Required if `timers` is not provided.
+        :type end: int
+        :param timers: A list of user activity sessions with `start` and `end` keys.
+        :type timers: list
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :raises MissingTimers: If `start` and `end` are not provided and `timers` is not provided or empty.
+        :return: An `ApiResponse` object containing information about the request status.
+        :rtype: ApiResponse
+        """
+        if not any([start and end, timers]): raise MissingTimers
+
+        data={
+            "optInAdsFlags": 2147483647,
+            "timezone": tz,
+            "timestamp": int(time() * 1000),
+            "userActiveTimeChunkList": timers if timers is not None else [{"start": start, "end": end}]
+        }
+
+        return ApiResponse(await self.session.handler(
+            method = "POST",
+            url = f"/x{self.community_id if comId is None else comId}/s/community/stats/user-active-time",
+            data=data
+            ))
+
+
+    async def upload_media(self, media: Union[str, bytes, BinaryIO], content_type: Optional[str] = None) -> str:
+        """
+        Awaitable version of `Community.upload_media`.
+
+        :param media: A file path, an `http(s)` url, the raw media bytes or an open binary file.
+        :type media: Union[str, bytes, BinaryIO]
+        :param content_type: The content type of the media. Defaults to the sniffed type, or `image/jpg`.
+        :type content_type: Optional[str]
+        :return: The media value of the uploaded file.
+        :rtype: str
+        """
+        return ApiResponse(await self.session.upload_media(
+            media = media,
+            content_type = content_type
+            )).mediaValue
@@ -0,0 +1,480 @@
+from typing import Any, AsyncIterator, Callable, List, Optional, TypeVar, Union
+
+from .entities import *
+from .utilities.pagination import apaginate
+from .utilities.request_handler import AsyncRequestHandler
+
+__all__ = (
+    "AsyncGlobal",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+class AsyncGlobal:
+    """
+    The `AsyncGlobal` class provides awaitable versions of the most used `Global` methods.
+
+    Authentication state is read from the bot or client it was created for, and requests are sent
+    through an `AsyncRequestHandler`.
+
+    **Parameters:**
+
+    - `bot` (`Bot` or `Client`): The client instance that this object belongs to.
+    - `session` (`AsyncRequestHandler`): The async request handler used to make requests.
+    """
+    def __init__(self, bot, session: AsyncRequestHandler) -> None:
+        self.bot = bot
+        self.session = session
+
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Whether or not the client is authenticated."""
+        return self.bot.is_authenticated
+
+    @property
+    def userId(self) -> str:
+        """The ID of the user associated with the client."""
+        return self.bot.userId
+
+    def authenticated(func: F) -> F:
+        """
+        A decorator that checks if the client is authenticated before awaiting the decorated coroutine.
+
+        :param func: The coroutine function to decorate.
+        :type func: F
+        :return: The decorated coroutine function.
+        :rtype: F
+        """
+        async def wrapper(*args, **kwargs) -> Any:
+            try:
+                if not args[0].is_authenticated:
+                    raise LoginRequired
+            except AttributeError:
+                raise LoginRequired
+            return await func(*args, **kwargs)
+
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+
+    async def make_request(self, method: str, url: str, data: dict = None, is_login_required: bool = True) -> dict:
+        """
+        Awaitable version of `Global.make_request`.
+
+        :param method: The HTTP method to use.
+        :type method: str
+        :param url: The URL to make the request to.
+        :type url: str
+        :param data: The data to send with the request.
+        :type data: dict
+        :param is_login_required: Whether the request requires the client to be logged in.
+        :type is_login_required: bool
+        :return: The response from the request.
+        :rtype: dict
+        """
+        return await self.session.handler(
+            method = method,
+            url = url,
+            data = data,
+            is_login_required = is_login_required
+        )
+
+
+    async def fetch_user(self, userId: str) -> UserProfile:
+        """
+        Awaitable version of `Global.fetch_user`.
+
+        :param userId: The ID of the user to fetch.
+        :type userId: str
+        :return: The user's profile.
+        :rtype: UserProfile
+        """
+        return UserProfile(await self.make_request(
+            method = "GET",
+            url = f"/g/s/user-profile/{userId}"
+        ))
+
+
+    @authenticated
+    async def send_message(self, content: str, chatId: str, **kwargs) -> CMessage:
+        """
+        Awaitable version of `Global.send_message`.
+
+        :param content: The content of the message.
+        :type content: str
+        :param chatId: The ID of the chat thread to send the message to.
+        :type chatId: str
+        :param **kwargs: Additional parameters for the message.
+        :return: A `CMessage` object containing the details of the sent message.
+        :rtype: CMessage
+        """
+        return CMessage(await self.make_request(
+            method="POST",
+            url=f"/g/s/chat/thread/{chatId}/message",
+            data = PrepareMessage(content=content, **kwargs).json()
+            ))
+
+
+    @authenticated
+    async def fetch_chats(self, start: int = 0, size: int = 25) -> ChatThreadList:
+        """
+        Awaitable version of `Global.fetch_chats`.
+
+        :param start: The starting index of the chat threads to fetch. (Default: 0)
+        :type start: int, optional
+        :param size: The number of chat threads to fetch. (Default: 25)
+        :type size: int, optional
+        :return: A `ChatThreadList` object containing the fetched chat threads.
+        :rtype: ChatThreadList
+        """
+        return ChatThreadList(await self.make_request(
+            method = "GET",
+            url = f"/g/s/chat/thread?type=joined-me&start={start}&size={size}"
+        ))
+
+
+    def iter_chats(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[ChatThread]:
+        """
+        Iterates over the global chats the user has joined, page by page.
+
+        :param size: The amount of chats to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of chats to yield. Defaults to `None`, which yields every chat.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An async iterator of `ChatThread` objects.
+        :rtype: AsyncIterator[ChatThread]
+
+        **Example usage:**
+
+        >>> async for chat in client.async_global.iter_chats():
+        ...     print(chat.title)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_chats(start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @authenticated
+    async def fetch_chat(self, chatId: str) -> ChatThread:
+        """
+        Awaitable version of `Global.fetch_chat`.
+
+        :param chatId: The ID of the chat thread to fetch.
+        :type chatId: str
+        :return: A `ChatThread` object representing the fetched chat thread.
+        :rtype: ChatThread
+        """
+        return ChatThread(await self.make_request(
+            method = "GET",
+            url = f"/g/s/chat/thread/{chatId}"
+        ))
+
+
+    @authenticated
+    async def fetch_chat_users(self, chatId: str, start: int = 0, size: int = 25) -> CChatMembers:
+        """
+        Awaitable version of `Global.fetch_chat_users`.
+
+        :param chatId: The ID of the chat.
+        :type chatId: str
+        :param start: The start index for fetching the users. (Default: 0)
+        :type start: int, optional
+        :param size: The number of users to fetch. (Default: 25)
+        :type size: int, optional
+        :return: A `CChatMembers` object containing the chat members.
+        :rtype: CChatMembers
+        """
+        return CChatMembers(await self.make_request(
+            method = "GET",
+            url = f"/g/s/chat/thread/{chatId}/member?start={start}&size={size}&type=default&cv=1.2"
+        ))
+
+
+    def iter_chat_users(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the members of a global chat, page by page.
+
+        :param chatId: The ID of the chat.
+        :type chatId: str
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for user in client.async_global.iter_chat_users(chatId="0000-00000-000000-0000"):
+        ...     print(user.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_chat_users(chatId=chatId, start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    @authenticated
+    async def fetch_messages(self, chatId: str, size: int = 25, pageToken: str = None) -> CMessages:
+        """
+        Awaitable version of `Global.fetch_messages`.
+
+        :param chatId: The ID of the chat to fetch messages from.
+        :type chatId: str
+        :param size: The number of messages to fetch. (Default: 25)
+        :type size: int, optional
+        :param pageToken: The page token for pagination. (Optional)
+        :type pageToken: str, optional
+        :return: A `CMessages` object representing the fetched messages.
+        :rtype: CMessages
+        """
+        if pageToken is not None:
+            return CMessages(await self.make_request(
+                method = "GET",
+                url = f"/g/s/chat/thread/{chatId}/message?v=2&pagingType=t&pageToken={pageToken}&size={size}"
+            ))
+        return CMessages(await self.make_request(
+            method = "GET",
+            url = f"/g/s/chat/thread/{chatId}/message?v=2&pagingType=t&size={size}"
+        ))
+
+
+    def iter_messages(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[CMessage]:
+        """
+        Iterates over the messages of a global chat, newest first, following the `pageToken` of each page.
+
+        :param chatId: The ID of the chat to iterate over.
+        :type chatId: str
+        :param size: The amount of messages to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of messages to yield. Defaults to `None`, which yields every message.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An async iterator of `CMessage` objects.
+        :rtype: AsyncIterator[CMessage]
+
+        **Example usage:**
+
+        >>> async for message in client.async_global.iter_messages(chatId="0000-00000-000000-0000", limit=1000):
+        ...     print(message.content)
+        """
+        return apaginate(
+            lambda pageToken, size: self.fetch_messages(chatId=chatId, size=size, pageToken=pageToken),
+            size = size,
+            limit = limit,
+            prefetch = prefetch,
+            token = True
+            )
+
+
+    @authenticated
+    async def fetch_followers(self, userId: str, start: int = 0, size: int = 25) -> UserProfileList:
+        """
+        Awaitable version of `Global.fetch_followers`.
+
+        :param userId: The ID of the user to fetch the followers for.
+        :type userId: str
+        :param start: The starting index of the followers list. (Default: 0)
+        :type start: int, optional
+        :param size: The number of followers to fetch. (Default: 25)
+        :type size: int, optional
+        :return: A `UserProfileList` object containing the fetched followers.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.make_request(
+            method = "GET",
+            url = f"/g/s/user-profile/{userId}/member?start={start}&size={size}"
+        ))
+
+
+    def iter_followers(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the global followers of the specified user, page by page.
+
+        :param userId: The ID of the user whose followers to iterate over.
+        :type userId: str
+        :param size: The amount of followers to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of followers to yield. Defaults to `None`, which yields every follower.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for follower in client.async_global.iter_followers(userId="0000-0000-0000-0000"):
+        ...     print(follower.nickname)
+        """
+        return apaginate(
+            lambda start, size: self.fetch_followers(userId=userId, start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
+    async def fetch_following(self, userId: str, start: int = 0, size: int = 25) -> UserProfileList:
+        """
+        Awaitable version of `Global.fetch_following`.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param start: The index to start fetching from. (Default: 0)
+        :type start: int, optional
+        :param size: The number of user profiles to fetch. (Default: 25)
+        :type size: int, optional
+        :return: A `UserProfileList` object containing the user profiles.
+        :rtype: UserProfileList
+        """
+        return UserProfileList(await self.make_request(
+            method = "GET",
+            url = f"/g/s/user-profile/{userId}/joined?start={start}&size={size}"
+        ))
+
+
+    async def large_fetch_following(self, userId: str, size: int = 25, pageToken: str = None, ignoreMembership: bool = True) -> FollowerList:
+        """
+        Awaitable version of `Global.large_fetch_following`.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param size: The number of user profiles to fetch. (Default: 25)
+        :type size: int, optional
+        :param pageToken: The page token to fetch from. (Default: None)
+        :type pageToken: str, optional
+        :param ignoreMembership: Whether to ignore membership. (Default: True)
+        :type ignoreMembership: bool, optional
+        :return: A `FollowerList` object containing the user profiles.
+        :rtype: FollowerList
+        """
+        if pageToken:
+            return FollowerList(await self.make_request(
+                method = "GET",
+                url = f"/g/s/user-profile/{userId}/joined?size={size}&pageToken={pageToken}&pagingType=t&ignoreMembership={1 if ignoreMembership else 0}"
+            ))
+
+        return FollowerList(await self.make_request(
+            method = "GET",
+            url = f"/g/s/user-profile/{userId}/joined?pagingType=t&size={size}&ignoreMembership={1 if ignoreMembership else 0}"
+        ))
+
+
+    def iter_following(
+        self,
+        userId: str,
+        ignoreMembership: bool = True,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> AsyncIterator[UserProfile]:
+        """
+        Iterates over the users the specified user is following, following the `pageToken` of each page like `large_fetch_following`.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param ignoreMembership: Whether to ignore membership. (Default: True)
+        :type ignoreMembership: bool, optional
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An async iterator of `UserProfile` objects.
+        :rtype: AsyncIterator[UserProfile]
+
+        **Example usage:**
+
+        >>> async for user in client.async_global.iter_following(userId="0000-0000-0000-0000"):
+        ...     print(user.nickname)
+        """
+        return apaginate(
+            lambda pageToken, size: self.large_fetch_following(userId=userId, size=size, pageToken=pageToken, ignoreMembership=ignoreMembership),
+            size = size,
+            limit = limit,
+            prefetch = prefetch,
+            token = True
+            )
+
+
+    @authenticated
+    async def join_chat(self, chatId: str) -> ApiResponse:
+        """
+        Awaitable version of `Global.join_chat`.
+
+        :param chatId: The ID of the chat thread to join.
+        :type chatId: str
+        :return: The API response.
+        :rtype: ApiResponse
+        """
+        return ApiResponse(await self.make_request(
+            method="POST",
+            url=f"/g/s/chat/thread/{chatId}/member/{self.userId}"
+            ))
+
+
+    @authenticated
+    async def leave_chat(self, chatId: Union[str, List[str]]) -> ApiResponse:
+        """
+        Awaitable version of `Global.leave_chat`.
+
+        :param chatId: A list of chat thread IDs to leave or a single chat thread ID to leave.
+        :type chatId: Union[str, List[str]]
+        :return: The API response.
+        :rtype: ApiResponse
+        """
+        return ApiResponse(await self.make_request(
+            method="DELETE",
+            url = f"/g/s/chat/thread/leave?threadIds={','.join(chatId) if isinstance(chatId, list) else chatId}"
+            ))
+
+
+    async def fetch_community(self, community_id: int) -> CCommunity:
+        """
+        Awaitable version of `Global.fetch_community`.
+
+        :param community_id: The ID of the community to fetch.
+        :type community_id: int
+        :return: A CCommunity object representing the community information.
+        :rtype: CCommunity
+        """
+        return CCommunity(await self.make_request(
+            method="GET",
+            url=f"/g/s-x{community_id}/community/info"
+            ))
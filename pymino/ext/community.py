@@ -1,14 +1,16 @@
 from uuid import uuid4
 from io import BytesIO
-from requests import get
 from random import randint
-from diskcache import Cache
 from base64 import b64encode
 from time import time, timezone
-from typing import BinaryIO, Callable, List, Optional, Union, TypeVar, Any
+from typing import BinaryIO, Callable, Iterator, List, Optional, Union, TypeVar, Any
 
 
 from .entities import *
+from .utilities.cache import TieredCache
+from .utilities.media import MediaStream
+from .utilities.bulk import BulkResult, fetch_bulk
+from .utilities.pagination import paginate
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -105,7 +107,7 @@ class Community:
 
 
     @property
-    def cache(self) -> Cache:
+    def cache(self) -> TieredCache:
         """
         The cache object used by the client.
         """
@@ -244,19 +246,19 @@ class Community:
 
         KEY = str((object_id, self.community_id if comId is None else comId))
 
-        with self.cache as cache:
-            if not cache.get(KEY):
-                cache.set(KEY, self.session.handler(
-                    method = "POST",
-                    url = f"/g/s-x{self.community_id if comId is None else comId}/link-resolution",
-                    data = {
-                        "objectId": object_id,
-                        "targetCode": 1,
-                        "objectType": object_type.value if isinstance(object_type, ObjectTypes) else object_type,
-                        "timestamp": int(time() * 1000)
-                        }
-                    ))
-            return LinkInfo(cache.get(KEY))
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, self.session.handler(
+                method = "POST",
+                url = f"/g/s-x{self.community_id if comId is None else comId}/link-resolution",
+                data = {
+                    "objectId": object_id,
+                    "targetCode": 1,
+                    "objectType": object_type.value if isinstance(object_type, ObjectTypes) else object_type,
+                    "timestamp": int(time() * 1000)
+                    }
+                ))
+        return LinkInfo(cache.get(KEY))
 
 
     def fetch_object_id(self, link: str) -> str:
@@ -280,13 +282,13 @@ class Community:
         """
 
         KEY = str((link, "OBJECT_ID"))
-        with self.cache as cache:
-            if not cache.get(KEY):
-                cache.set(KEY, self.session.handler(
-                    method = "GET",
-                    url = f"/g/s/link-resolution?q={link}"
-                    ))
-            return LinkInfo(cache.get(KEY)).objectId
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, self.session.handler(
+                method = "GET",
+                url = f"/g/s/link-resolution?q={link}"
+                ))
+        return LinkInfo(cache.get(KEY)).objectId
 
 
     def fetch_object_info(self, link: str) -> LinkInfo:
@@ -325,13 +327,13 @@ class Community:
         """
 
         KEY = str((link, "OBJECT_INFO"))
-        with self.cache as cache:
-            if not cache.get(KEY):
-                cache.set(KEY, self.session.handler(
-                    method = "GET",
-                    url = f"/g/s/link-resolution?q={link}"
-                    ))
-            return LinkInfo(cache.get(KEY))
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, self.session.handler(
+                method = "GET",
+                url = f"/g/s/link-resolution?q={link}"
+                ))
+        return LinkInfo(cache.get(KEY))
 
 
     def fetch_community(self, comId: Union[str, int] = None) -> CCommunity:
@@ -384,12 +386,13 @@ class Community:
         """
 
         KEY = str((comId, "COMMUNITY_INFO"))
-        if not self.cache.get(KEY):
-            self.cache.set(KEY, self.session.handler(
+        cache = self.cache.namespace("communities")
+        if not cache.get(KEY):
+            cache.set(KEY, self.session.handler(
                 method = "GET",
                 url = f"/g/s-x{self.community_id if comId is None else comId}/community/info"
                 ))
-        return CCommunity(self.cache.get(KEY))
+        return CCommunity(cache.get(KEY))
 
 
     def joined_communities(self, start: int = 0, size: str = 50) -> CCommunityList:
@@ -1008,6 +1011,54 @@ class Community:
             ))
 
 
+    @community
+    def fetch_users_bulk(
+        self,
+        userIds: List[str],
+        comId: Union[str, int] = None,
+        concurrency: int = 8,
+        rate_limit: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[BulkResult]:
+        """
+        Fetches many user profiles in the current or specified community concurrently.
+
+        IDs are deduplicated and fetched on a thread pool, at most `concurrency` at a time. Results are
+        returned in the order of `userIds`, and a failed item carries its exception instead of raising.
+        User profiles resolved by an earlier bulk call are served from the `users` cache namespace.
+
+        :param userIds: The IDs of the user profiles to fetch.
+        :type userIds: List[str]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :param concurrency: The maximum number of requests in flight. Defaults to `8`.
+        :type concurrency: int
+        :param rate_limit: The maximum number of requests started per second. Defaults to `None`.
+        :type rate_limit: Optional[float]
+        :param use_cache: Whether to reuse and store resolved user profiles. Defaults to `True`.
+        :type use_cache: bool
+        :return: A list of `BulkResult` objects whose `value` is a `UserProfile`, in input order.
+        :rtype: List[BulkResult]
+
+        **Example usage:**
+
+        >>> results = client.community.fetch_users_bulk(userIds=["0000-0000-0000-0000", "0000-0000-0000-0001"])
+        >>> for result in results:
+        ...     print(result.id, result.value.nickname if result.ok else result.error)
+        """
+        comId = self.community_id if comId is None else comId
+
+        return fetch_bulk(
+            lambda userId: self.fetch_user(userId=userId, comId=comId),
+            userIds,
+            concurrency = concurrency,
+            rate_limit = rate_limit,
+            cache = self.cache.namespace("users") if use_cache else None,
+            cache_key = lambda userId: (comId, userId),
+            load = UserProfile
+            )
+
+
     @community
     def fetch_users(
         self,
@@ -1098,6 +1149,43 @@ class Community:
             ))
 
 
+    def iter_users(
+        self,
+        userType: UserTypes = UserTypes.RECENT,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the users in the current or specified community based on the specified user type, page by page.
+
+        :param userType: The type of users to iterate over. Defaults to `UserTypes.RECENT`.
+        :type userType: UserTypes
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_users(userType=UserTypes.CURATORS):
+        ...     print(user.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_users(userType=userType, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_online_users(self, start: Optional[int] = 0, size: Optional[int] = 25, comId: Union[str, int] = None) -> UserProfileList:
         """
@@ -1167,6 +1255,40 @@ class Community:
             ))
 
 
+    def iter_online_users(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the online users in the current or specified community, page by page.
+
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_online_users(limit=200):
+        ...     print(user.userId)
+        """
+        return paginate(
+            lambda start, size: self.fetch_online_users(start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_followers(self, userId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
         """
@@ -1240,6 +1362,43 @@ class Community:
             ))
 
 
+    def iter_followers(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the followers of the specified user, page by page.
+
+        :param userId: The ID of the user whose followers to iterate over.
+        :type userId: str
+        :param size: The amount of followers to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of followers to yield. Defaults to `None`, which yields every follower.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for follower in client.community.iter_followers(userId="0000-0000-0000-0000"):
+        ...     print(follower.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_followers(userId=userId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_following(self, userId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> UserProfileList:
         """
@@ -1313,6 +1472,43 @@ class Community:
             ))
 
 
+    def iter_following(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the users the specified user is following, page by page.
+
+        :param userId: The ID of the user whose followings to iterate over.
+        :type userId: str
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.community.iter_following(userId="0000-0000-0000-0000"):
+        ...     print(user.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_following(userId=userId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_chat(self, chatId: str, comId: Union[str, int] = None) -> ChatThread:
         """
@@ -1368,6 +1564,54 @@ class Community:
             url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}"
             ))
 
+
+    @community
+    def fetch_chats_bulk(
+        self,
+        chatIds: List[str],
+        comId: Union[str, int] = None,
+        concurrency: int = 8,
+        rate_limit: Optional[float] = None,
+        use_cache: bool = True
+    ) -> List[BulkResult]:
+        """
+        Fetches many chat threads in the current or specified community concurrently.
+
+        IDs are deduplicated and fetched on a thread pool, at most `concurrency` at a time. Results are
+        returned in the order of `chatIds`, and a failed item carries its exception instead of raising.
+        Chat threads resolved by an earlier bulk call are served from the `chats` cache namespace.
+
+        :param chatIds: The IDs of the chat threads to fetch.
+        :type chatIds: List[str]
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :param concurrency: The maximum number of requests in flight. Defaults to `8`.
+        :type concurrency: int
+        :param rate_limit: The maximum number of requests started per second. Defaults to `None`.
+        :type rate_limit: Optional[float]
+        :param use_cache: Whether to reuse and store resolved chat threads. Defaults to `True`.
+        :type use_cache: bool
+        :return: A list of `BulkResult` objects whose `value` is a `ChatThread`, in input order.
+        :rtype: List[BulkResult]
+
+        **Example usage:**
+
+        >>> results = client.community.fetch_chats_bulk(chatIds=["0000-0000-0000-0000", "0000-0000-0000-0001"])
+        >>> for result in results:
+        ...     print(result.id, result.value.title if result.ok else result.error)
+        """
+        comId = self.community_id if comId is None else comId
+
+        return fetch_bulk(
+            lambda chatId: self.fetch_chat(chatId=chatId, comId=comId),
+            chatIds,
+            concurrency = concurrency,
+            rate_limit = rate_limit,
+            cache = self.cache.namespace("chats") if use_cache else None,
+            cache_key = lambda chatId: (comId, chatId),
+            load = ChatThread
+            )
+
     
     @community
     def fetch_chat_mods(self, chatId: str, comId: Union[str, int] = None, moderators: Optional[str] = "all") -> List[str]:
@@ -1506,6 +1750,40 @@ class Community:
             ))
 
 
+    def iter_chats(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[ChatThread]:
+        """
+        Iterates over the chats the user has joined in the current or specified community, page by page.
+
+        :param size: The amount of chats to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of chats to yield. Defaults to `None`, which yields every chat.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `ChatThread` objects.
+        :rtype: Iterator[ChatThread]
+
+        **Example usage:**
+
+        >>> for chat in client.community.iter_chats():
+        ...     print(chat.title)
+        """
+        return paginate(
+            lambda start, size: self.fetch_chats(start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_live_chats(self, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> ChatThreadList:
         """
@@ -1739,6 +2017,43 @@ class Community:
             ))
 
 
+    def iter_chat_members(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the members of a chat thread, page by page.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param size: The amount of members to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of members to yield. Defaults to `None`, which yields every member.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for member in client.community.iter_chat_members(chatId="0000-00000-000000-0000"):
+        ...     print(member.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_chat_members(chatId=chatId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_messages(self, chatId: str, start: int = 0, size: int = 25, comId: Union[str, int] = None) -> CMessages:
         """
@@ -1798,6 +2113,43 @@ class Community:
         ))
 
 
+    def iter_messages(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[CMessage]:
+        """
+        Iterates over the messages of a chat thread, newest first, page by page.
+
+        :param chatId: The ID of the chat thread.
+        :type chatId: str
+        :param size: The amount of messages to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of messages to yield. Defaults to `None`, which yields every message.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `CMessage` objects.
+        :rtype: Iterator[CMessage]
+
+        **Example usage:**
+
+        >>> for message in client.community.iter_messages(chatId="0000-00000-000000-0000", limit=1000):
+        ...     print(message.content)
+        """
+        return paginate(
+            lambda start, size: self.fetch_messages(chatId=chatId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def fetch_blogs(self, size: int = 25, comId: Union[str, int] = None) -> CBlogList:
         """
@@ -2100,6 +2452,49 @@ class Community:
         raise NoDataProvided
 
 
+    def iter_comments(
+        self,
+        userId: Optional[str] = None,
+        blogId: Optional[str] = None,
+        wikiId: Optional[str] = None,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[Comment]:
+        """
+        Iterates over the comments of the specified user, blog, or wiki, page by page.
+
+        :param userId: The ID of the user whose comments to iterate over. Defaults to `None`.
+        :type userId: Optional[str]
+        :param blogId: The ID of the blog whose comments to iterate over. Defaults to `None`.
+        :type blogId: Optional[str]
+        :param wikiId: The ID of the wiki whose comments to iterate over. Defaults to `None`.
+        :type wikiId: Optional[str]
+        :param size: The amount of comments to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of comments to yield. Defaults to `None`, which yields every comment.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `Comment` objects.
+        :rtype: Iterator[Comment]
+
+        **Example usage:**
+
+        >>> for comment in client.community.iter_comments(blogId="0000-0000-0000-0000"):
+        ...     print(comment.content)
+        """
+        return paginate(
+            lambda start, size: self.fetch_comments(userId=userId, blogId=blogId, wikiId=wikiId, start=start, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @community
     def set_cohost(self, chatId: str, userIds: Union[str, list], comId: Union[str, int] = None) -> ApiResponse:
         """
@@ -2450,13 +2845,13 @@ class Community:
         media = []
 
         if imageList is not None:
-            media.append([100, self.upload_media(open(image, "rb").read(), "image/jpg"), None] for image in imageList)
+            media.append([100, self.upload_media(image, "image/jpg"), None] for image in imageList)
 
 
         data = {
             "mediaList": media,
         }
-        if icon: data["icon"] = self.upload_media(open(icon, "rb").read(), "image/jpg")
+        if icon: data["icon"] = self.upload_media(icon, "image/jpg")
         if keywords: data["keywords"] = keywords
         if fansOnly: data["extensions"] = {"fansOnly": fansOnly}
         if backgroundColor: data["extensions"] = {"style":{"backgroundColor": backgroundColor if backgroundColor.startswith("#") else f"#{backgroundColor}"}}
@@ -4094,20 +4489,31 @@ class Community:
             }]
             }).json()))
 
+    def __queue_message__(self, chatId: str, comId: Union[str, int], data: dict, typing: bool = False) -> CMessage:
+        url = f"/x{comId}/s/chat/thread/{chatId}/message"
+        outbox = getattr(self.bot, "outbox", None)
+
+        if outbox is None:
+            return CMessage(self.session.handler(method = "POST", url = url, data = data))
+        return outbox.send(chatId = chatId, comId = comId, url = url, data = data, typing = typing)
+
+
     @community
-    def send_message(self, chatId: str, content: str, comId: Union[str, int] = None) -> CMessage:
-        return CMessage(self.session.handler(
-            method = "POST", url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message",
-            data = PrepareMessage(content=content).json()
-            ))
+    def send_message(self, chatId: str, content: str, comId: Union[str, int] = None, typing: bool = False) -> CMessage:
+        return self.__queue_message__(
+            chatId = chatId, comId = self.community_id if comId is None else comId,
+            data = PrepareMessage(content=content).json(),
+            typing = typing
+            )
     
 
     @community
-    def reply_message(self, chatId: str, messageId: str, content: str, comId: Union[str, int] = None) -> CMessage:
-        return CMessage(self.session.handler(
-            method = "POST", url = f"/x{self.community_id if comId is None else comId}/s/chat/thread/{chatId}/message",
-            data = PrepareMessage(content=content, replyMessageId=messageId
-            ).json()))
+    def reply_message(self, chatId: str, messageId: str, content: str, comId: Union[str, int] = None, typing: bool = False) -> CMessage:
+        return self.__queue_message__(
+            chatId = chatId, comId = self.community_id if comId is None else comId,
+            data = PrepareMessage(content=content, replyMessageId=messageId).json(),
+            typing = typing
+            )
 
 
     @community
@@ -4209,39 +4615,26 @@ class Community:
                 stickerId=stickerId).json()
                 ))
     
-    def __handle_media__(self, media: str, content_type: str = "image/jpg", media_value: bool = False) -> str:
-        """Handles media files."""
-        response = None
-        
-        try:
-            if media.startswith("http"):
-                response = get(media)
-                response.raise_for_status()
-                media = response.content
-            else:
-                media = open(media, "rb").read()
-        except Exception as e:
-            raise InvalidImage from e
+    def __handle_media__(self, media: Union[str, BinaryIO], content_type: str = "image/jpg", media_value: bool = False) -> Union[str, bytes]:
+        """Handles media files, streaming them to the server when `media_value` is set."""
+        accept = "image/" if content_type.startswith("image") else None
 
         if media_value:
-            return self.upload_media(media=media, content_type=content_type)
-
-        if response and not response.headers.get("content-type").startswith("image"):
-            raise InvalidImage
+            return self.upload_media(media=media, content_type=content_type, accept=accept)
 
-        return media
+        with MediaStream.open(media, accept=accept) as stream:
+            return stream.read()
 
     def encode_media(self, file: bytes) -> str:
         """Encodes a media file to base64."""
         return b64encode(file).decode()
 
-    def upload_media(self, media: Union[str, BinaryIO], content_type: str = "image/jpg") -> str:
-        """Uploads a media file to the server."""
-        return ApiResponse(self.session.handler(
-            method = "POST",
-            url = "/g/s/media/upload",
-            data = media,
-            content_type = content_type
+    def upload_media(self, media: Union[str, bytes, BinaryIO], content_type: Optional[str] = None, accept: Optional[str] = None) -> str:
+        """Streams a file path, url, bytes or open binary file to the server."""
+        return ApiResponse(self.session.upload_media(
+            media = media,
+            content_type = content_type,
+            accept = accept
             )).mediaValue
 
 
@@ -5932,7 +6325,7 @@ class Community:
 
         if title: data               .update(dict(title = title))
         if content: data             .update(dict(content = content))
-        if icon: data                .update(dict(icon = self.upload_media(open(icon, "rb").read()), content_type = "image/jpg"))
+        if icon: data                .update(dict(icon = self.upload_media(icon, "image/jpg")))
         if keywords: data            .update(dict(keywords = keywords))
         if announcement: data        .update(dict(extensions = dict(announcement = announcement)))
         if pinAnnouncement: data     .update(dict(extensions = dict(pinAnnouncement = pinAnnouncement)))
@@ -6682,7 +7075,7 @@ class Community:
         ...     print("Failed to edit blog post.")
         """
         media = []
-        if imageList is not None: media = [[100, self.upload_media(open(image, "rb").read(), "image/jpg"), None] for image in imageList]
+        if imageList is not None: media = [[100, self.upload_media(image, "image/jpg"), None] for image in imageList]
         
         data = {
             "address": None,
@@ -7312,6 +7705,57 @@ class Community:
             ))
 
 
+    def iter_admin_log(
+        self,
+        userId: str = None,
+        blogId: str = None,
+        wikiId: str = None,
+        quizId: str = None,
+        fileId: str = None,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        comId: Union[str, int] = None
+    ) -> Iterator[AdminLog]:
+        """
+        Iterates over the admin log entries for the specified parameters, following the `pageToken` of each page.
+
+        :param userId: The ID of the user to filter the admin log by. (Optional)
+        :type userId: str, optional
+        :param blogId: The ID of the blog to filter the admin log by. (Optional)
+        :type blogId: str, optional
+        :param wikiId: The ID of the wiki to filter the admin log by. (Optional)
+        :type wikiId: str, optional
+        :param quizId: The ID of the quiz to filter the admin log by. (Optional)
+        :type quizId: str, optional
+        :param fileId: The ID of the file to filter the admin log by. (Optional)
+        :type fileId: str, optional
+        :param size: The amount of log entries to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of log entries to yield. Defaults to `None`, which yields every log entry.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :param comId: The ID of the community. If not provided, the current community ID is used.
+        :type comId: Union[str, int]
+        :return: An iterator of `AdminLog` objects.
+        :rtype: Iterator[AdminLog]
+
+        **Example usage:**
+
+        >>> for entry in client.community.iter_admin_log(userId="12345"):
+        ...     print(entry.operation_name)
+        """
+        return paginate(
+            lambda pageToken, size: self.fetch_admin_log(userId=userId, blogId=blogId, wikiId=wikiId, quizId=quizId, fileId=fileId, pageToken=pageToken, size=size, comId=comId),
+            size = size,
+            limit = limit,
+            prefetch = prefetch,
+            token = True,
+            next_token = lambda page: (page.paging or {}).get("nextPageToken")
+            )
+
+
     @community
     def fetch_user_moderation_history(
         self,
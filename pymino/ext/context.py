@@ -1,16 +1,21 @@
-from requests import get
 from functools import wraps
-from diskcache import Cache
 from threading import Thread
 from base64 import b64encode
 from contextlib import suppress
+from concurrent.futures import Future
 from colorama import Fore, Style
+from functools import lru_cache
 from time import sleep as delay, time
 from inspect import signature as inspect_signature
-from typing import BinaryIO, Callable, List, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 
 from .entities import *
+from .waiters import WaiterRegistry
+from .intents import Intents
+from .utilities.media import MediaStream
+from .utilities.cache import TieredCache
 from .utilities.commands import Command, Commands
+from .utilities.cooldown import COOLDOWN_SCOPES, CooldownStore
 
 __all__ = (
     "Context",
@@ -138,9 +143,9 @@ class Context:
         return "http://service.aminoapps.com/api/v1"
     
     @property
-    def cache(self) -> Cache:
+    def cache(self) -> TieredCache:
         """The cache."""
-        return Cache("cache")
+        return self.bot.cache
 
     @property
     def __message_endpoint__(self) -> str:
@@ -151,8 +156,11 @@ class Context:
     def __typing__(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            Thread(target=args[0].__rt__, args=(args[0].comId, args[0].chatId)).start()
-            return func(*args, **kwargs)
+            args[0].bot.outbox.start_typing(args[0].chatId, args[0].comId)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                args[0].bot.outbox.stop_typing(args[0].chatId)
         return wrapper
 
 
@@ -173,11 +181,9 @@ class Context:
         return self.__purge__(self.__parse_kwargs__(**kwargs))    
 
 
-    def __read_image__(self, image: Union[str, BinaryIO]) -> BinaryIO:
-        try:
-            return get(image).content if image.startswith("http") else open(image, "rb").read()
-        except InvalidImage as e:
-            raise InvalidImage from e
+    def __read_image__(self, image: Union[str, BinaryIO]) -> bytes:
+        with MediaStream.open(image, accept="image/") as stream:
+            return stream.read()
 
 
     def __parse_kwargs__(self, **kwargs) -> dict:
@@ -197,12 +203,14 @@ class Context:
         return PrepareMessage(**kwargs).json()
 
 
-    def __send_message__(self, **kwargs) -> CMessage:
-        return CMessage(self.request.handler(
-            method = "POST",
+    def __send_message__(self, wait: bool = True, **kwargs) -> Union[CMessage, Future]:
+        future = self.bot.outbox.submit(
+            chatId = self.chatId,
+            comId = self.comId,
             url = self.__message_endpoint__,
             data = self.__message__(**kwargs)
-            ))
+            )
+        return future.result() if wait else future
 
 
     def __st__(self, comId: str, chatId: str):
@@ -237,30 +245,37 @@ class Context:
         self.__et__(comId, chatId)
 
 
-    def _delete(self, delete_message: CMessage, delete_after: int = 5) -> ApiResponse:
+    def _delete(self, delete_message: Union[CMessage, Future], delete_after: int = 5) -> ApiResponse:
         """
         `delete` - Deletes a message.
         
         `**Parameters**`
-        - `delete_message` - The message to delete.
+        - `delete_message` - The message to delete, or the future of a queued message.
         - `delete_after` - The time to delay before deleting the message.
         
         """
+        if isinstance(delete_message, Future):
+            delete_message = delete_message.result()
+
         delay(delete_after)
         return ApiResponse(self.request.handler(
             method = "DELETE",
             url = f"/{self.communityId}/s/chat/thread/{self.message.chatId}/message/{delete_message.messageId}"
             ))
     
-    def wait_for_message(self, message: str, timeout: int = 10) -> WaitForMessage:
+    def wait_for_message(self, message: str, timeout: int = 10, predicate: Callable[[str], bool] = None) -> WaitForMessage:
         """
         `wait_for_message` - This waits for a specific message within a certain timeout period. 
+
+        The call sleeps until the author sends a message in the chat, it does not poll.
         
         `**Parameters**`
         - `message` : str
-            The specific message to wait for in the cache.
+            The specific message to wait for.
         - `timeout` : int, optional
             The maximum time to wait for the message in seconds. Default is 10.
+        - `predicate` : Callable[[str], bool], optional
+            Only messages for which this returns True are considered. Default is None.
         
         `**Returns**`
         - `WaitForMessage`: The WaitForMessage object.
@@ -300,26 +315,43 @@ class Context:
         if not self.intents:
             raise IntentsNotEnabled
 
-        start = time()
+        content = self.bot.waiters.wait(
+            chatId=self.message.chatId,
+            userId=self.message.author.userId,
+            timeout=timeout,
+            predicate=predicate
+            )
+
+        return self._wait_result(content, message)
 
-        with self.bot.cache as cache:
-            while time() - start < timeout:
-                cached_message = cache.get(f"{self.message.chatId}_{self.message.author.userId}")
+    async def wait_for_message_async(self, message: str, timeout: int = 10, predicate: Callable[[str], bool] = None) -> WaitForMessage:
+        """
+        `wait_for_message_async` - Awaitable version of `wait_for_message` for handlers running in an event loop.
+
+        `**Returns**`
+        - `WaitForMessage`: The WaitForMessage object.
+        """
+        if not self.intents:
+            raise IntentsNotEnabled
 
-                if cached_message == message:
-                    cache.pop(f"{self.message.chatId}_{self.message.author.userId}")
-                    return WaitForMessage(status_code=200)
+        content = await self.bot.waiters.wait_async(
+            chatId=self.message.chatId,
+            userId=self.message.author.userId,
+            timeout=timeout,
+            predicate=predicate
+            )
 
-                if all([cached_message is not None, cached_message != message]):
-                    cache.pop(f"{self.message.chatId}_{self.message.author.userId}")
-                    return WaitForMessage(status_code=404)
+        return self._wait_result(content, message)
 
-            cache.pop(f"{self.message.chatId}_{self.message.author.userId}")
+    def _wait_result(self, content: Union[str, None], message: str) -> WaitForMessage:
+        if content is None:
             return WaitForMessage(status_code=500)
 
+        return WaitForMessage(status_code=200 if content == message else 404)
+
     @_run
     @__typing__
-    def send(self, content: str, delete_after: int= None, mentioned: Union[str, List[str]]= None) -> CMessage:
+    def send(self, content: str, delete_after: int= None, mentioned: Union[str, List[str]]= None, wait: bool = True) -> Union[CMessage, Future]:
         """
         `send` - This sends a message.
 
@@ -327,8 +359,9 @@ class Context:
         - `content` - The message you want to send.
         - `delete_after` - The time in seconds before the message is deleted. [Optional]
         - `mentioned` - The user(s) you want to mention. [Optional]
+        - `wait` - Whether to wait until the message is sent, `False` returns a `Future` of the CMessage. [Optional]
 
-        `**Returns**`` - CMessage object.
+        `**Returns**`` - CMessage object, or its Future if `wait` is `False`.
 
         `**Example**``
         ```py
@@ -338,6 +371,7 @@ class Context:
         ```
         """
         message: CMessage = self.__send_message__(
+            wait=wait,
             content=content,
             extensions = {
             "mentionedArray": [{"uid": user} for user in mentioned] if mentioned else None
@@ -350,7 +384,7 @@ class Context:
 
     @_run
     @__typing__
-    def reply(self, content: str, delete_after: int= None, mentioned: Union[str, List[str]]= None) -> CMessage:
+    def reply(self, content: str, delete_after: int= None, mentioned: Union[str, List[str]]= None, wait: bool = True) -> Union[CMessage, Future]:
         """
         `reply` - This replies to the message.
 
@@ -358,8 +392,9 @@ class Context:
         - `content` - The message you want to send.
         - `delete_after` - The time in seconds before the message is deleted. [Optional]
         - `mentioned` - The user(s) you want to mention. [Optional]
+        - `wait` - Whether to wait until the message is sent, `False` returns a `Future` of the CMessage. [Optional]
 
-        `**Returns**`` - CMessage object.
+        `**Returns**`` - CMessage object, or its Future if `wait` is `False`.
 
         `**Example**``
         ```py
@@ -369,6 +404,7 @@ class Context:
         ```
         """
         message: CMessage = self.__send_message__(
+            wait=wait,
             content=content,
             replyMessageId=self.message.messageId,
             extensions = {
@@ -500,41 +536,28 @@ class Context:
         return message
 
 
-    def __handle_media__(self, media: str, content_type: str = "image/jpg", media_value: bool = False) -> str:
-        response = None
-        
-        try:
-            if media.startswith("http"):
-                response = get(media)
-                response.raise_for_status()
-                media = response.content
-            else:
-                media = open(media, "rb").read()
-        except Exception as e:
-            raise InvalidImage from e
-        
-        if content_type == "audio/aac":
-            return self.encode_media(media)
+    def __handle_media__(self, media: Union[str, BinaryIO], content_type: str = "image/jpg", media_value: bool = False) -> Union[str, bytes]:
+        accept = "image/" if content_type.startswith("image") else None
 
         if media_value:
-            return self.upload_media(media=media, content_type=content_type)
+            return self.upload_media(media=media, content_type=content_type, accept=accept)
 
-        if response and not response.headers.get("content-type").startswith("image"):
-            raise InvalidImage
+        with MediaStream.open(media, accept=accept) as stream:
+            if content_type == "audio/aac":
+                return self.encode_media(stream.read())
 
-        return media
+            return stream.read()
     
 
     def encode_media(self, file: bytes) -> str:
         return b64encode(file).decode()
 
 
-    def upload_media(self, media: Union[str, BinaryIO], content_type: str = "image/jpg") -> str:
-        return ApiResponse(self.request.handler(
-            method = "POST",
-            url = "/g/s/media/upload",
-            data = media,
-            content_type = content_type
+    def upload_media(self, media: Union[str, bytes, BinaryIO], content_type: Optional[str] = None, accept: Optional[str] = None) -> str:
+        return ApiResponse(self.request.upload_media(
+            media = media,
+            content_type = content_type,
+            accept = accept
             )).mediaValue
 
 
@@ -690,6 +713,49 @@ class Context:
             ))
 
 
+def _bind_context(context: Context, message: Optional[str]) -> Context:
+    return context
+
+def _bind_member(context: Context, message: Optional[str]) -> Member:
+    return Member(context.author.json())
+
+def _bind_message(context: Context, message: Optional[str]) -> Optional[str]:
+    if isinstance(message, str):
+        return message
+    with suppress(AttributeError):
+        return context.message.content
+
+def _bind_username(context: Context, message: Optional[str]) -> Optional[str]:
+    with suppress(AttributeError):
+        return context.author.username
+
+def _bind_userId(context: Context, message: Optional[str]) -> Optional[str]:
+    with suppress(AttributeError):
+        return context.author.userId
+
+def _bind_none(context: Context, message: Optional[str]) -> None:
+    return None
+
+PARAMETER_BINDERS: Dict[str, Callable[[Context, Optional[str]], Any]] = {
+    "ctx": _bind_context,
+    "member": _bind_member,
+    "message": _bind_message,
+    "username": _bind_username,
+    "userId": _bind_userId
+    }
+
+@lru_cache(maxsize=None)
+def compile_binder(func: Callable) -> Tuple[Callable[[Context, Optional[str]], Any], ...]:
+    """
+    `compile_binder` - Returns one binder per parameter of `func`, read from its signature once.
+
+    A binder takes the context and the message and returns the argument for its parameter,
+    so handlers are called without inspecting them again. Unknown parameters are passed `None`.
+
+    """
+    return tuple(PARAMETER_BINDERS.get(parameter, _bind_none) for parameter in inspect_signature(func).parameters)
+
+
 class EventHandler:
     """
     `EventHandler` - AKA where all the events are handled.
@@ -703,11 +769,14 @@ class EventHandler:
         self._events:           dict = {}
         self._commands:         Commands = Commands()
         self.context:           Context = Context
+        self.waiters:           WaiterRegistry = WaiterRegistry(buffer=self.cache.namespace("messages"))
+        self._active_intents:   Optional[Intents] = None
 
 
     def register_event(self, event_name: str) -> Callable:
         def decorator(event_handler: Callable) -> Callable:
             self._events[event_name] = event_handler
+            self._active_intents = None
             return event_handler
         return decorator
 
@@ -727,11 +796,9 @@ class EventHandler:
         
         `**Returns**`` - None
         """
+        arguments = (self.community,) if inspect_signature(func).parameters else ()
         while True:
-            if len(inspect_signature(func).parameters) == 0:
-                func()
-            else:
-                func(self.community)
+            func(*arguments)
             delay(interval)
 
 
@@ -763,34 +830,11 @@ class EventHandler:
         return decorator
 
 
-    def _set_parameters(self, context: Context, func: Callable, message: str = None) -> list:
-        try:
-            message = message if isinstance(message, str) else context.message.content
-        except AttributeError:
-            message = None
-
-        try:
-            username = context.author.username
-        except AttributeError:
-            username = None
-
-        try:
-            userId = context.author.userId
-        except AttributeError:
-            userId = None
-
-        potential_parameters = {
-            "ctx": context,
-            "member": Member(context.author.json()),
-            "message": message,
-            "username": username,
-            "userId": userId
-        }
-
-        return (
-            potential_parameters.get(parameter)
-            for parameter in inspect_signature(func).parameters
-        )
+    def _set_parameters(self, context: Context, func: Callable, message: str = None, binder: tuple = None) -> list:
+        """`_set_parameters` - Returns the arguments `func` asks for, using its precompiled binder."""
+        if binder is None:
+            binder = compile_binder(func)
+        return [bind(context, message) for bind in binder]
 
 
     def emit(self, name: str, *args) -> None:
@@ -805,6 +849,7 @@ class EventHandler:
         usage: str=None,
         aliases: list=[],
         cooldown: int=0,
+        cooldown_scope: str="user",
         **kwargs
     ) -> Callable:
         """
@@ -815,6 +860,7 @@ class EventHandler:
         - `command_description` - The description of the command.
         - `aliases` - The other names the command can be called by.
         - `cooldown` - The cooldown of the command in seconds.
+        - `cooldown_scope` - Who shares the cooldown: `user`, `chat` or `global`.
 
         `**Function Parameters**``
         - `ctx` - The context of the command.
@@ -857,6 +903,11 @@ class EventHandler:
             # This command can only be called every 5 seconds.
             return ctx.send(content="Pong!")
 
+        @bot.command(command_name="daily", cooldown=86400, cooldown_scope="chat") # Command parameters.
+        def daily(ctx: Context): # Function parameters.
+            # This command can only be called once a day in each chat, by anyone.
+            return ctx.send(content="Daily reward claimed!")
+
         @bot.command(command_name="say", command_description="This is a command that says something.") # Command parameters.
         def say(ctx: Context, message: str, username: str, userId: str): # Function parameters.
             bot.community.delete_message(chatId=ctx.chatId, messageId=ctx.message.chatId, comId=ctx.comId)
@@ -875,6 +926,9 @@ class EventHandler:
             self._is_deprecated("command_description", "description")
             description = kwargs["command_description"]
 
+        if cooldown_scope not in COOLDOWN_SCOPES:
+            raise ValueError(f"Invalid cooldown scope: {cooldown_scope}. Use one of {', '.join(COOLDOWN_SCOPES)}.")
+
         def decorator(func: Callable) -> Callable:
             self._commands.add_command(
                 Command(
@@ -883,7 +937,9 @@ class EventHandler:
                     description=description,
                     usage=usage,
                     aliases=aliases,
-                    cooldown=cooldown
+                    cooldown=cooldown,
+                    cooldown_scope=cooldown_scope,
+                    binder=compile_binder(func)
                 ))
             return func
         return decorator
@@ -894,10 +950,7 @@ class EventHandler:
 
 
     def command_exists(self, command_name: str) -> bool:
-        return any([
-            command_name in self._commands.__command_names__(),
-            command_name in self._commands.__command_aliases__()
-            ])
+        return command_name in self._commands.routes
 
 
     def fetch_command(self, command_name: str) -> Command:
@@ -921,58 +974,38 @@ class EventHandler:
         Examples:
             This function is internally called and does not have direct usage examples.
         """
-        command_name = next(iter(data.content[len(self.command_prefix):].split(" ")))
+        command, message = None, None
+        if data.content.startswith(self.command_prefix):
+            command, message = self._commands.route(data.content[len(self.command_prefix):])
 
-        message = data.content[len(self.command_prefix) + len(command_name) + 1:]
-        command = self._commands.fetch_command(command_name)
-    
         if command is None:
-            if command_name == "help" and data.content == f"{self.command_prefix}help":
+            if data.content == f"{self.command_prefix}help":
                 return context.reply(content=self._commands.__help__())
-            
+
             if self._events.get("text_message"):
                 return self._handle_all_events(event="text_message", data=data, context=context)
 
-        if data.content[:len(self.command_prefix)] != self.command_prefix:
             return None
 
-        try:
-            response = self._check_cooldown(command.name, data, context)
-        except AttributeError:
-            return None
-
-        if response != 403:
-            func = command.func
-            return func(*self._set_parameters(context=context, func=func, message=message))
+        if self._check_cooldown(command, data, context) != 403:
+            return command.func(*self._set_parameters(context, command.func, message, command.binder))
 
         return None
 
 
-    def _check_cooldown(self, command_name: str, data: Message, context: Context) -> None:
-        """`_check_cooldown` is a function that checks if a command is on cooldown."""
-        if self._commands.fetch_command(command_name).cooldown > 0:
-            if self._commands.fetch_cooldown(command_name, data.author.userId) > time():
-                context.reply(content=self._cooldown_message or f"You are on cooldown for {int(self._commands.fetch_cooldown(command_name, data.author.userId) - time())} seconds.")
+    def _check_cooldown(self, command: Command, data: Message, context: Context) -> None:
+        """`_check_cooldown` is a function that checks if a command is on cooldown, starting the cooldown if it is not."""
+        if command.cooldown > 0:
+            bucket = CooldownStore.bucket(command.name, command.cooldown_scope, data.author.userId, data.chatId)
+            remaining = self._commands.cooldowns.hit(bucket, command.cooldown)
+            if remaining:
+                context.reply(content=self._cooldown_message or f"You are on cooldown for {int(remaining)} seconds.")
                 return 403
-            
-            self._commands.set_cooldown(
-                command_name=command_name,
-                cooldown=self._commands.fetch_command(command_name).cooldown,
-                userId=data.author.userId
-                )
 
         return 200
 
     def _add_cache(self, chatId: str, userId: str, content: str):
-        with self.cache as cache:
-            if cache.get(f"{chatId}_{userId}") is not None:
-                self.cache.pop(f"{chatId}_{userId}")
-
-            cache.add(
-                key=f"{chatId}_{userId}",
-                value=content,
-                expire=90
-                )
+        return self.waiters.feed(chatId, userId, content)
 
 
     def on_error(self):
@@ -1421,11 +1454,6 @@ class EventHandler:
 
             if event == "text_message":
                 context = self.context(data, self)
-                if all([self.intents, not self.command_exists(
-                    command_name=data.content[len(self.command_prefix):].split(" ")[0]
-                    )]):
-                        self._add_cache(data.chatId, data.author.userId, data.content)
-
                 return self._handle_command(data=data, context=context)
             
             if event in self._events:
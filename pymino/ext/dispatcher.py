@@ -1,8 +1,11 @@
-from typing import Callable
+from typing import Callable, Hashable, Optional
 
 class MessageDispatcher:
     """
     `MessageDispatcher` - Simple message dispatcher that allows you to register handlers for specific message types.
+
+    A `key` function can be registered alongside a handler. Messages that share a key
+    (for example the same chat) are expected to be handled in order, see `fetch_key`.
  
     `**Example**`
 
@@ -13,17 +16,32 @@ class MessageDispatcher:
     message_type = 1000
     message = {"t": message_type, "d": {"foo": "bar"}}
     handler = lambda message: print(message)
+    key = lambda message: message["d"]["foo"]
 
-    dispatcher.register(message_type, handler)
+    dispatcher.register(message_type, handler, key)
+    dispatcher.fetch_key(message) # "bar"
     dispatcher.handle(message)
     ```
 
     """
     def __init__(self):
         self.dispatch_table = {}
+        self.key_table = {}
 
-    def register(self, message_type: int, handler: Callable):
+    def register(self, message_type: int, handler: Callable, key: Optional[Callable[[dict], Hashable]] = None):
         self.dispatch_table[message_type] = handler
+        if key is not None:
+            self.key_table[message_type] = key
+
+    def fetch_key(self, message: dict) -> Optional[Hashable]:
+        """Returns the ordering key of a message, or `None` if it can be handled in any order."""
+        key = self.key_table.get(message.get("t"))
+        if key is None:
+            return None
+        try:
+            return key(message)
+        except (AttributeError, KeyError, TypeError):
+            return None
 
     def handle(self, message: dict):
         message_type = message.get("t")
@@ -188,6 +188,12 @@ class AdminLogList:
     def parser(self) -> List[AdminLog]:
         """Returns a list of AdminLog objects"""
         return [AdminLog(i) for i in self.data.get("adminLogList")]
+
+    def __iter__(self):
+        return iter(self.parser())
+
+    def __len__(self) -> int:
+        return len(self.data.get("adminLogList") or [])
     
     @property
     def paging(self) -> dict:
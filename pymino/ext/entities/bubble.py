@@ -1,7 +1,10 @@
 from typing import List, Union
+from functools import cached_property
 
 
 class Bubble:
+    __slots__ = ("data",)
+
     def __init__(self, data: dict) -> None:
         try:
             self.data = data
@@ -341,214 +344,225 @@ class BubbleList:
         """
         Iterator function to iterate over the bubbles in the bubble list.
         """
-        for bubble in self.data:
-            yield Bubble(bubble)
+        yield from self._rows
 
-    @property
+    def __iter__(self):
+        return iter(self._rows or [])
+
+    def __len__(self) -> int:
+        return len(self._rows or [])
+
+    @cached_property
+    @_check_bubbles
+    def _rows(self) -> List[Bubble]:
+        """The bubbles of the bubble list, parsed once on first access."""
+        return [Bubble(bubble) for bubble in self.data]
+
+    @cached_property
     @_check_bubbles
     def ref_object_id(self) -> List[str]:
         """Returns the ref object id of the bubble list."""
         return [bubble.ref_object_id for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def created_time(self) -> List[str]:
         """Returns the created time of the bubble list."""
         return [bubble.created_time for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def item_basic_info(self) -> List[dict]:
         """Returns the item basic info of the bubble list."""
         return [bubble.item_basic_info for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def icon(self) -> List[str]:
         """Returns the icon of the bubble list."""
         return [bubble.icon for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def name(self) -> List[str]:
         """Returns the name of the bubble list."""
         return [bubble.name for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def item_restriction_info(self) -> List[dict]:
         """Returns the item restriction info of the bubble list."""
         return [bubble.item_restriction_info for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def owner_uid(self) -> List[str]:
         """Returns the owner uid of the bubble list."""
         return [bubble.owner_uid for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def owner_type(self) -> List[int]:
         """Returns the owner type of the bubble list."""
         return [bubble.owner_type for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def restrict_type(self) -> List[int]:
         """Returns the restrict type of the bubble list."""
         return [bubble.restrict_type for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def restrict_value(self) -> List[int]:
         """Returns the restrict value of the bubble list."""
         return [bubble.restrict_value for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def available_duration(self) -> List[str]:
         """Returns the available duration of the bubble list."""
         return [bubble.available_duration for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def discount_value(self) -> List[str]:
         """Returns the discount value of the bubble list."""
         return [bubble.discount_value for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def discount_status(self) -> List[int]:
         """Returns the discount status of the bubble list."""
         return [bubble.discount_status for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def ref_object(self) -> List[dict]:
         """Returns the ref object of the bubble list."""
         return [bubble.ref_object for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def is_global(self) -> List[str]:
         """Returns the is global of the bubble list."""
         return [bubble.is_global for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def available_community_ids(self) -> List[int]:
         """Returns the available community ids of the bubble list."""
         return [bubble.available_community_ids for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def bubble_type(self) -> List[int]:
         """Returns the bubble type of the bubble list."""
         return [bubble.bubble_type for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def bubble_id(self) -> List[str]:
         """Returns the bubble id of the bubble list."""
         return [bubble.bubble_id for bubble in self.__iterator__()]
     
-    @property
+    @cached_property
     @_check_bubbles
     def background_image(self) -> List[str]:
         """Returns the background image of the bubble list."""
         return [bubble.background_image for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def status(self) -> List[int]:
         """Returns the status of the bubble list."""
         return [bubble.status for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def is_new(self) -> List[str]:
         """Returns the is new of the bubble list."""
         return [bubble.is_new for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def name(self) -> List[str]:
         """Returns the name of the bubble list."""
         return [bubble.name for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def banner_image(self) -> List[str]:
         """Returns the banner image of the bubble list."""
         return [bubble.banner_image for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def resource_url(self) -> List[str]:
         """Returns the resource url of the bubble list."""
         return [bubble.resource_url for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def ownership_status(self) -> List[str]:
         """Returns the ownership status of the bubble list."""
         return [bubble.ownership_status for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def deletable(self) -> List[str]:
         """Returns the deletable of the bubble list."""
         return [bubble.deletable for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def config(self) -> List[dict]:
         """Returns the config of the bubble list."""
         return [bubble.config for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def version(self) -> List[int]:
         """Returns the version of the bubble list."""
         return [bubble.version for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def modified_time(self) -> List[str]:
         """Returns the modified time of the bubble list."""
         return [bubble.modified_time for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def is_activated(self) -> List[str]:
         """Returns the is activated of the bubble list."""
         return [bubble.is_activated for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def cover_image(self) -> List[str]:
         """Returns the cover image of the bubble list."""
         return [bubble.cover_image for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def extensions(self) -> List[str]:
         """Returns the extensions of the bubble list."""
         return [bubble.extensions for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def template_id(self) -> List[str]:
         """Returns the template id of the bubble list."""
         return [bubble.template_id for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def uid(self) -> List[str]:
         """Returns the uid of the bubble list."""
         return [bubble.uid for bubble in self.__iterator__()]
 
-    @property
+    @cached_property
     @_check_bubbles
     def md5(self) -> List[str]:
         """Returns the md5 of the bubble list."""
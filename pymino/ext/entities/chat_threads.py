@@ -1,4 +1,5 @@
 from typing import List
+from functools import cached_property
 
 
 class ChatThreadExtensions:
@@ -384,6 +385,8 @@ class MemberSummaryList:
 
 
 class ChatThread: 
+    __slots__ = ("data",)
+
     def __init__(self, data: dict):
         try:
             self.data = data.get("thread", data)
@@ -520,122 +523,132 @@ class ChatThreadList:
     def __init__(self, data: dict):
         self.data = data.get("threadList", data)
 
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @cached_property
+    def _rows(self) -> List[ChatThread]:
+        return [ChatThread(x) for x in self.data]
+
     def parser(self) -> List[ChatThread]:
         """Returns a list of ChatThread objects"""
-        return [ChatThread(x) for x in self.data]
+        return self._rows
     
     
-    @property
+    @cached_property
     def extensions(self) -> ChatThreadExtensions:
         """Returns the chat thread extensions"""
         return ChatThreadExtensionsList([x.get("extensions") for x in self.data])
     
-    @property
+    @cached_property
     def members_summary(self) -> MemberSummary:
         """Returns the members summary"""
         return MemberSummaryList([x.get("membersSummary") for x in self.data])
     
-    @property
+    @cached_property
     def user_added_topic_list(self) -> List[str]:
         """Returns a list of user added topics"""
         return [x.user_added_topic_list for x in self.parser()]
     
-    @property
+    @cached_property
     def uid(self) -> List[str]:
         """Returns a list of host user ids"""
         return [x.uid for x in self.parser()]
     
-    @property
+    @cached_property
     def host_user_id(self) -> List[str]:
         """Returns a list of host user ids"""
         return self.uid
     
-    @property
+    @cached_property
     def members_quota(self) -> List[int]:
         """Returns a list of members quotas"""
         return [x.members_quota for x in self.parser()]
     
-    @property
+    @cached_property
     def threadId(self) -> List[str]:
         """Returns a list of thread ids"""
         return [x.threadId for x in self.parser()]
     
-    @property
+    @cached_property
     def chatId(self) -> List[str]:
         """Returns a list of thread ids"""
         return self.threadId
     
-    @property
+    @cached_property
     def keywords(self) -> List[List[str]]:
         """Returns a list of keywords"""
         return [x.keywords for x in self.parser()]
     
-    @property
+    @cached_property
     def members_count(self) -> List[int]:
         """Returns a list of members counts"""
         return [x.members_count for x in self.parser()]
     
-    @property
+    @cached_property
     def strategy_info(self) -> List[dict]:
         """Returns a list of strategy info"""
         return [x.strategy_info for x in self.parser()]
     
-    @property
+    @cached_property
     def is_pinned(self) -> List[bool]:
         """Returns a list of whether the chat is pinned"""
         return [x.is_pinned for x in self.parser()]
     
-    @property
+    @cached_property
     def title(self) -> List[str]:
         """Returns a list of chat titles"""
         return [x.title for x in self.parser()]
     
-    @property
+    @cached_property
     def membership_status(self) -> List[str]:
         """Returns a list of membership statuses"""
         return [x.membership_status for x in self.parser()]
     
-    @property
+    @cached_property
     def content(self) -> List[str]:
         """Returns a list of chat contents"""
         return [x.content for x in self.parser()]
     
-    @property
+    @cached_property
     def is_hidden_required(self) -> List[bool]:
         """Returns a list of whether the chat needs to be hidden"""
         return [x.is_hidden_required for x in self.parser()]
     
-    @property
+    @cached_property
     def alert_option(self) -> List[int]:
         """Returns a list of alert options"""
         return [x.alert_option for x in self.parser()]
     
-    @property
+    @cached_property
     def last_read_time(self) -> List[str]:
         """Returns a list of last read times"""
         return [x.last_read_time for x in self.parser()]
     
-    @property
+    @cached_property
     def type(self) -> List[int]:
         """Returns a list of chat types"""
         return [x.type for x in self.parser()]
     
-    @property
+    @cached_property
     def status(self) -> List[int]:
         """Returns a list of chat statuses"""
         return [x.status for x in self.parser()]
     
-    @property
+    @cached_property
     def is_published_to_global(self) -> List[bool]:
         """Returns a list of whether the chat is published to global"""
         return [x.is_published_to_global for x in self.parser()]
     
-    @property
+    @cached_property
     def modified_time(self) -> List[str]:
         """Returns a list of modified times"""
         return [x.modified_time for x in self.parser()]
     
-    @property
+    @cached_property
     def last_message_summary(self) -> List[dict]:
         """Returns a list of last message summaries"""
         return [x.last_message_summary for x in self.parser()]
@@ -1,4 +1,5 @@
 from typing import Union
+from functools import cached_property
 from . import UserProfileList
 
 
@@ -258,6 +259,8 @@ class Comment:
     :param data: The raw data of the comment.
     :type data: Union[dict, str]
     """
+    __slots__ = ("data",)
+
     def __init__(self, data: Union[dict, str]) -> None:
         self.data = data
 
@@ -396,11 +399,26 @@ class CommentList:
         """
         Iterator function to iterate over the comments in the comment list.
         """
-        for comment in self.data.get("commentList"):
-            yield Comment(comment)
+        yield from self._rows
 
 
-    @property
+    def __iter__(self):
+        return iter(self._rows)
+
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+    @cached_property
+    def _rows(self) -> list:
+        """
+        The comments of the comment list, parsed once on first access.
+        """
+        return [Comment(comment) for comment in self.data.get("commentList")]
+
+
+    @cached_property
     def author(self) -> UserProfileList:
         """
         Returns a list of authors of the comments in the comment list.
@@ -408,7 +426,7 @@ class CommentList:
         return UserProfileList([comment.author for comment in self.__iterator__()])
 
 
-    @property
+    @cached_property
     def commentId(self) -> list:
         """
         Returns a list of comment IDs in the comment list.
@@ -416,7 +434,7 @@ class CommentList:
         return [comment.commentId for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def content(self) -> list:
         """
         Returns a list of contents of the comments in the comment list.
@@ -424,7 +442,7 @@ class CommentList:
         return [comment.content for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def createdTime(self) -> list:
         """
         Returns a list of creation times of the comments in the comment list.
@@ -432,7 +450,7 @@ class CommentList:
         return [comment.createdTime for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def extensions(self) -> list:
         """
         Returns a list of extensions of the comments in the comment list.
@@ -440,7 +458,7 @@ class CommentList:
         return [comment.extensions for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def mediaList(self) -> list:
         """
         Returns a list of media lists of the comments in the comment list.
@@ -448,7 +466,7 @@ class CommentList:
         return [comment.mediaList for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def modifiedTime(self) -> list:
         """
         Returns a list of modification times of the comments in the comment list.
@@ -456,7 +474,7 @@ class CommentList:
         return [comment.modifiedTime for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def ndcId(self) -> list:
         """
         Returns a list of NDC IDs of the comments in the comment list.
@@ -464,7 +482,7 @@ class CommentList:
         return [comment.comId for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def parentId(self) -> list:
         """
         Returns a list of parent IDs of the comments in the comment list.
@@ -472,7 +490,7 @@ class CommentList:
         return [comment.objectId for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def parentNdcId(self) -> list:
         """
         Returns a list of parent NDC IDs of the comments in the comment list.
@@ -480,7 +498,7 @@ class CommentList:
         return [comment.parentNdcId for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def parentType(self) -> list:
         """
         Returns a list of parent types of the comments in the comment list.
@@ -488,7 +506,7 @@ class CommentList:
         return [comment.parentType for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def subcommentsCount(self) -> list:
         """
         Returns a list of subcomment counts for the comments in the comment list.
@@ -496,7 +514,7 @@ class CommentList:
         return [comment.subcommentsCount for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def type(self) -> list:
         """
         Returns a list of types of the comments in the comment list.
@@ -504,7 +522,7 @@ class CommentList:
         return [comment.type for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def votedValue(self) -> list:
         """
         Returns a list of voted values of the comments in the comment list.
@@ -512,7 +530,7 @@ class CommentList:
         return [comment.votedValue for comment in self.__iterator__()]
 
 
-    @property
+    @cached_property
     def votesSum(self) -> list:
         """
         Returns a list of vote sums for the comments in the comment list.
@@ -481,8 +481,8 @@ class MustRunInContext(Exception):
 class WrongWebSocketPackage(Exception):
     def __init__(self):
         super().__init__(
-            "Wrong websocket package was installed. We corrected it for you."
-            "\nPlease restart your bot.\n"
+            "Wrong websocket package was installed."
+            "\nRun `pip uninstall websocket -y` and `pip install websocket-client==1.6.1`, then restart your bot.\n"
             )
         
 class NullResponse(Exception):
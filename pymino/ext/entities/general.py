@@ -521,6 +521,12 @@ class CChatMembers:
         if isinstance(data, dict):
             self.members: UserProfileList = UserProfileList(self.data.get("memberList", self.members))
 
+    def __iter__(self):
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
     def json(self) -> Union[dict, str]:
         return self.data
 
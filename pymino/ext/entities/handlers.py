@@ -7,8 +7,10 @@ from re import search
 from asyncio import sleep as asleep
 from datetime import datetime
 from os import system, environ
-from pip import main as pipmain
+from functools import lru_cache
+from threading import Thread
 from contextlib import suppress
+from importlib.util import find_spec
 
 from colorama import Fore, Style
 
@@ -27,7 +29,7 @@ def check_debugger() -> bool:
 
 def install_wsaccel() -> None:
     """
-    Try to install wsaccel if it isn't installed.
+    Try to install wsaccel if it isn't installed. This is never done on import, call it once to speed up websocket frames.
     """
     with Cache(CACHE_NAME) as cache:
         if cache.get("wsaccel"):
@@ -38,31 +40,36 @@ def install_wsaccel() -> None:
             cache.set("wsaccel", True)
             return True
         except ImportError:
+            from pip import main as pipmain
             pipmain(["install", "wsaccel"])
             cache.set("wsaccel", True)
             system("cls || clear")
             return None
 
+@lru_cache(maxsize=None)
 def orjson_exists() -> bool:
     """
-    Checks if orjson is installed. If it isn't, it will install it.
+    Checks once if orjson can be used. Nothing is installed on import, run `pip install orjson` for faster JSON.
     """
     if is_android(): return False
 
-    install_wsaccel()
-    with Cache(CACHE_NAME) as cache:
-        if cache.get("orjson"):
-            return True
+    return find_spec("orjson") is not None
 
-        try:
-            from orjson import dumps as dumps
-            cache.set("orjson", True)
-            return True
-        except ImportError:
-            pipmain(["install", "orjson"])
-            cache.set("orjson", True)
-            system("cls || clear")
-            return True
+def _check_version(version: str) -> None:
+    with suppress(Exception):
+        from requests import get
+        latest_version = get("https://pypi.org/pypi/pymino/json", timeout=5).json()["info"]["version"]
+
+        if version != latest_version:
+            print(f"{Fore.RED}WARNING:{Style.RESET_ALL} You are using an outdated version of pymino ({version}). The latest version is {latest_version}.")
+
+@lru_cache(maxsize=None)
+def check_version(version: str) -> None:
+    """
+    Prints the discord invite and checks PyPI for a newer version in the background, once per process.
+    """
+    print("Join the pymino discord server: https://discord.gg/RuRzyya55Z")
+    Thread(target=_check_version, args=(version,), name="pymino-version-check", daemon=True).start()
 
 def is_android() -> bool:
     """
@@ -91,10 +98,11 @@ def parse_auid(sid: str) -> str:
     return decoded_json["2"]
 
 def cache_login(email: str, device: str, sid: str):
-    """Cache the login credentials for the current user."""
+    """Cache the login credentials for the current user, see `DeviceIdPool.bind`."""
+    from ..utilities.device import DeviceIdPool
+
     with suppress(Exception):
-        cache = Cache(CACHE_NAME)
-        cache[email] = {"device": device, "sid": sid}
+        DeviceIdPool(generator=None, prefill=False).bind(email, device, sid)
 
 def fetch_cache(email: str) -> tuple:
     """Fetch the login credentials for the current user."""
@@ -106,7 +114,7 @@ def cache_exists(email: str) -> bool:
     """Check if the cache exists for the current user."""
     with suppress(Exception):
         cache = Cache(CACHE_NAME)
-        return email in cache
+        return bool((cache.get(email) or {}).get("sid"))
     
 async def alive_loop(ws) -> None:
     run_check = any([is_android(), is_repl()])
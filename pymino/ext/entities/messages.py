@@ -1,6 +1,7 @@
 from time import time
+from functools import cached_property
 from re import findall
-from typing import Union
+from typing import List, Union
 
 from . import UserProfile
 
@@ -674,6 +675,17 @@ class CMessageAuthorList:
 class CMessages:
     def __init__(self, data: Union[dict, str]) -> None:
         self.data = data.get('result') or data.get('messageList', data)
+        self.next_page_token: Union[str, None] = (data.get('paging') or {}).get('nextPageToken')
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self.data or [])
+
+    @cached_property
+    def _rows(self) -> List[CMessage]:
+        return [CMessage(x) for x in self.data or []]
 
     def return_none(func):
         def wrapper(*args, **kwargs):
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List, Union
 
 class AvatarFrameNotFound:
@@ -411,6 +412,8 @@ class UserProfile:
 	- `blogs_count` - The amount of blogs the user has created.
 	- `is_user_hidden` - Is the user hidden.
 	"""
+	__slots__ = ("_data",)
+
 	def __init__(self, data: dict):
 		self._data = data.get('userProfile', data)
 	
@@ -1316,6 +1319,12 @@ class OnlineMembers:
 		return self._data
 
 class UserProfileList:
+	"""
+	`UserProfileList` - Class representing a list of user profiles.
+
+	Rows are parsed on first use and every column is computed the first time it is read,
+	so reading `userId` from a page does not build the other columns.
+	"""
 	def __init__(self, data: Union[dict, list]) -> None:
 
 		if isinstance(data, dict):
@@ -1323,48 +1332,212 @@ class UserProfileList:
 		else:
 			self._data: List[dict] = data
 
-		parser:							List[UserProfile] = [UserProfile(x) for x in self._data]
-		self.status:					List[int] = [x.status for x in parser]
-		self.mood_sticker:				List[MoodSticker] = [x.mood_sticker for x in parser]
-		self.wiki_count:				List[int] = [x.wiki_count for x in parser]
-		self.consecutive_check_in_days:	List[int] = [x.consecutive_check_in_days for x in parser]
-		self.uid:						List[str] = [x.uid for x in parser]
-		self.userId:					List[str] = self.uid
-		self.modified_time:				List[str] = [x.modified_time for x in parser]
-		self.following_status:			List[int] = [x.following_status for x in parser]
-		self.online_status:				List[int] = [x.online_status for x in parser]
-		self.account_membership_status:	List[int] = [x.account_membership_status for x in parser]
-		self.is_global:					List[bool] = [x.is_global for x in parser]
-		self.avatar_frame_id:			List[str] = [x.avatar_frame_id for x in parser]
-		self.fan_club_list:				List[list] = [x.fan_club_list for x in parser]
-		self.reputation:				List[int] = [x.reputation for x in parser]
-		self.posts_count:				List[int] = [x.posts_count for x in parser]
-		#self.avatar_frame:				List[AvatarFrameList] = [AvatarFrameList(x.avatar_frame.json()) for x in parser]	
-		self.follower_count:			List[int] = [x.follower_count for x in parser]
-		self.nickname:					List[str] = [x.nickname for x in parser]
-		self.username:					List[str] = self.nickname
-		self.media_list:				List[list] = [x.media_list for x in parser]
-		self.icon:						List[str] = [x.icon for x in parser]
-		self.avatar:					List[str] = self.icon
-		self.is_nickname_verified:		List[bool] = [x.is_nickname_verified for x in parser]
-		self.mood:						List[str] = [x.mood for x in parser]
-		self.level:						List[int] = [x.level for x in parser]
-		self.pushEnabled:				List[bool] = [x.push_enabled for x in parser]
-		self.membership_status:			List[int] = [x.membership_status for x in parser]
-		#self.influencer_info:			list = [x.influencer_info for x in parser]
-		self.content:					List[str] = [x.content for x in parser]
-		self.following_count:			List[int] = [x.following_count for x in parser]
-		self.role:						List[int] = [x.role for x in parser]
-		self.comments_count:			List[int] = [x.comments_count for x in parser]
-		self.ndcId:						List[int] = [x.ndcId for x in parser]
-		self.comId:						List[int] = self.ndcId
-		self.created_time:				List[str] = [x.created_time for x in parser]
-		#self.extensions:				List[UserExtensionsList] = [UserExtensionsList(self._data.get("extensions") for y in self._data) for x in parser]
-		self.visit_privacy:				List[int] = [x.visit_privacy for x in parser]
-		self.stories_count:				List[int] = [x.stories_count for x in parser]
-		self.blogs_count:				List[int] = [x.blogs_count for x in parser]
-		self.is_user_hidden:			List[bool] = [x.is_user_hidden for x in parser]
-		self.is_user_banned:			List[bool] = [x.is_user_banned for x in parser]
+	def __iter__(self):
+		return iter(self._rows)
+
+	def __len__(self) -> int:
+		return len(self._data)
+
+	@cached_property
+	def _rows(self) -> List[UserProfile]:
+		return [UserProfile(x) for x in self._data]
+
+	def parser(self) -> List[UserProfile]:
+		"""Returns the list of `UserProfile` objects."""
+		return self._rows
+
+	@cached_property
+	def status(self) -> List[int]:
+		"""Returns a list of statuses"""
+		return [x.status for x in self.parser()]
+
+	@cached_property
+	def mood_sticker(self) -> List[MoodSticker]:
+		"""Returns a list of mood stickers"""
+		return [x.mood_sticker for x in self.parser()]
+
+	@cached_property
+	def wiki_count(self) -> List[int]:
+		"""Returns a list of wiki counts"""
+		return [x.wiki_count for x in self.parser()]
+
+	@cached_property
+	def consecutive_check_in_days(self) -> List[int]:
+		"""Returns a list of consecutive check in days"""
+		return [x.consecutive_check_in_days for x in self.parser()]
+
+	@cached_property
+	def uid(self) -> List[str]:
+		"""Returns a list of user ids"""
+		return [x.uid for x in self.parser()]
+
+	@cached_property
+	def userId(self) -> List[str]:
+		"""Returns a list of user ids"""
+		return self.uid
+
+	@cached_property
+	def modified_time(self) -> List[str]:
+		"""Returns a list of modified times"""
+		return [x.modified_time for x in self.parser()]
+
+	@cached_property
+	def following_status(self) -> List[int]:
+		"""Returns a list of following statuses"""
+		return [x.following_status for x in self.parser()]
+
+	@cached_property
+	def online_status(self) -> List[int]:
+		"""Returns a list of online statuses"""
+		return [x.online_status for x in self.parser()]
+
+	@cached_property
+	def account_membership_status(self) -> List[int]:
+		"""Returns a list of account membership statuses"""
+		return [x.account_membership_status for x in self.parser()]
+
+	@cached_property
+	def is_global(self) -> List[bool]:
+		"""Returns a list of is global flags"""
+		return [x.is_global for x in self.parser()]
+
+	@cached_property
+	def avatar_frame_id(self) -> List[str]:
+		"""Returns a list of avatar frame ids"""
+		return [x.avatar_frame_id for x in self.parser()]
+
+	@cached_property
+	def fan_club_list(self) -> List[list]:
+		"""Returns a list of fan club lists"""
+		return [x.fan_club_list for x in self.parser()]
+
+	@cached_property
+	def reputation(self) -> List[int]:
+		"""Returns a list of reputations"""
+		return [x.reputation for x in self.parser()]
+
+	@cached_property
+	def posts_count(self) -> List[int]:
+		"""Returns a list of posts counts"""
+		return [x.posts_count for x in self.parser()]
+
+	@cached_property
+	def follower_count(self) -> List[int]:
+		"""Returns a list of follower counts"""
+		return [x.follower_count for x in self.parser()]
+
+	@cached_property
+	def nickname(self) -> List[str]:
+		"""Returns a list of nicknames"""
+		return [x.nickname for x in self.parser()]
+
+	@cached_property
+	def username(self) -> List[str]:
+		"""Returns a list of nicknames"""
+		return self.nickname
+
+	@cached_property
+	def media_list(self) -> List[list]:
+		"""Returns a list of media lists"""
+		return [x.media_list for x in self.parser()]
+
+	@cached_property
+	def icon(self) -> List[str]:
+		"""Returns a list of icons"""
+		return [x.icon for x in self.parser()]
+
+	@cached_property
+	def avatar(self) -> List[str]:
+		"""Returns a list of icons"""
+		return self.icon
+
+	@cached_property
+	def is_nickname_verified(self) -> List[bool]:
+		"""Returns a list of is nickname verified flags"""
+		return [x.is_nickname_verified for x in self.parser()]
+
+	@cached_property
+	def mood(self) -> List[str]:
+		"""Returns a list of moods"""
+		return [x.mood for x in self.parser()]
+
+	@cached_property
+	def level(self) -> List[int]:
+		"""Returns a list of levels"""
+		return [x.level for x in self.parser()]
+
+	@cached_property
+	def pushEnabled(self) -> List[bool]:
+		"""Returns a list of push enabled flags"""
+		return [x.push_enabled for x in self.parser()]
+
+	@cached_property
+	def membership_status(self) -> List[int]:
+		"""Returns a list of membership statuses"""
+		return [x.membership_status for x in self.parser()]
+
+	@cached_property
+	def content(self) -> List[str]:
+		"""Returns a list of contents"""
+		return [x.content for x in self.parser()]
+
+	@cached_property
+	def following_count(self) -> List[int]:
+		"""Returns a list of following counts"""
+		return [x.following_count for x in self.parser()]
+
+	@cached_property
+	def role(self) -> List[int]:
+		"""Returns a list of roles"""
+		return [x.role for x in self.parser()]
+
+	@cached_property
+	def comments_count(self) -> List[int]:
+		"""Returns a list of comments counts"""
+		return [x.comments_count for x in self.parser()]
+
+	@cached_property
+	def ndcId(self) -> List[int]:
+		"""Returns a list of community ids"""
+		return [x.ndcId for x in self.parser()]
+
+	@cached_property
+	def comId(self) -> List[int]:
+		"""Returns a list of community ids"""
+		return self.ndcId
+
+	@cached_property
+	def created_time(self) -> List[str]:
+		"""Returns a list of created times"""
+		return [x.created_time for x in self.parser()]
+
+	@cached_property
+	def visit_privacy(self) -> List[int]:
+		"""Returns a list of visit privacies"""
+		return [x.visit_privacy for x in self.parser()]
+
+	@cached_property
+	def stories_count(self) -> List[int]:
+		"""Returns a list of stories counts"""
+		return [x.stories_count for x in self.parser()]
+
+	@cached_property
+	def blogs_count(self) -> List[int]:
+		"""Returns a list of blogs counts"""
+		return [x.blogs_count for x in self.parser()]
+
+	@cached_property
+	def is_user_hidden(self) -> List[bool]:
+		"""Returns a list of is user hidden flags"""
+		return [x.is_user_hidden for x in self.parser()]
+
+	@cached_property
+	def is_user_banned(self) -> List[bool]:
+		"""Returns a list of is user banned flags"""
+		return [x.is_user_banned for x in self.parser()]
+
+	def json(self) -> List[dict]:
+		return self._data
 
 class Pagging:
     def __init__(self, data: dict):
@@ -1388,6 +1561,16 @@ class FollowerList:
         if isinstance(data, dict):
             self.paging = Pagging(self._data)
             self.members = UserProfileList(self._data)
+
+    def __iter__(self):
+        return iter(self.members or [])
+
+    def __len__(self) -> int:
+        return len(self.members or [])
+
+    @property
+    def next_page_token(self) -> Union[str, None]:
+        return self.paging.next_page_token if self.paging else None
     
     def json(self) -> dict:
         return self._data
\ No newline at end of file
@@ -0,0 +1,242 @@
+from enum import Enum
+from collections import deque
+from time import perf_counter
+from threading import Thread, Condition
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+__all__ = (
+    "BackpressurePolicy",
+    "DispatchExecutor",
+    )
+
+class BackpressurePolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class DispatchExecutor:
+    """
+    `DispatchExecutor` - A fixed-size worker pool fed by a bounded, keyed queue.
+
+    Items submitted with the same `key` are handled one at a time in submission order, while
+    items with different keys are handled in parallel. Items without a key have no ordering.
+
+    `**Parameters**``
+    - `handler` - The function every submitted item is passed to.
+    - `workers` - The number of worker threads. `Defaults` to `8`.
+    - `max_queue_size` - The maximum number of pending items. `Defaults` to `1000`.
+    - `policy` - What to do when the queue is full. `Defaults` to `BackpressurePolicy.BLOCK`.
+        - `BLOCK` - The submitter waits until a slot is free.
+        - `DROP_OLDEST` - The next item of the longest waiting key is discarded to make room.
+        - `DROP_NEWEST` - The submitted item is discarded.
+    - `on_error` - Called with the exception when the handler raises. `Defaults` to `None`.
+
+    `**Example**`
+
+    ```py
+    executor = DispatchExecutor(handler=print, workers=4, max_queue_size=100, policy="drop_oldest")
+    executor.submit("Hello World!", key="chatId")
+    print(executor.metrics())
+    ```
+
+    """
+    def __init__(
+        self,
+        handler: Callable[[Any], Any],
+        workers: int = 8,
+        max_queue_size: int = 1000,
+        policy: Union[BackpressurePolicy, str] = BackpressurePolicy.BLOCK,
+        on_error: Optional[Callable[[Exception], Any]] = None
+        ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1.")
+
+        self.handler:           Callable[[Any], Any] = handler
+        self.workers:           int = workers
+        self.max_queue_size:    int = max_queue_size
+        self.policy:            BackpressurePolicy = BackpressurePolicy(policy)
+        self.on_error:          Optional[Callable[[Exception], Any]] = on_error
+
+        self._pending:          Dict[Hashable, deque] = {}
+        self._ready:            deque = deque()
+        self._active:           set = set()
+        self._size:             int = 0
+        self._condition:        Condition = Condition()
+        self._threads:          list = []
+        self._running:          bool = False
+        self._generation:       int = 0
+
+        self.submitted:         int = 0
+        self.processed:         int = 0
+        self.dropped:           int = 0
+        self.errors:            int = 0
+        self.max_queue_depth:   int = 0
+        self.total_latency:     float = 0.0
+        self.max_latency:       float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of items waiting to be handled."""
+        return self._size
+
+    def start(self) -> None:
+        """
+        `start` - Starts the worker threads if they are not running yet.
+
+        Workers of an earlier `shutdown(wait=False)` that are still draining exit once their
+        current item is handled and leave the remaining items to the new workers.
+
+        """
+        with self._condition:
+            if self._running:
+                return None
+            self._running = True
+            self._generation += 1
+            generation = self._generation
+            self._condition.notify_all()
+
+        self._threads = [
+            Thread(target=self._worker, args=(generation,), name=f"pymino-dispatch-{index}", daemon=True)
+            for index in range(self.workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, item: Any, key: Optional[Hashable] = None) -> bool:
+        """
+        `submit` - Queues an item for the workers.
+
+        `**Parameters**``
+        - `item` - The item to pass to the handler.
+        - `key` - Items sharing a key are handled serially and in order. `Defaults` to `None`.
+
+        `**Returns**``
+        - `bool` - `False` if the item was dropped, otherwise `True`.
+
+        """
+        if not self._running:
+            self.start()
+
+        with self._condition:
+            self.submitted += 1
+
+            if self._size >= self.max_queue_size:
+                if self.policy == BackpressurePolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+
+                if self.policy == BackpressurePolicy.DROP_OLDEST:
+                    self._drop_oldest()
+
+                else:
+                    while self._running and self._size >= self.max_queue_size:
+                        self._condition.wait()
+
+            if key is None:
+                key = object()
+
+            if key not in self._pending:
+                self._pending[key] = deque()
+                if key not in self._active:
+                    self._ready.append(key)
+
+            self._pending[key].append(item)
+            self._size += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._size)
+            self._condition.notify_all()
+
+        return True
+
+    def _drop_oldest(self) -> None:
+        key = next(iter(self._pending))
+        items = self._pending[key]
+        items.popleft()
+        self._size -= 1
+        self.dropped += 1
+
+        if not items:
+            del self._pending[key]
+            if key in self._ready:
+                self._ready.remove(key)
+
+    def _worker(self, generation: int) -> None:
+        while True:
+            with self._condition:
+                while self._running and self._generation == generation and not self._ready:
+                    self._condition.wait()
+
+                if self._generation != generation or not self._ready:
+                    return None
+
+                key = self._ready.popleft()
+                items = self._pending[key]
+                item = items.popleft()
+                if not items:
+                    del self._pending[key]
+
+                self._active.add(key)
+                self._size -= 1
+                self._condition.notify_all()
+
+            start = perf_counter()
+            try:
+                self.handler(item)
+            except Exception as e:
+                with self._condition:
+                    self.errors += 1
+                if self.on_error is not None:
+                    self.on_error(e)
+            finally:
+                self._release(key, perf_counter() - start)
+
+    def _release(self, key: Hashable, latency: float) -> None:
+        with self._condition:
+            self._active.discard(key)
+            if key in self._pending:
+                self._ready.append(key)
+                self._condition.notify_all()
+
+            self.processed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def metrics(self) -> dict:
+        """
+        `metrics` - Returns the queue and handler counters.
+
+        `**Returns**``
+        - `dict` - The queue depth, throughput, drop and latency counters. Latencies are in milliseconds.
+
+        """
+        with self._condition:
+            return {
+                "queue_depth": self._size,
+                "max_queue_depth": self.max_queue_depth,
+                "pending_keys": len(self._pending),
+                "active_keys": len(self._active),
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "avg_latency_ms": round(self.total_latency / self.processed * 1000, 3) if self.processed else 0.0,
+                "max_latency_ms": round(self.max_latency * 1000, 3)
+                }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        `shutdown` - Stops the workers once the pending items are handled.
+
+        `**Parameters**``
+        - `wait` - Whether to wait for the workers to finish. `Defaults` to `True`.
+
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -1,6 +1,7 @@
 from .entities import *
 from .utilities.generate import *
-from typing import Any, Callable, TypeVar
+from .utilities.pagination import paginate
+from typing import Any, Callable, Iterator, Optional, TypeVar
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -654,6 +655,37 @@ class Global:
         ))
 
 
+    def iter_chats(
+        self,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[ChatThread]:
+        """
+        Iterates over the global chats the user has joined, page by page.
+
+        :param size: The amount of chats to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of chats to yield. Defaults to `None`, which yields every chat.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An iterator of `ChatThread` objects.
+        :rtype: Iterator[ChatThread]
+
+        **Example usage:**
+
+        >>> for chat in client.iter_chats():
+        ...     print(chat.title)
+        """
+        return paginate(
+            lambda start, size: self.fetch_chats(start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @authenticated
     def fetch_chat(self, chatId: str) -> ChatThread:
         """
@@ -710,6 +742,40 @@ class Global:
         ))
 
 
+    def iter_chat_users(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the members of a global chat, page by page.
+
+        :param chatId: The ID of the chat.
+        :type chatId: str
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.iter_chat_users(chatId="0000-00000-000000-0000"):
+        ...     print(user.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_chat_users(chatId=chatId, start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     @authenticated
     def invite_to_chat(self, chatId: str, userId: Union[str, list]) -> ApiResponse:
         """
@@ -813,6 +879,41 @@ class Global:
         ))
 
 
+    def iter_messages(
+        self,
+        chatId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[CMessage]:
+        """
+        Iterates over the messages of a global chat, newest first, following the `pageToken` of each page.
+
+        :param chatId: The ID of the chat to iterate over.
+        :type chatId: str
+        :param size: The amount of messages to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of messages to yield. Defaults to `None`, which yields every message.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An iterator of `CMessage` objects.
+        :rtype: Iterator[CMessage]
+
+        **Example usage:**
+
+        >>> for message in client.iter_messages(chatId="0000-00000-000000-0000", limit=1000):
+        ...     print(message.content)
+        """
+        return paginate(
+            lambda pageToken, size: self.fetch_messages(chatId=chatId, size=size, pageToken=pageToken),
+            size = size,
+            limit = limit,
+            prefetch = prefetch,
+            token = True
+            )
+
+
     @authenticated
     def fetch_message(self, chatId: str, messageId: str) -> Message:
         """
@@ -894,6 +995,40 @@ class Global:
         ))
 
 
+    def iter_followers(
+        self,
+        userId: str,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the global followers of the specified user, page by page.
+
+        :param userId: The ID of the user whose followers to iterate over.
+        :type userId: str
+        :param size: The amount of followers to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of followers to yield. Defaults to `None`, which yields every follower.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for follower in client.iter_followers(userId="0000-0000-0000-0000"):
+        ...     print(follower.nickname)
+        """
+        return paginate(
+            lambda start, size: self.fetch_followers(userId=userId, start=start, size=size),
+            size = size,
+            limit = limit,
+            prefetch = prefetch
+            )
+
+
     def fetch_following(self, userId: str, start: int = 0, size: int = 25) -> UserProfileList:
         """
         Fetches the user profiles of the users that the specified user is following.
@@ -958,6 +1093,43 @@ class Global:
             url = f"/g/s/user-profile/{userId}/joined?pagingType=t&size={size}&ignoreMembership={1 if ignoreMembership else 0}"
         ))
 
+    def iter_following(
+        self,
+        userId: str,
+        ignoreMembership: bool = True,
+        size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[UserProfile]:
+        """
+        Iterates over the users the specified user is following, following the `pageToken` of each page like `large_fetch_following`.
+
+        :param userId: The ID of the user.
+        :type userId: str
+        :param ignoreMembership: Whether to ignore membership. (Default: True)
+        :type ignoreMembership: bool, optional
+        :param size: The amount of users to fetch per page. Defaults to `100`.
+        :type size: int
+        :param limit: The maximum amount of users to yield. Defaults to `None`, which yields every user.
+        :type limit: Optional[int]
+        :param prefetch: Whether to fetch the next page while the current one is consumed. Defaults to `True`.
+        :type prefetch: bool
+        :return: An iterator of `UserProfile` objects.
+        :rtype: Iterator[UserProfile]
+
+        **Example usage:**
+
+        >>> for user in client.iter_following(userId="0000-0000-0000-0000"):
+        ...     print(user.nickname)
+        """
+        return paginate(
+            lambda pageToken, size: self.large_fetch_following(userId=userId, size=size, pageToken=pageToken, ignoreMembership=ignoreMembership),
+            size = size,
+            limit = limit,
+            prefetch = prefetch,
+            token = True
+            )
+
     def fetch_visitors(self, userId: str, start: int = 0, size: int = 25) -> UserProfileList:
         """
         Fetches the visitors of a user profile.
@@ -1826,12 +1998,13 @@ class Global:
         """
 
         KEY = str((link, "OBJECT_ID"))
-        if not self.cache.get(KEY):
-            self.cache.set(KEY, self.make_request(
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, self.make_request(
                 method = "GET",
                 url = f"/g/s/link-resolution?q={link}"
                 ))
-        return LinkInfo(self.cache.get(KEY)).objectId
+        return LinkInfo(cache.get(KEY)).objectId
 
 
     def fetch_object_info(self, link: str) -> LinkInfo:
@@ -1870,12 +2043,13 @@ class Global:
         """
 
         KEY = str((link, "OBJECT_INFO"))
-        if not self.cache.get(KEY):
-            self.cache.set(KEY, self.make_request(
+        cache = self.cache.namespace("links")
+        if not cache.get(KEY):
+            cache.set(KEY, self.make_request(
                 method = "GET",
                 url = f"/g/s/link-resolution?q={link}"
                 ))
-        return LinkInfo(self.cache.get(KEY))
+        return LinkInfo(cache.get(KEY))
 
     def fetch_public_communities(self, type: str = "discover") -> CCommunityList:
         """
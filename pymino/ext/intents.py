@@ -0,0 +1,83 @@
+from enum import IntFlag
+from typing import Dict, Iterable
+
+from .entities.wsevents import EventTypes, NotifTypes
+
+__all__ = (
+    "Intents",
+    "EVENT_INTENTS",
+    "FRAME_INTENTS",
+    )
+
+class Intents(IntFlag):
+    """
+    `Intents` - The event families a bot subscribes to.
+
+    A bot computes its intents from its registered events; text messages are always
+    included because commands and `help` are read from them. Passing `Intents` to `Bot`
+    restricts the computed intents further. Frames whose family is not subscribed are
+    dropped before any entity is built for them.
+
+    `**Example**`
+
+    ```py
+    bot = Bot(intents=Intents.MESSAGES | Intents.MEMBERS)
+    print(bot.active_intents)
+    ```
+
+    """
+    MESSAGES = 1 << 0
+    MEDIA = 1 << 1
+    MEMBERS = 1 << 2
+    CALLS = 1 << 3
+    CHAT_UPDATES = 1 << 4
+    MODERATION = 1 << 5
+    SYSTEM = 1 << 6
+    NOTIFICATIONS = 1 << 7
+    PRESENCE = 1 << 8
+    AGORA = 1 << 9
+
+    ALL = (1 << 10) - 1
+
+    @classmethod
+    def from_events(cls, events: Iterable[str]) -> "Intents":
+        """
+        `from_events` - Returns the intents needed to receive `events`.
+
+        `**Parameters**``
+        - `events` - The names of the registered events.
+
+        """
+        intents = cls.MESSAGES | cls.AGORA
+        for event in events:
+            intents |= EVENT_INTENTS.get(event, 0)
+        return intents
+
+
+def _family(event: str) -> Intents:
+    if event in {"text_message", "timestamp_message"}:
+        return Intents.MESSAGES
+    if event in {"image_message", "youtube_message", "strike_message", "voice_message", "sticker_message", "share_exurl_message"}:
+        return Intents.MEDIA
+    if event in {"member_join", "member_leave", "chat_invite"}:
+        return Intents.MEMBERS
+    if event.startswith(("vc_", "video_chat_", "avatar_chat_", "screen_room_")):
+        return Intents.CALLS
+    if event in {"delete_message", "text_message_force_removed", "chat_removed_message", "mod_deleted_message"}:
+        return Intents.MODERATION
+    if event in {"welcome_message", "invite_message"}:
+        return Intents.SYSTEM
+    return Intents.CHAT_UPDATES
+
+
+EVENT_INTENTS: Dict[str, Intents] = {
+    **{event: _family(event) for event in EventTypes().events.values()},
+    **{event: Intents.NOTIFICATIONS for event in NotifTypes().notifs.values()},
+    "user_online": Intents.PRESENCE
+    }
+
+FRAME_INTENTS: Dict[int, Intents] = {
+    10: Intents.NOTIFICATIONS,
+    201: Intents.AGORA,
+    400: Intents.PRESENCE
+    }
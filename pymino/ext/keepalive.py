@@ -0,0 +1,153 @@
+from heapq import heappop, heappush
+from itertools import count
+from random import uniform
+from time import monotonic, time
+from contextlib import suppress
+from threading import Condition, Thread
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+__all__ = (
+    "KeepaliveScheduler",
+    )
+
+class KeepaliveScheduler:
+    """
+    `KeepaliveScheduler` - One timer thread that keeps many websocket clients alive.
+
+    A standalone bot runs its own `run_alive_loop` thread. Clients added here share a single
+    timer heap instead. Each client's `t:116` heartbeat and `send_active` call is scheduled on
+    that heap and run on a small shared worker pool. Clients get random offsets so that a
+    fleet does not heartbeat in lockstep.
+
+    `**Parameters**``
+    - `workers` - The number of threads heartbeats and activity updates run on. `Defaults` to `4`.
+    - `ping_interval` - The range of seconds between two heartbeats of a client. `Defaults` to `(25, 50)`.
+    - `activity_interval` - The number of seconds between two activity updates of a client. `Defaults` to `300`.
+    - `active_hours` - The number of hours per day a client is reported online. `Defaults` to `10`.
+
+    """
+    PING = "ping"
+    ACTIVITY = "activity"
+
+    def __init__(
+        self,
+        workers: int = 4,
+        ping_interval: Tuple[float, float] = (25.0, 50.0),
+        activity_interval: float = 300.0,
+        active_hours: float = 10.0
+        ) -> None:
+        self.ping_interval:     Tuple[float, float] = ping_interval
+        self.activity_interval: float = activity_interval
+        self.active_window:     float = active_hours * 3600
+
+        self._clients:          Dict[int, Tuple[Any, float]] = {}
+        self._heap:             List[Tuple[float, int, str, int]] = []
+        self._sequence:         count = count()
+        self._condition:        Condition = Condition()
+        self._executor:         ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="pymino-keepalive")
+        self._thread:           Optional[Thread] = None
+        self._running:          bool = False
+        self._stopped:          bool = False
+
+        self.pings:             int = 0
+        self.activities:        int = 0
+        self.errors:            int = 0
+
+    def _schedule(self, key: int, kind: str, delay: float) -> None:
+        heappush(self._heap, (monotonic() + delay, next(self._sequence), kind, key))
+        self._condition.notify()
+
+    def add(self, client: Any) -> None:
+        """
+        `add` - Starts keeping `client` alive. Adding a client twice has no effect.
+
+        `**Parameters**``
+        - `client` - A connected `Bot`.
+
+        """
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("The keepalive scheduler has been stopped.")
+
+            key = id(client)
+            if key in self._clients:
+                return None
+
+            self._clients[key] = (client, time())
+            self._schedule(key, self.PING, uniform(*self.ping_interval))
+            self._schedule(key, self.ACTIVITY, self.activity_interval + uniform(0, self.ping_interval[0]))
+
+            if not self._running:
+                self._running = True
+                self._thread = Thread(target=self._run, name="pymino-keepalive-timer", daemon=True)
+                self._thread.start()
+
+    def remove(self, client: Any) -> None:
+        """`remove` - Stops keeping `client` alive, its pending timers are dropped."""
+        with self._condition:
+            self._clients.pop(id(client), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and (not self._heap or self._heap[0][0] > monotonic()):
+                    self._condition.wait(self._heap[0][0] - monotonic() if self._heap else None)
+
+                if not self._running:
+                    return None
+
+                _, _, kind, key = heappop(self._heap)
+                if key not in self._clients:
+                    continue
+
+                client, started_at = self._clients[key]
+                if kind == self.PING:
+                    self._schedule(key, kind, uniform(*self.ping_interval))
+                else:
+                    self._schedule(key, kind, self.activity_interval)
+
+            if kind == self.PING:
+                self._executor.submit(self._ping, client)
+            elif (time() - started_at) % 86400 <= self.active_window:
+                self._executor.submit(self._activity, client)
+
+    def _ping(self, client: Any) -> None:
+        try:
+            client._send_message()
+            self.pings += 1
+        except Exception:
+            self.errors += 1
+
+    def _activity(self, client: Any) -> None:
+        try:
+            client._activity_status()
+            self.activities += 1
+        except Exception:
+            self.errors += 1
+
+    def stop(self) -> None:
+        """`stop` - Stops the timer thread and the worker pool."""
+        with self._condition:
+            self._running = False
+            self._stopped = True
+            self._clients.clear()
+            self._heap.clear()
+            self._condition.notify_all()
+
+        with suppress(Exception):
+            self._executor.shutdown(wait=False)
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the number of clients and of heartbeats, activity updates and errors so far."""
+        with self._condition:
+            clients = len(self._clients)
+        return {
+            "clients": clients,
+            "pings": self.pings,
+            "activities": self.activities,
+            "errors": self.errors
+            }
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,267 @@
+from time import sleep
+from random import randint
+from collections import deque
+from threading import Lock
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .entities import CMessage
+from .executor import DispatchExecutor
+from .utilities.cache import MemoryCache
+from .utilities.rate_limit import TokenBucket
+
+__all__ = (
+    "OutgoingMessage",
+    "MessagePipeline",
+    )
+
+class OutgoingMessage:
+    """
+    `OutgoingMessage` - A message waiting in a chat's lane of the `MessagePipeline`.
+
+    `**Parameters**``
+    - `chatId` - The chat the message is sent to.
+    - `comId` - The community of the chat.
+    - `url` - The message endpoint.
+    - `data` - The message payload.
+    - `typing` - Whether the chat shows the bot typing while the message is pending.
+
+    """
+    __slots__ = ("chatId", "comId", "url", "data", "typing", "future")
+
+    def __init__(self, chatId: str, comId: Union[str, int], url: str, data: dict, typing: bool = False) -> None:
+        self.chatId:    str = chatId
+        self.comId:     Union[str, int] = comId
+        self.url:       str = url
+        self.data:      dict = data
+        self.typing:    bool = typing
+        self.future:    Future = Future()
+
+
+class MessagePipeline:
+    """
+    `MessagePipeline` - Sends outgoing chat messages through one ordered lane per chat.
+
+    Messages to the same chat are delivered one at a time in the order they were queued, and
+    different chats are served in parallel by a small worker pool. Each chat has a token bucket
+    that keeps its send rate under `rate` messages per second with bursts of `burst`.
+
+    A lane shows the bot typing once when it starts and stops typing once it is drained, so a
+    burst of replies no longer starts a typing thread per message. With `merge` enabled, plain
+    text messages queued within `window` seconds of each other are joined into one message;
+    every caller still gets the resulting `CMessage`.
+
+    `**Parameters**``
+    - `bot` - The bot whose request handler and websocket the pipeline uses.
+    - `workers` - The number of chats served at once. `Defaults` to `4`.
+    - `rate` - The messages per second sent to one chat. `Defaults` to `2`.
+    - `burst` - The messages one chat may receive back to back. `Defaults` to `5`.
+    - `window` - The seconds a lane waits for more messages before merging them. `Defaults` to `0.05`.
+    - `merge` - Whether plain text messages of a burst are joined into one message. `Defaults` to `False`.
+    - `max_length` - The longest merged message content. `Defaults` to `2000`.
+
+    `**Example**`
+
+    ```py
+    bot.outbox.merge = True
+
+    @bot.command("count")
+    def count(ctx: Context):
+        futures = [ctx.send(str(number), wait=False) for number in range(5)]
+        print([future.result().messageId for future in futures])
+    ```
+
+    """
+    PLAIN_FIELDS = frozenset({"content", "type", "mediaType", "clientRefId", "timestamp", "uid"})
+
+    def __init__(
+        self,
+        bot: Any,
+        workers: int = 4,
+        rate: float = 2.0,
+        burst: float = 5.0,
+        window: float = 0.05,
+        merge: bool = False,
+        max_length: int = 2000
+        ) -> None:
+        self.bot                = bot
+        self.rate:              float = rate
+        self.burst:             float = burst
+        self.window:            float = window
+        self.merge:             bool = merge
+        self.max_length:        int = max_length
+
+        self._lanes:            Dict[str, Deque[OutgoingMessage]] = {}
+        self._typing:           Dict[str, Union[str, int]] = {}
+        self._buckets:          MemoryCache = MemoryCache(max_size=4096, ttl=max(1.0, burst / rate))
+        self._lock:             Lock = Lock()
+        self._executor:         DispatchExecutor = DispatchExecutor(
+                                handler=self._drain,
+                                workers=workers,
+                                max_queue_size=max(1000, workers),
+                                on_error=self._log
+                                )
+
+        self.queued:            int = 0
+        self.sent:              int = 0
+        self.merged:            int = 0
+        self.failed:            int = 0
+        self.typing_updates:    int = 0
+
+    def submit(self, chatId: str, comId: Union[str, int], url: str, data: dict, typing: bool = False) -> Future:
+        """
+        `submit` - Queues a message on its chat's lane.
+
+        `**Parameters**``
+        - `chatId` - The chat the message is sent to.
+        - `comId` - The community of the chat.
+        - `url` - The message endpoint.
+        - `data` - The message payload.
+        - `typing` - Whether the chat shows the bot typing until the lane is drained. `Defaults` to `False`.
+
+        `**Returns**``
+        - `Future` - Resolves to the sent `CMessage`, or to the error that stopped it.
+
+        """
+        message = OutgoingMessage(chatId, comId, url, data, typing)
+
+        with self._lock:
+            self.queued += 1
+            lane = self._lanes.get(chatId)
+            self._lanes.setdefault(chatId, deque()).append(message)
+
+        if lane is None:
+            self._executor.submit(chatId, key=chatId)
+        return message.future
+
+    def send(self, chatId: str, comId: Union[str, int], url: str, data: dict, typing: bool = False) -> CMessage:
+        """`send` - Queues a message and waits until it is sent, same arguments as `submit`."""
+        return self.submit(chatId, comId, url, data, typing).result()
+
+    def start_typing(self, chatId: str, comId: Union[str, int]) -> None:
+        """`start_typing` - Shows the bot typing in a chat, unless it already is."""
+        with self._lock:
+            if chatId in self._typing:
+                return None
+            self._typing[chatId] = comId
+
+        self._send_typing(chatId, comId, True)
+
+    def stop_typing(self, chatId: str) -> None:
+        """`stop_typing` - Stops showing the bot typing in a chat, unless messages are still pending there."""
+        with self._lock:
+            if chatId in self._lanes or chatId not in self._typing:
+                return None
+            comId = self._typing.pop(chatId)
+
+        self._send_typing(chatId, comId, False)
+
+    def _send_typing(self, chatId: str, comId: Union[str, int], start: bool) -> None:
+        send = getattr(self.bot, "send_websocket_message", None)
+        if send is None:
+            return None
+
+        params = {"topicIds": [], "threadType": 2} if start else {"duration": 0, "topicIds": [], "threadType": 2}
+        try:
+            send({
+                "o": {
+                    "actions": ["Typing"],
+                    "target": f"ndc://x{comId}/chat-thread/{chatId}",
+                    "ndcId": comId,
+                    "params": params,
+                    "id": randint(0, 100)
+                    },
+                "t": 304 if start else 306
+                })
+            self.typing_updates += 1
+        except Exception as e:
+            self._log(e)
+
+    def _drain(self, chatId: str) -> None:
+        if self.merge and self.window:
+            sleep(self.window)
+
+        while True:
+            with self._lock:
+                lane = self._lanes.get(chatId)
+                if not lane:
+                    self._lanes.pop(chatId, None)
+                    break
+
+                batch = [lane.popleft()]
+                while self.merge and lane and self._mergeable(batch, lane[0]):
+                    batch.append(lane.popleft())
+
+            if any(message.typing for message in batch):
+                self.start_typing(chatId, batch[0].comId)
+            self._deliver(batch)
+
+        self.stop_typing(chatId)
+
+    def _plain(self, data: dict) -> bool:
+        if data.get("type", 0) != 0 or data.get("mediaType", 0) != 0 or not isinstance(data.get("content"), str):
+            return False
+
+        for key, value in data.items():
+            if key in self.PLAIN_FIELDS or value is None:
+                continue
+            if key == "extensions" and isinstance(value, dict) and not any(value.values()):
+                continue
+            return False
+        return True
+
+    def _mergeable(self, batch: List[OutgoingMessage], message: OutgoingMessage) -> bool:
+        if message.url != batch[0].url or not self._plain(message.data) or not self._plain(batch[0].data):
+            return False
+        return sum(len(queued.data["content"]) + 1 for queued in batch) + len(message.data["content"]) <= self.max_length
+
+    def _bucket(self, chatId: str) -> TokenBucket:
+        bucket = self._buckets.get(chatId, count=False)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=self.rate,
+                capacity=self.burst,
+                min_rate=self.rate,
+                max_rate=self.rate,
+                increase=0.0,
+                backoff=1.0
+                )
+        self._buckets.set(chatId, bucket)
+        return bucket
+
+    def _deliver(self, batch: List[OutgoingMessage]) -> None:
+        data = batch[0].data
+        if len(batch) > 1:
+            data = {**data, "content": "\n".join(message.data["content"] for message in batch)}
+            self.merged += len(batch) - 1
+
+        wait = self._bucket(batch[0].chatId).reserve()
+        if wait: sleep(wait)
+
+        try:
+            message = CMessage(self.bot.request.handler(method="POST", url=batch[0].url, data=data))
+        except Exception as e:
+            self.failed += len(batch)
+            for queued in batch:
+                queued.future.set_exception(e)
+            return None
+
+        self.sent += 1
+        for queued in batch:
+            queued.future.set_result(message)
+
+    def _log(self, error: Exception) -> None:
+        log = getattr(self.bot, "_log", None)
+        if log is not None:
+            log(f"Message pipeline error: {error}")
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the pending chats and the send, merge and typing counters."""
+        return {
+            "chats": len(self._lanes),
+            "queued": self.queued,
+            "sent": self.sent,
+            "merged": self.merged,
+            "failed": self.failed,
+            "typing_updates": self.typing_updates
+            }
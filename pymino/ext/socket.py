@@ -1,26 +1,23 @@
 import signal
 from random import randint
-from typing import Optional
+from typing import Hashable, List, Optional
 from threading import Thread
 from contextlib import suppress
 from urllib.parse import urlencode
 from time import sleep as delay, time
-from json import loads, dumps, JSONDecodeError
 
 from .entities import *
 from .context import EventHandler
 from .dispatcher import MessageDispatcher
-
-if orjson_exists():
-    from orjson import (
-        loads as orjson_loads, dumps as orjson_dumps
-        )
+from .executor import DispatchExecutor
+from .keepalive import KeepaliveScheduler
+from .supervisor import ConnectionSupervisor, FrameDeduplicator
+from .intents import Intents, EVENT_INTENTS, FRAME_INTENTS
+from .utilities.codec import JSONCodec, fetch_codec
 
 try:
     from websocket import WebSocket, WebSocketApp
 except ImportError as e:
-    pipmain(["uninstall", "websocket", "-y"])
-    pipmain(["install", "websocket-client==1.6.1"])
     raise WrongWebSocketPackage from e
 
 
@@ -45,10 +42,24 @@ class WSClient(EventHandler):
         A dictionary containing the notification types.
     dispatcher : MessageDispatcher
         The message dispatcher object.
+    executor : DispatchExecutor
+        The worker pool that incoming websocket frames are handled on.
     channel : Optional[Channel] 
         The agora channel.
     orjson : bool
-        Whether or not orjson is installed.
+        Whether or not orjson is the JSON codec.
+    codec : JSONCodec
+        The JSON codec frames are decoded and encoded with.
+    keepalive : Optional[KeepaliveScheduler]
+        The shared scheduler heartbeats run on, `None` to run a dedicated alive loop.
+    supervisor : ConnectionSupervisor
+        Owns the primary websocket, reconnects it with backoff and resubscribes its topics.
+    shards : List[ConnectionSupervisor]
+        One supervisor per websocket connection, the first one is `supervisor`.
+    deduplicator : FrameDeduplicator
+        Drops frames already received on another shard.
+    frame_prefilter : bool
+        Whether frames no handler is registered for are dropped before they are queued.
 
     """
     __slots__ = (
@@ -58,8 +69,17 @@ class WSClient(EventHandler):
         "is_logging",
         "notif_types",
         "dispatcher",
+        "executor",
         "channel",
-        "orjson"
+        "orjson",
+        "codec",
+        "keepalive",
+        "supervisor",
+        "shards",
+        "deduplicator",
+        "frame_prefilter",
+        "skipped_frames",
+        "_processes_started"
     )
     def __init__(self):
         self.ws:            WebSocketApp = None
@@ -68,19 +88,77 @@ class WSClient(EventHandler):
         self.is_logging:    bool = bool(self.logger)
         self.notif_types:   dict =  NotifTypes().notifs
         self.dispatcher:    MessageDispatcher = MessageDispatcher()
+        self.executor:      DispatchExecutor = DispatchExecutor(
+                            handler=self.dispatcher.handle,
+                            workers=self.dispatch_workers,
+                            max_queue_size=self.dispatch_queue_size,
+                            policy=self.dispatch_policy,
+                            on_error=self.on_dispatch_error
+                            )
         self.channel:       Optional[Channel] = None
-        self.orjson:        bool = orjson_exists()
-
-        self.dispatcher.register(10, self._handle_notification)
+        self.codec:         JSONCodec = fetch_codec()
+        self.orjson:        bool = self.codec.name == "orjson"
+        self.keepalive:     Optional[KeepaliveScheduler] = None
+        self.shards:        List[ConnectionSupervisor] = []
+        self.supervisor:    ConnectionSupervisor = None
+        self.deduplicator:  FrameDeduplicator = FrameDeduplicator()
+        self.frame_prefilter: bool = True
+        self.skipped_frames: int = 0
+        self._processes_started: bool = False
+        self.configure_shards(getattr(self, "websocket_shards", 1))
+
+        self.dispatcher.register(10, self._handle_notification, self._notification_key)
         self.dispatcher.register(201, self._handle_agora_channel)
         self.dispatcher.register(400, self._handle_user_online)
-        self.dispatcher.register(1000, self._handle_message)
+        self.dispatcher.register(1000, self._handle_message, self._message_key)
 
         signal.signal(signal.SIGINT, signal.SIG_DFL)
         EventHandler.__init__(self)
 
+    WS_ENDPOINTS = tuple(f"wss://ws{index}.aminoapps.com" for index in range(1, 5))
+
     def fetch_ws_url(self) -> str:
         return f"wss://ws{randint(1, 4)}.aminoapps.com"
+
+    def configure_shards(self, count: int = 1, offset: Optional[int] = None) -> None:
+        """
+        Sets the number of websocket connections, before the bot connects.
+
+        With one shard the endpoint is picked at random on every connect. With more, shard `i`
+        connects to endpoint `offset + i`, spreading the connections over ws1-ws4.
+
+        :param count: The number of websocket connections.
+        :type count: int
+        :param offset: The first endpoint to use, e.g. to spread a fleet's accounts. Defaults to random.
+        :type offset: Optional[int]
+        :return: None
+
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        if any(shard.running for shard in self.shards):
+            raise RuntimeError("Shards cannot be changed while the websocket is running.")
+
+        if count == 1 and offset is None:
+            endpoints = [None]
+        else:
+            offset = randint(0, len(self.WS_ENDPOINTS) - 1) if offset is None else offset
+            endpoints = [self.WS_ENDPOINTS[(offset + index) % len(self.WS_ENDPOINTS)] for index in range(count)]
+
+        self.shards = [ConnectionSupervisor(self, endpoint=endpoint) for endpoint in endpoints]
+        self.supervisor = self.shards[0]
+
+    def fetch_shard(self, ws: WebSocket) -> ConnectionSupervisor:
+        """Returns the shard a websocket belongs to."""
+        for shard in self.shards:
+            if shard.ws is ws:
+                return shard
+        return self.supervisor
+
+    def shard_for(self, ndcId: int) -> ConnectionSupervisor:
+        """Returns the shard a community's topics are subscribed on."""
+        return self.shards[hash(ndcId) % len(self.shards)]
     
     def _log(self, message: str) -> None:
         """
@@ -103,28 +181,38 @@ class WSClient(EventHandler):
         return self.emit("ready")
 
     def run_forever(self) -> None:
-        """Runs the websocket forever."""
+        """Runs the websocket forever, reconnecting it whenever it drops."""
         self._log("Initializing websocket.")
-        ws_data = f"{self.generate.device_id()}|{int(time() * 1000)}"
-        self.ws = WebSocketApp(
-            url = f"{self.fetch_ws_url()}/?{urlencode({'signbody': ws_data})}",
+        for shard in self.shards:
+            shard.start()
+        self.start_processes()
+        return self._log("Websocket connected.")
+
+    def create_websocket(self, endpoint: Optional[str] = None) -> WebSocketApp:
+        """Creates a websocket signed with the current session, called by the supervisor on every (re)connect."""
+        device = self.request.device or self.request.device_pool.get()
+        ws_data = f"{device}|{int(time() * 1000)}"
+        return WebSocketApp(
+            url = f"{endpoint or self.fetch_ws_url()}/?{urlencode({'signbody': ws_data})}",
             on_open=self.on_websocket_open,
             on_message=self.on_websocket_message,
             on_error=self.on_websocket_error,
             on_close=self.on_websocket_close,
+            on_pong=self.on_websocket_pong,
             header={
-            "NDCDEVICEID": self.generate.device_id(),
+            "NDCDEVICEID": device,
             "NDCAUTH": f"sid={self.sid}",
             "NDC-MSG-SIG": self.generate.signature(ws_data)
             })
-        
-        self.start_processes()
-        return self._log("Websocket connected.")
 
     def start_processes(self) -> None:
-        """Starts the websocket processes."""
-        websocket_thread = Thread(target=self.ws.run_forever)
-        websocket_thread.start()
+        """Starts the keepalive processes, the alive thread once per client."""
+        if self.keepalive is not None:
+            return self.keepalive.add(self)
+
+        if self._processes_started:
+            return None
+        self._processes_started = True
 
         aalive_thread = Thread(target=run_alive_loop, args=(self,))
         aalive_thread.start()
@@ -137,17 +225,137 @@ class WSClient(EventHandler):
         return self._log(f"Websocket error: {error}")
 
     def on_websocket_message(self, ws: WebSocket, message: str) -> None:
-        """Receives websocket messages."""
-        return Thread(target=self._handle_websocket_message, args=(message,)).start()
+        """Receives websocket messages and queues them, keeping messages from the same chat in order."""
+        self.fetch_shard(ws).received()
+
+        if self.frame_prefilter and self.codec.typed:
+            if self._skip_frame(self.codec.decode(message, "frame")):
+                self.skipped_frames += 1
+                return None
+            raw_message = self._decode_websocket_message(message)
+
+        else:
+            raw_message = self._decode_websocket_message(message)
+            if self.frame_prefilter and self._skip_frame(raw_message):
+                self.skipped_frames += 1
+                return None
+
+        if len(self.shards) > 1 and self.deduplicator.seen(self._frame_key(raw_message, message)):
+            return None
+
+        if self.intents and raw_message.get("t") == 1000:
+            self._feed_waiters(raw_message)
+
+        if not self.executor.submit(raw_message, key=self.dispatcher.fetch_key(raw_message)):
+            self._log("Websocket message dropped, dispatch queue is full.")
+
+    @property
+    def active_intents(self) -> Intents:
+        """The event families frames are received for: the registered events, limited by `intents` if it is an `Intents`."""
+        if self._active_intents is None:
+            intents = Intents.from_events(self._events)
+            if isinstance(self.intents, Intents):
+                intents &= self.intents
+            self._active_intents = intents
+        return self._active_intents
+
+    def _skip_frame(self, message: dict) -> bool:
+        """
+        Returns True if a frame would be ignored by its handler, reading only its routing fields.
+
+        Skipped frames never reach the dispatch queue and no entity is built for them. Frames
+        outside `active_intents` are dropped, chat messages are also dropped when they are the
+        bot's own or map to no registered event. Text messages are kept for commands and
+        anything that cannot be read is kept.
+        """
+        t = message.get("t")
+        if t != 1000:
+            if t not in self.dispatcher.dispatch_table:
+                return True
+            return not FRAME_INTENTS.get(t, Intents.ALL) & self.active_intents
+
+        try:
+            payload = message["o"]
+            chat_message = payload["chatMessage"]
+            key = self.event_types.get(f"{chat_message['type']}:{chat_message['mediaType']}")
+            userId = chat_message["author"]["uid"]
+        except (KeyError, TypeError):
+            return False
+
+        if userId == self.userId:
+            return True
+
+        if EVENT_INTENTS.get(key, 0) & self.active_intents and (key == "text_message" or key in self._events):
+            return False
+
+        ndcId = payload.get("ndcId")
+        if ndcId: self._communities.add(ndcId)
+        return True
+
+    def on_dispatch_error(self, error: Exception) -> None:
+        """Handles errors raised while dispatching websocket messages."""
+        with suppress(KeyError):
+            self._events["error"](error)
+
+        return self._log(f"Dispatch error: {error}")
+
+    def dispatch_metrics(self) -> dict:
+        """Returns the queue depth and handler latency counters of the dispatch executor, and the number of frames skipped before they were queued."""
+        return {**self.executor.metrics(), "skipped_frames": self.skipped_frames}
+
+    def on_websocket_pong(self, ws: WebSocket, data: bytes) -> None:
+        """Marks the shard that received a pong as alive."""
+        return self.fetch_shard(ws).received()
+
+    def _frame_key(self, message: dict, raw: str) -> Hashable:
+        """Identifies a frame across shards: chat messages by ID, anything else by its content."""
+        with suppress(KeyError, TypeError):
+            if message["t"] == 1000:
+                return ("message", message["o"]["chatMessage"]["messageId"])
+        return raw
+
+    def websocket_metrics(self) -> dict:
+        """Returns the connection state, uptime and reconnect counters of the websocket, per shard when sharded."""
+        if len(self.shards) == 1:
+            return self.supervisor.metrics()
+
+        return {
+            "shards": [shard.metrics() for shard in self.shards],
+            "duplicates": self.deduplicator.duplicates
+            }
+
+    def _decode_websocket_message(self, message: str) -> dict:
+        """Decodes a websocket message."""
+        return self.codec.loads(message)
 
     def _handle_websocket_message(self, message: str) -> None:
         """Handles websocket messages."""        
-        try:
-            raw_message = orjson_loads(message) if self.orjson else loads(message)
-        except JSONDecodeError:
-            raw_message = loads(message)
+        return self.dispatcher.handle(self._decode_websocket_message(message))
+
+    def _feed_waiters(self, message: dict) -> None:
+        """Resolves `wait_for_message` waiters as soon as a text message arrives, ahead of the chat's queue."""
+        with suppress(KeyError, TypeError, AttributeError):
+            chat_message = message["o"]["chatMessage"]
+            content = chat_message.get("content")
+            userId = chat_message["author"]["uid"]
+
+            if any([
+                content is None,
+                userId == self.userId,
+                self.event_types.get(f"{chat_message.get('type')}:{chat_message.get('mediaType')}") != "text_message",
+                self.command_exists(command_name=content[len(self.command_prefix):].split(" ")[0])
+                ]):
+                return None
 
-        return self.dispatcher.handle(raw_message)
+            self._add_cache(chat_message["threadId"], userId, content)
+
+    def _message_key(self, message: dict) -> tuple:
+        """Chat messages are handled in order per chat."""
+        return ("chat", message["o"]["chatMessage"]["threadId"])
+
+    def _notification_key(self, message: dict) -> tuple:
+        """Notifications are handled in order per community."""
+        return ("community", message["o"]["payload"]["ndcId"])
 
     def _handle_message(self, message: dict) -> None:
         """Sends the message to the event handler."""
@@ -178,30 +386,35 @@ class WSClient(EventHandler):
         return self._handle_event("user_online", OnlineMembers(message))
 
     def on_websocket_close(self, ws: WebSocket, close_status_code: int, close_msg: str) -> None:
-        """Handles websocket close events."""
-        if [close_status_code, close_msg] == [None, None]:
-            self._log("Websocket closed unexpectedly.")
-            return self.run_forever()
+        """Handles websocket close events, the supervisor reconnects unless the websocket was stopped."""
+        self.fetch_shard(ws).closed(close_status_code, close_msg)
+        self._log(f"Websocket closed ({close_status_code}, {close_msg}).")
 
-    def send_websocket_message(self, message: dict) -> None:
-        """Sends a websocket message."""
-        return self.ws.send(orjson_dumps(message).decode() if self.orjson else dumps(message))
+    def send_websocket_message(self, message: dict, ws: Optional[WebSocketApp] = None) -> None:
+        """Sends a websocket message, over the primary websocket unless `ws` is given."""
+        return (ws or self.ws).send(self.codec.dumps(message).decode())
 
     def stop_websocket(self) -> None:
         """Stops the websocket."""
         self._log("Websocket received stop signal.")
-        return self.ws.close()
+        if self.keepalive is not None:
+            self.keepalive.remove(self)
+        for shard in self.shards:
+            shard.stop()
+        return self.executor.shutdown(wait=False)
 
     def on_websocket_open(self, ws: WebSocket) -> None:
-        """Handles websocket open events."""
-        if all([self.community_id != None, "user_online" in self._events]):
-            return self.send_websocket_message({
-                "t": 300,
-                "o": {
-                    "ndcId": self.community_id,
-                    "topic": f"ndtopic:x{self.community_id}:online-members",
-                    "id": int(time() * 1000)
-                }})
+        """Handles websocket open events, subscribing to the topics of the previous connection again."""
+        shard = self.fetch_shard(ws)
+
+        if all([self.community_id != None, "user_online" in self._events, self.shard_for(self.community_id) is shard]):
+            shard.subscribe(self.community_id, f"ndtopic:x{self.community_id}:online-members")
+
+        return shard.opened()
+
+    def subscribe_topic(self, ndcId: int, topic: str) -> None:
+        """Subscribes to a websocket topic on the community's shard, it is subscribed again after every reconnect."""
+        return self.shard_for(ndcId).subscribe(ndcId, topic)
 
     def _last_active(self, last_activity_time: float) -> bool:
         """Returns True if the last activity was 5 minutes ago."""""
@@ -212,12 +425,18 @@ class WSClient(EventHandler):
         return time() - last_message_time >= 30
 
     def _send_message(self) -> None:
-        self.send_websocket_message({
-            "o":{
-                "threadChannelUserInfoList": [],
-                "id": randint(1, 100)},
-                "t": 116
-                })
+        for shard in self.shards:
+            if not shard.connected:
+                continue
+
+            with suppress(Exception):
+                shard.send({
+                    "o":{
+                        "threadChannelUserInfoList": [],
+                        "id": randint(1, 100)},
+                        "t": 116
+                        })
+                shard.heartbeat()
 
     def _activity_status(self) -> None:
         """Sets the user's activity status to online."""
@@ -0,0 +1,253 @@
+from random import uniform
+from time import monotonic, time
+from contextlib import suppress
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+__all__ = (
+    "ConnectionSupervisor",
+    "FrameDeduplicator",
+    )
+
+class ConnectionSupervisor:
+    """
+    `ConnectionSupervisor` - Keeps exactly one websocket of a client connected.
+
+    One supervisor thread creates the socket, runs it until it closes, and then reconnects.
+    Reconnects wait an exponential backoff with jitter, and the backoff resets once a
+    connection has stayed up for `stable_after` seconds. Every new socket is signed again,
+    so it uses the client's current `sid`.
+
+    A watchdog thread closes connections that have gone stale. A connection is stale when a
+    `t:116` heartbeat was sent and no frame or pong arrived within `stale_after` seconds. The
+    topics subscribed with `subscribe`, such as the `t:300` online-members topic, are sent
+    again on every new connection.
+
+    `**Parameters**``
+    - `client` - The `WSClient` whose websocket is supervised.
+    - `endpoint` - The websocket url to connect to, `None` for a random `ws1`-`ws4` endpoint. `Defaults` to `None`.
+    - `base_delay` - The delay before the first reconnect in seconds. `Defaults` to `1`.
+    - `max_delay` - The longest delay between two reconnects in seconds. `Defaults` to `60`.
+    - `stable_after` - The uptime in seconds after which the backoff resets. `Defaults` to `60`.
+    - `stale_after` - The seconds without any frame after a heartbeat before the connection is dropped. `Defaults` to `60`.
+    - `ping_interval` - The seconds between websocket pings, `0` to disable. `Defaults` to `30`.
+    - `ping_timeout` - The seconds to wait for a pong. `Defaults` to `10`.
+
+    """
+    def __init__(
+        self,
+        client: Any,
+        endpoint: Optional[str] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        stable_after: float = 60.0,
+        stale_after: float = 60.0,
+        ping_interval: float = 30.0,
+        ping_timeout: float = 10.0
+        ) -> None:
+        self.client             = client
+        self.endpoint:          Optional[str] = endpoint
+        self.ws                 = None
+        self.base_delay:        float = base_delay
+        self.max_delay:         float = max_delay
+        self.stable_after:      float = stable_after
+        self.stale_after:       float = stale_after
+        self.ping_interval:     float = ping_interval
+        self.ping_timeout:      float = ping_timeout
+
+        self.topics:            Dict[Tuple[int, str], dict] = {}
+        self._lock:             Lock = Lock()
+        self._stopping:         Event = Event()
+        self._thread:           Optional[Thread] = None
+        self._watchdog:         Optional[Thread] = None
+        self._attempt:          int = 0
+
+        self.connected_at:      Optional[float] = None
+        self.last_received:     float = 0.0
+        self.last_heartbeat:    float = 0.0
+        self.connects:          int = 0
+        self.reconnects:        int = 0
+        self.stale:             int = 0
+        self.total_uptime:      float = 0.0
+        self.last_uptime:       float = 0.0
+        self.last_error:        Optional[str] = None
+        self.last_close:        Optional[Tuple[Optional[int], Optional[str]]] = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the websocket is open."""
+        return self.connected_at is not None
+
+    @property
+    def running(self) -> bool:
+        """Whether the supervisor thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """`start` - Starts the supervisor and watchdog threads. Starting a running supervisor has no effect."""
+        if self.running:
+            return None
+
+        self._stopping.clear()
+        self._thread = Thread(target=self._run, name="pymino-websocket")
+        self._thread.start()
+
+        if self._watchdog is None or not self._watchdog.is_alive():
+            self._watchdog = Thread(target=self._watch, name="pymino-websocket-watchdog", daemon=True)
+            self._watchdog.start()
+
+    def stop(self) -> None:
+        """`stop` - Closes the websocket and stops reconnecting."""
+        self._stopping.set()
+        with suppress(Exception):
+            self.ws.close()
+
+    def backoff(self) -> float:
+        """`backoff` - Returns the delay before the next reconnect, between half and all of the exponential backoff."""
+        delay = min(self.max_delay, self.base_delay * 2 ** self._attempt)
+        return uniform(delay / 2, delay)
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            connects = self.connects
+            try:
+                self.ws = ws = self.client.create_websocket(self.endpoint)
+                if self.client.supervisor is self:
+                    self.client.ws = ws
+                ws.run_forever(ping_interval=self.ping_interval, ping_timeout=self.ping_timeout or None)
+            except Exception as e:
+                self.last_error = str(e)
+                self.client._log(f"Websocket failed: {e}")
+
+            self.closed()
+            if self._stopping.is_set():
+                break
+
+            uptime = self.last_uptime if self.connects > connects else 0.0
+
+            self._attempt = 0 if uptime >= self.stable_after else self._attempt + 1
+            delay = self.backoff()
+            self.reconnects += 1
+            self.client._log(f"Websocket reconnecting in {delay:.2f}s.")
+            self._stopping.wait(delay)
+
+    def _watch(self) -> None:
+        interval = max(1.0, min(self.stale_after / 4, 5.0))
+        while not self._stopping.wait(interval):
+            if not self.connected or self.last_heartbeat <= self.last_received:
+                continue
+
+            if monotonic() - self.last_heartbeat > self.stale_after:
+                self.stale += 1
+                self.client._log("Websocket connection is stale, reconnecting.")
+                with suppress(Exception):
+                    self.ws.close()
+
+    def opened(self) -> None:
+        """`opened` - Marks the websocket as connected and subscribes its topics again."""
+        now = monotonic()
+        self.connected_at = self.last_received = now
+        self.connects += 1
+        self.resubscribe()
+
+    def closed(self, code: Optional[int] = None, message: Optional[str] = None) -> None:
+        """`closed` - Marks the websocket as disconnected and records how long it was up."""
+        with self._lock:
+            if code is not None or message is not None:
+                self.last_close = (code, message)
+
+            if self.connected_at is None:
+                return None
+
+            self.last_uptime = monotonic() - self.connected_at
+            self.total_uptime += self.last_uptime
+            self.connected_at = None
+
+    def received(self, *args) -> None:
+        """`received` - Marks the connection as alive, called for every frame and pong."""
+        self.last_received = monotonic()
+
+    def heartbeat(self) -> None:
+        """`heartbeat` - Records that a `t:116` heartbeat was sent."""
+        self.last_heartbeat = monotonic()
+
+    def subscribe(self, ndcId: int, topic: str) -> None:
+        """
+        `subscribe` - Subscribes to a `t:300` topic now and after every reconnect.
+
+        `**Parameters**``
+        - `ndcId` - The community ID of the topic.
+        - `topic` - The topic, e.g. `ndtopic:x{ndcId}:online-members`.
+
+        """
+        message = {"t": 300, "o": {"ndcId": ndcId, "topic": topic}}
+        with self._lock:
+            self.topics[(ndcId, topic)] = message
+
+        if self.connected:
+            self._send_topic(message)
+
+    def unsubscribe(self, ndcId: int, topic: str) -> None:
+        """`unsubscribe` - Stops subscribing to a topic on reconnect."""
+        with self._lock:
+            self.topics.pop((ndcId, topic), None)
+
+    def resubscribe(self) -> None:
+        """`resubscribe` - Sends every subscribed topic again."""
+        with self._lock:
+            messages = list(self.topics.values())
+
+        for message in messages:
+            self._send_topic(message)
+
+    def send(self, message: dict) -> None:
+        """`send` - Sends a message over this connection."""
+        return self.client.send_websocket_message(message, ws=self.ws)
+
+    def _send_topic(self, message: dict) -> None:
+        with suppress(Exception):
+            self.send({"t": message["t"], "o": {**message["o"], "id": int(time() * 1000)}})
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the connection state, uptime and reconnect counters."""
+        uptime = monotonic() - self.connected_at if self.connected_at is not None else 0.0
+        return {
+            "endpoint": self.endpoint,
+            "connected": self.connected,
+            "uptime": round(uptime, 3),
+            "total_uptime": round(self.total_uptime + uptime, 3),
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "stale": self.stale,
+            "topics": len(self.topics),
+            "last_close": self.last_close,
+            "last_error": self.last_error
+            }
+
+
+class FrameDeduplicator:
+    """
+    `FrameDeduplicator` - Remembers the most recent frame keys to drop frames received on several shards.
+
+    `**Parameters**``
+    - `size` - The number of keys remembered. `Defaults` to `4096`.
+
+    """
+    def __init__(self, size: int = 4096) -> None:
+        self.size:          int = size
+        self.duplicates:    int = 0
+        self._seen:         OrderedDict = OrderedDict()
+        self._lock:         Lock = Lock()
+
+    def seen(self, key: Hashable) -> bool:
+        """`seen` - Returns whether `key` was seen recently, remembering it if not."""
+        with self._lock:
+            if key in self._seen:
+                self.duplicates += 1
+                return True
+
+            self._seen[key] = None
+            if len(self._seen) > self.size:
+                self._seen.popitem(last=False)
+            return False
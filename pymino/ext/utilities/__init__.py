@@ -1,6 +1,16 @@
 from .menu import *
+from .bulk import *
+from .cache import *
+from .codec import *
+from .media import *
+from .transport import *
 from .generate import *
 from .commands import *
+from .pagination import *
+from .rate_limit import *
+from .device import *
+from .retry import *
+from .cooldown import *
 from .chat_console import *
 from .request_handler import *
 from .profile_console import *
@@ -0,0 +1,171 @@
+from time import monotonic, sleep
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from asyncio import Semaphore, gather, sleep as async_sleep
+from typing import Any, Awaitable, Callable, Hashable, Iterable, List, Optional
+
+__all__ = (
+    "BulkResult",
+    "fetch_bulk",
+    "afetch_bulk",
+    )
+
+class BulkResult:
+    """
+    `BulkResult` - The outcome of one item of a bulk fetch.
+
+    `**Parameters**``
+    - `id` - The requested ID.
+    - `value` - The fetched object, `None` if the request failed. `Defaults` to `None`.
+    - `error` - The exception raised while fetching, `None` on success. `Defaults` to `None`.
+    - `cached` - Whether the value came from the cache. `Defaults` to `False`.
+
+    """
+    __slots__ = ("id", "value", "error", "cached")
+
+    def __init__(self, id: Hashable, value: Any = None, error: Optional[Exception] = None, cached: bool = False) -> None:
+        self.id:        Hashable = id
+        self.value:     Any = value
+        self.error:     Optional[Exception] = error
+        self.cached:    bool = cached
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was fetched successfully."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"<BulkResult id={self.id!r} ok={self.ok} cached={self.cached}>"
+
+
+class _Throttle:
+    """Spaces calls so that at most `rate` start per second across threads."""
+    def __init__(self, rate: Optional[float]) -> None:
+        self.interval:  float = 1 / rate if rate else 0.0
+        self.next_at:   float = 0.0
+        self.lock:      Lock = Lock()
+
+    def delay(self) -> float:
+        if not self.interval:
+            return 0.0
+
+        with self.lock:
+            now = monotonic()
+            wait = max(0.0, self.next_at - now)
+            self.next_at = max(now, self.next_at) + self.interval
+            return wait
+
+
+def _unique(ids: Iterable[Hashable]) -> List[Hashable]:
+    return list(dict.fromkeys(ids))
+
+
+def fetch_bulk(
+    fetch: Callable[[Hashable], Any],
+    ids: Iterable[Hashable],
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    cache: Optional[Any] = None,
+    cache_key: Callable[[Hashable], Hashable] = lambda id: id,
+    dump: Callable[[Any], Any] = lambda value: value.json(),
+    load: Callable[[Any], Any] = lambda value: value
+    ) -> List[BulkResult]:
+    """
+    `fetch_bulk` - Fetches many IDs in parallel on a thread pool.
+
+    IDs are deduplicated, results are returned in input order (duplicates share a result) and
+    errors are returned per item instead of being raised.
+
+    `**Parameters**``
+    - `fetch` - Called with one ID, returns the fetched object.
+    - `ids` - The IDs to fetch.
+    - `concurrency` - The maximum number of requests in flight. `Defaults` to `8`.
+    - `rate_limit` - The maximum number of requests started per second. `Defaults` to `None`.
+    - `cache` - A cache namespace to read and store resolved objects. `Defaults` to `None`.
+    - `cache_key` - Maps an ID to its cache key. `Defaults` to the ID itself.
+    - `dump` - Converts a fetched object to its cached form. `Defaults` to `value.json()`.
+    - `load` - Rebuilds an object from its cached form. `Defaults` to the cached value itself.
+
+    """
+    ids = list(ids)
+    results = {}
+    pending = []
+
+    for id in _unique(ids):
+        cached = cache.get(cache_key(id)) if cache is not None else None
+        if cached is not None:
+            results[id] = BulkResult(id, load(cached), cached=True)
+        else:
+            pending.append(id)
+
+    throttle = _Throttle(rate_limit)
+
+    def task(id: Hashable) -> BulkResult:
+        wait = throttle.delay()
+        if wait: sleep(wait)
+
+        try:
+            value = fetch(id)
+        except Exception as e:
+            return BulkResult(id, error=e)
+
+        if cache is not None:
+            cache.set(cache_key(id), dump(value))
+        return BulkResult(id, value)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pending))), thread_name_prefix="pymino-bulk") as executor:
+            for result in executor.map(task, pending):
+                results[result.id] = result
+
+    return [results[id] for id in ids]
+
+
+async def afetch_bulk(
+    fetch: Callable[[Hashable], Awaitable[Any]],
+    ids: Iterable[Hashable],
+    concurrency: int = 8,
+    rate_limit: Optional[float] = None,
+    cache: Optional[Any] = None,
+    cache_key: Callable[[Hashable], Hashable] = lambda id: id,
+    dump: Callable[[Any], Any] = lambda value: value.json(),
+    load: Callable[[Any], Any] = lambda value: value
+    ) -> List[BulkResult]:
+    """
+    `afetch_bulk` - Async version of `fetch_bulk`, `fetch` must be a coroutine function.
+
+    Requests share the async session and at most `concurrency` are awaited at once.
+
+    """
+    ids = list(ids)
+    results = {}
+    pending = []
+
+    for id in _unique(ids):
+        cached = cache.get(cache_key(id)) if cache is not None else None
+        if cached is not None:
+            results[id] = BulkResult(id, load(cached), cached=True)
+        else:
+            pending.append(id)
+
+    throttle = _Throttle(rate_limit)
+    semaphore = Semaphore(max(1, concurrency))
+
+    async def task(id: Hashable) -> BulkResult:
+        async with semaphore:
+            wait = throttle.delay()
+            if wait: await async_sleep(wait)
+
+            try:
+                value = await fetch(id)
+            except Exception as e:
+                return BulkResult(id, error=e)
+
+        if cache is not None:
+            cache.set(cache_key(id), dump(value))
+        return BulkResult(id, value)
+
+    for result in await gather(*(task(id) for id in pending)):
+        results[result.id] = result
+
+    return [results[id] for id in ids]
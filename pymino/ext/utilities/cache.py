@@ -0,0 +1,399 @@
+from time import monotonic, time
+from threading import RLock
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from diskcache import Cache
+
+__all__ = (
+    "CachePolicy",
+    "MemoryCache",
+    "CacheNamespace",
+    "TieredCache",
+    )
+
+_MISSING = object()
+
+class CachePolicy:
+    """
+    `CachePolicy` - How a cache namespace stores its entries.
+
+    `**Parameters**``
+    - `ttl` - How long entries live in seconds, `None` keeps them until evicted. `Defaults` to `None`.
+    - `max_size` - The maximum number of entries kept in memory. `Defaults` to `1024`.
+    - `persist` - Whether entries are also written to the disk and shared tiers. `Defaults` to `True`.
+
+    """
+    __slots__ = ("ttl", "max_size", "persist")
+
+    def __init__(self, ttl: Optional[float] = None, max_size: int = 1024, persist: bool = True) -> None:
+        self.ttl:       Optional[float] = ttl
+        self.max_size:  int = max_size
+        self.persist:   bool = persist
+
+    def __repr__(self) -> str:
+        return f"<CachePolicy ttl={self.ttl} max_size={self.max_size} persist={self.persist}>"
+
+
+class MemoryCache:
+    """
+    `MemoryCache` - A thread-safe, process-local LRU cache with per-entry expiry.
+
+    `**Parameters**``
+    - `max_size` - The maximum number of entries, the least recently used entry is evicted first. `Defaults` to `1024`.
+    - `ttl` - The default lifetime of an entry in seconds, `None` never expires. `Defaults` to `None`.
+
+    """
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None) -> None:
+        self.max_size:      int = max_size
+        self.ttl:           Optional[float] = ttl
+        self._data:         OrderedDict = OrderedDict()
+        self._lock:         RLock = RLock()
+
+        self.hits:          int = 0
+        self.misses:        int = 0
+        self.evictions:     int = 0
+        self.expirations:   int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: Any, default: Any = None, count: bool = True) -> Any:
+        """`get` - Returns the value of `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+
+            if entry is not _MISSING and entry[1] is not None and entry[1] <= monotonic():
+                del self._data[key]
+                self.expirations += 1
+                entry = _MISSING
+
+            if entry is _MISSING:
+                if count: self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            if count: self.hits += 1
+            return entry[0]
+
+    def set(self, key: Any, value: Any, expire: Optional[float] = None) -> None:
+        """`set` - Stores `value` under `key`, expiring after `expire` seconds or the default `ttl`."""
+        expire = self.ttl if expire is None else expire
+
+        with self._lock:
+            self._data[key] = (value, None if expire is None else monotonic() + expire)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """`pop` - Removes `key` and returns its value, or `default` if it is missing or expired."""
+        with self._lock:
+            value = self.get(key, _MISSING, count=False)
+            self._data.pop(key, None)
+            return default if value is _MISSING else value
+
+    def delete(self, key: Any) -> bool:
+        """`delete` - Removes `key`, returns whether it was present."""
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def expire(self) -> int:
+        """`expire` - Removes every expired entry and returns how many were removed."""
+        now = monotonic()
+        with self._lock:
+            expired = [key for key, (_, expires) in self._data.items() if expires is not None and expires <= now]
+            for key in expired:
+                del self._data[key]
+            self.expirations += len(expired)
+            return len(expired)
+
+    def clear(self) -> None:
+        """`clear` - Removes every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """`stats` - Returns the size, hit, miss, eviction and expiration counters."""
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+            }
+
+
+class CacheNamespace:
+    """
+    `CacheNamespace` - A view of a `TieredCache` with its own key space and `CachePolicy`.
+
+    Lookups go through the in-memory tier first and fall back to the disk and shared tiers,
+    promoting whatever they find for the rest of its lifetime on disk, or the policy's `ttl` when
+    the tier does not know it. Writes go to every tier the policy persists to.
+
+    `**Parameters**``
+    - `name` - The name of the namespace, used to prefix keys in the persistent tiers.
+    - `policy` - The policy of the namespace.
+    - `cache` - The `TieredCache` the namespace belongs to.
+
+    Namespaces in `LEGACY_NAMESPACES` also find the unprefixed keys written to the disk cache
+    by earlier versions and move them under their prefixed key when read.
+
+    """
+    LEGACY_NAMESPACES = frozenset({"default", "links", "communities"})
+
+    def __init__(self, name: str, policy: CachePolicy, cache: "TieredCache") -> None:
+        self.name:          str = name
+        self.policy:        CachePolicy = policy
+        self.memory:        MemoryCache = MemoryCache(max_size=policy.max_size, ttl=policy.ttl)
+        self._cache:        "TieredCache" = cache
+
+        self.disk_hits:     int = 0
+        self.shared_hits:   int = 0
+
+    def __enter__(self) -> "CacheNamespace":
+        return self
+
+    def __exit__(self, *args) -> None:
+        return None
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def _key(self, key: Any) -> str:
+        return f"{self.name}:{key}"
+
+    def _tiers(self) -> list:
+        if not self.policy.persist:
+            return []
+        return [tier for tier in (self._cache.disk, self._cache.shared) if tier is not None]
+
+    def _read(self, tier: Any, key: Any) -> tuple:
+        """Returns the value of `key` in `tier` and the seconds it has left, `None` if unknown."""
+        if tier is not self._cache.disk:
+            return tier.get(self._key(key), _MISSING), None
+
+        value, expires = tier.get(self._key(key), _MISSING, expire_time=True)
+        legacy = value is _MISSING and self.name in self.LEGACY_NAMESPACES
+        if legacy:
+            value, expires = tier.get(key, _MISSING, expire_time=True)
+
+        remaining = None if expires is None else max(expires - time(), 0)
+        if legacy and value is not _MISSING:
+            tier.set(self._key(key), value, expire=remaining)
+            tier.delete(key)
+
+        return value, remaining
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        `get` - Returns the value of `key` from the first tier that has it.
+
+        `**Parameters**``
+        - `key` - The key to look up.
+        - `default` - The value returned if no tier has the key. `Defaults` to `None`.
+
+        """
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        for tier in self._tiers():
+            value, remaining = self._read(tier, key)
+            if value is not _MISSING:
+                if tier is self._cache.disk:
+                    self.disk_hits += 1
+                else:
+                    self.shared_hits += 1
+
+                self.memory.set(key, value, remaining)
+                return value
+
+        return default
+
+    def set(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """
+        `set` - Stores `value` under `key` in every tier of the namespace.
+
+        `**Parameters**``
+        - `key` - The key to store the value under.
+        - `value` - The value to store.
+        - `expire` - The lifetime of the entry in seconds. `Defaults` to the policy's `ttl`.
+
+        """
+        expire = self.policy.ttl if expire is None else expire
+        self.memory.set(key, value, expire)
+
+        for tier in self._tiers():
+            tier.set(self._key(key), value, expire=expire)
+        return True
+
+    def add(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """`add` - Stores `value` under `key` only if the key is not already present."""
+        if self.get(key, _MISSING) is not _MISSING:
+            return False
+        return self.set(key, value, expire)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """`pop` - Removes `key` from every tier and returns its value."""
+        value = self.get(key, _MISSING)
+        self.delete(key)
+        return default if value is _MISSING else value
+
+    def delete(self, key: Any) -> bool:
+        """`delete` - Removes `key` from every tier, returns whether it was present."""
+        deleted = self.memory.delete(key)
+
+        for tier in self._tiers():
+            deleted = bool(tier.delete(self._key(key))) or deleted
+        return deleted
+
+    def clear(self) -> None:
+        """`clear` - Removes the in-memory entries of the namespace."""
+        self.memory.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """`stats` - Returns the in-memory counters along with the disk and shared tier hits."""
+        stats = self.memory.stats()
+        stats.update({"disk_hits": self.disk_hits, "shared_hits": self.shared_hits})
+        return stats
+
+
+class TieredCache:
+    """
+    `TieredCache` - A process-local LRU/TTL cache in front of optional disk and shared tiers.
+
+    Entries are grouped into namespaces, each with its own `CachePolicy`. The default namespace
+    keeps the `get`/`set`/`pop` interface of `diskcache.Cache`, so existing callers keep working.
+
+    `**Parameters**``
+    - `directory` - The directory of the disk tier, `None` disables it. `Defaults` to `"cache"`.
+    - `shared` - A shared tier such as a Redis wrapper, any object with `get(key, default)`,
+        `set(key, value, expire=None)` and `delete(key)`. `Defaults` to `None`.
+    - `policies` - Policies overriding `DEFAULT_POLICIES`, by namespace name. `Defaults` to `None`.
+
+    `**Example**`
+
+    ```py
+    cache = TieredCache(policies={"links": CachePolicy(ttl=3600, max_size=4096)})
+    cache.namespace("links").set("link", {"objectId": "..."})
+    print(cache.stats())
+    ```
+
+    """
+    DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+        "default": CachePolicy(ttl=None, max_size=1024, persist=True),
+        "links": CachePolicy(ttl=None, max_size=4096, persist=True),
+        "communities": CachePolicy(ttl=None, max_size=512, persist=True),
+        "accounts": CachePolicy(ttl=21600, max_size=64, persist=True),
+        "users": CachePolicy(ttl=300, max_size=4096, persist=False),
+        "chats": CachePolicy(ttl=300, max_size=1024, persist=False),
+        "messages": CachePolicy(ttl=90, max_size=10000, persist=False),
+        "media": CachePolicy(ttl=604800, max_size=2048, persist=True),
+        }
+
+    def __init__(
+        self,
+        directory: Optional[str] = "cache",
+        shared: Optional[Any] = None,
+        policies: Optional[Dict[str, CachePolicy]] = None
+        ) -> None:
+        self.directory:     Optional[str] = directory
+        self.shared:        Optional[Any] = shared
+        self.policies:      Dict[str, CachePolicy] = {**self.DEFAULT_POLICIES, **(policies or {})}
+        self._disk:         Optional[Cache] = None
+        self._namespaces:   Dict[str, CacheNamespace] = {}
+        self._lock:         RLock = RLock()
+
+    @property
+    def disk(self) -> Optional[Cache]:
+        """The disk tier, opened on first use."""
+        if self._disk is None and self.directory is not None:
+            with self._lock:
+                if self._disk is None:
+                    self._disk = Cache(self.directory)
+        return self._disk
+
+    def namespace(self, name: str, policy: Optional[CachePolicy] = None) -> CacheNamespace:
+        """
+        `namespace` - Returns the namespace called `name`, creating it if needed.
+
+        `**Parameters**``
+        - `name` - The name of the namespace.
+        - `policy` - The policy for a new namespace. `Defaults` to the configured or default policy.
+
+        """
+        with self._lock:
+            if name not in self._namespaces:
+                self._namespaces[name] = CacheNamespace(
+                    name=name,
+                    policy=policy or self.policies.get(name) or CachePolicy(),
+                    cache=self
+                    )
+            return self._namespaces[name]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """`get` - Returns the value of `key` from the default namespace."""
+        return self.namespace("default").get(key, default)
+
+    def set(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """`set` - Stores `value` under `key` in the default namespace."""
+        return self.namespace("default").set(key, value, expire)
+
+    def add(self, key: Any, value: Any, expire: Optional[float] = None) -> bool:
+        """`add` - Stores `value` under `key` in the default namespace if the key is not present."""
+        return self.namespace("default").add(key, value, expire)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """`pop` - Removes `key` from the default namespace and returns its value."""
+        return self.namespace("default").pop(key, default)
+
+    def delete(self, key: Any) -> bool:
+        """`delete` - Removes `key` from the default namespace."""
+        return self.namespace("default").delete(key)
+
+    def __enter__(self) -> CacheNamespace:
+        return self.namespace("default")
+
+    def __exit__(self, *args) -> None:
+        return None
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.namespace("default")
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.namespace("default")[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.namespace("default")[key] = value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """`stats` - Returns the counters of every namespace, by name."""
+        with self._lock:
+            return {name: namespace.stats() for name, namespace in self._namespaces.items()}
+
+    def close(self) -> None:
+        """`close` - Closes the disk tier."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
@@ -0,0 +1,239 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+from importlib.util import find_spec
+from json import loads as json_loads, dumps as json_dumps
+from typing import Any, Dict, Optional, Type, TypedDict, Union
+
+from ..entities.handlers import orjson_exists
+
+__all__ = (
+    "JSONCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "CODECS",
+    "SCHEMAS",
+    "FrameHeader",
+    "register_codec",
+    "register_schema",
+    "fetch_codec",
+    "set_codec",
+    )
+
+class _FrameAuthor(TypedDict, total=False):
+    uid: Any
+
+class _FrameChatMessage(TypedDict, total=False):
+    type: Any
+    mediaType: Any
+    chatId: Any
+    author: Optional[_FrameAuthor]
+
+class _FramePayload(TypedDict, total=False):
+    ndcId: Any
+    chatMessage: Optional[_FrameChatMessage]
+
+class FrameHeader(TypedDict, total=False):
+    """The routing fields of a websocket frame: `t`, `o.ndcId` and the chat message type, author and chat."""
+    t: Any
+    o: Optional[_FramePayload]
+
+
+SCHEMAS: Dict[str, Any] = {
+    "frame": FrameHeader,
+    }
+
+class JSONCodec(ABC):
+    """
+    `JSONCodec` - Turns JSON text into Python objects and back.
+
+    `decode` with a schema name returns only the fields of that schema when the codec is
+    `typed`, otherwise it returns the whole document like `loads`. Backends must implement
+    `loads` and `dumps`.
+
+    """
+    name: str = "json"
+    typed: bool = False
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """`loads` - Decodes a JSON document."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """`dumps` - Encodes `obj` as UTF-8 JSON."""
+
+    def decode(self, data: Union[str, bytes], schema: Optional[str] = None) -> Any:
+        """
+        `decode` - Decodes a JSON document, reading only the fields of `schema` if the codec supports it.
+
+        `**Parameters**``
+        - `data` - The JSON document.
+        - `schema` - The name of a schema in `SCHEMAS`. `Defaults` to `None`.
+
+        """
+        return self.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name}>"
+
+
+class StdlibCodec(JSONCodec):
+    """`StdlibCodec` - The standard library `json` module, always available."""
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json_loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json_dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """`OrjsonCodec` - `orjson`, falling back to `json` for documents it rejects."""
+    name = "orjson"
+
+    def __init__(self) -> None:
+        from orjson import loads, dumps, JSONDecodeError
+        self._loads, self._dumps, self._error = loads, dumps, JSONDecodeError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._loads(data)
+        except self._error:
+            return json_loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    `MsgspecCodec` - `msgspec`, with one precompiled decoder per schema.
+
+    Schema decoders skip every field the schema does not name, so reading the routing
+    fields of a large frame builds a few small dicts instead of the whole document.
+
+    """
+    name = "msgspec"
+    typed = True
+
+    def __init__(self) -> None:
+        from msgspec import DecodeError, json
+        self._json, self._error = json, DecodeError
+        self._decoder = json.Decoder()
+        self._encoder = json.Encoder()
+        self._decoders: Dict[str, Any] = {}
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error:
+            return json_loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: Union[str, bytes], schema: Optional[str] = None) -> Any:
+        if schema is None or schema not in SCHEMAS:
+            return self.loads(data)
+
+        decoder = self._decoders.get(schema)
+        if decoder is None:
+            decoder = self._decoders[schema] = self._json.Decoder(SCHEMAS[schema])
+
+        try:
+            return decoder.decode(data)
+        except self._error:
+            return self.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+    }
+
+_AVAILABLE = {
+    "orjson": orjson_exists,
+    "msgspec": lambda: find_spec("msgspec") is not None,
+    "json": lambda: True,
+    }
+
+_codecs: Dict[str, JSONCodec] = {}
+_default: Optional[str] = None
+_lock: Lock = Lock()
+
+def register_codec(name: str, codec: Type[JSONCodec], preferred: bool = False) -> None:
+    """
+    `register_codec` - Adds a codec to the registry.
+
+    `**Parameters**``
+    - `name` - The name the codec is fetched by.
+    - `codec` - The `JSONCodec` subclass.
+    - `preferred` - Whether the codec is tried before the built-in ones. `Defaults` to `False`.
+
+    """
+    with _lock:
+        codecs = {name: codec, **CODECS} if preferred else {**CODECS, name: codec}
+        CODECS.clear()
+        CODECS.update(codecs)
+        _codecs.pop(name, None)
+
+def register_schema(name: str, schema: Any) -> None:
+    """
+    `register_schema` - Adds a schema `decode` can read payloads with, e.g. a `TypedDict` or `msgspec.Struct`.
+
+    `**Parameters**``
+    - `name` - The name the schema is passed to `decode` by.
+    - `schema` - The type typed codecs decode into.
+
+    """
+    SCHEMAS[name] = schema
+    for codec in list(_codecs.values()):
+        getattr(codec, "_decoders", {}).pop(name, None)
+
+def fetch_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    `fetch_codec` - Returns a codec, creating it once.
+
+    `**Parameters**``
+    - `name` - The codec to fetch. `Defaults` to the one set with `set_codec`, or the first
+        available of `orjson`, `msgspec` and `json`.
+
+    """
+    global _default
+    name = name or _default
+
+    with _lock:
+        if name is None:
+            name = _default = next(
+                candidate for candidate in CODECS
+                if _AVAILABLE.get(candidate, lambda: True)()
+                )
+
+        if name not in _codecs:
+            if name not in CODECS:
+                raise ValueError(f"Unknown JSON codec: {name}. Use one of {', '.join(CODECS)}.")
+            _codecs[name] = CODECS[name]()
+
+        return _codecs[name]
+
+def set_codec(name: str) -> JSONCodec:
+    """
+    `set_codec` - Makes `name` the codec clients created from now on use.
+
+    `**Example**`
+
+    ```py
+    from pymino.ext.utilities import set_codec
+
+    set_codec("msgspec")
+    bot = Bot()
+    ```
+
+    """
+    global _default
+    codec = fetch_codec(name)
+    _default = name
+    return codec
@@ -1,6 +1,7 @@
 from time import time
-from typing import Callable
-from collections import defaultdict
+from typing import Any, Callable, Optional, Tuple
+
+from .cooldown import CooldownStore
 
 
 class Command:
@@ -14,21 +15,38 @@ class Command:
     - `usage` - The usage of the command. `Defaults` to `None`.
     - `aliases` - The aliases of the command. `Defaults` to `None`.
     - `cooldown` - The cooldown of the command. `Defaults` to `0`.
+    - `cooldown_scope` - Who shares a cooldown: `user`, `chat` or `global`. `Defaults` to `user`.
+    - `binder` - The precompiled argument binder of `func`. `Defaults` to `()`.
     
     """
-    def __init__(self, func: Callable, name: str, description: str=None, usage: str=None, aliases: list=None, cooldown: int=0):
+    def __init__(self, func: Callable, name: str, description: str=None, usage: str=None, aliases: list=None, cooldown: int=0, cooldown_scope: str="user", binder: tuple=()):
         self.func:           Callable = func
         self.name:           str = name
         self.description:    str = description
         self.usage:          str = usage
         self.aliases:        list = [] if aliases is None else aliases
         self.cooldown:       int = cooldown
+        self.cooldown_scope: str = cooldown_scope
+        self.binder:         tuple = binder
 
 
 class Commands:
-    def __init__(self):
+    """
+    `Commands` - The command list and router.
+
+    Names and aliases are indexed when a command is added: `routes` maps every name and alias
+    to its command, and `trie` holds them word by word so names with spaces work as
+    subcommands, e.g. `role add`. Routing a message is a dictionary lookup per word.
+
+    `**Parameters**`
+    - `cooldown_backend` - A shared backend for the `CooldownStore`. `Defaults` to `None`.
+
+    """
+    def __init__(self, cooldown_backend: Optional[Any] = None):
         self.commands: dict[str, Command] = {}
-        self.cooldowns: defaultdict[dict] = defaultdict(dict)
+        self.cooldowns: CooldownStore = CooldownStore(cooldown_backend)
+        self.routes: dict[str, Command] = {}
+        self.trie: dict = {}
 
 
     def add_command(self, command: Command) -> Command:
@@ -43,9 +61,60 @@ class Commands:
         
         """
         self.commands[command.name] = command
+        self.__reindex__()
         return command
 
 
+    def __reindex__(self) -> None:
+        """
+        `__reindex__` - Rebuilds `routes` and `trie` from the command list.
+
+        Aliases are indexed first so a command name always wins over another command's alias.
+
+        """
+        routes, trie = {}, {}
+        entries = [(alias, command) for command in self.commands.values() for alias in command.aliases]
+        entries += [(command.name, command) for command in self.commands.values()]
+
+        for name, command in entries:
+            routes[name] = command
+            node = trie
+            for word in name.split(" "):
+                node = node.setdefault(word, {})
+            node[None] = command
+
+        self.routes, self.trie = routes, trie
+
+
+    def route(self, content: str) -> Tuple[Optional[Command], str]:
+        """
+        `route` - Finds the command a message calls, preferring the longest subcommand.
+        
+        `**Parameters**`
+        - `content` - The message without the command prefix.
+        
+        `**Returns**`
+        - `Tuple[Optional[Command], str]` - The command, or `None`, and the rest of the message after its name.
+        
+        """
+        node, command, message, start = self.trie, None, "", 0
+
+        while True:
+            end = content.find(" ", start)
+            node = node.get(content[start:] if end == -1 else content[start:end])
+            if node is None:
+                break
+
+            if None in node:
+                command, message = node[None], "" if end == -1 else content[end + 1:]
+
+            if end == -1:
+                break
+            start = end + 1
+
+        return command, message
+
+
     def fetch_command(self, command_name: str) -> Command:
         """
         `fetch_command` - Fetches a command from the command list.
@@ -57,9 +126,7 @@ class Commands:
         - `Command` - The command that was fetched.
         
         """
-        return self.commands.get(command_name) or next(
-            (command for command in self.commands.values() if command_name in command.aliases), None
-        )
+        return self.routes.get(command_name)
 
 
     def fetch_commands(self) -> Command:
@@ -156,7 +223,7 @@ class Commands:
         - `None` - Nothing.
 
         """
-        self.cooldowns[command_name][userId] = time() + cooldown
+        self.cooldowns.set(CooldownStore.bucket(command_name, "user", userId), cooldown)
 
 
     def fetch_cooldown(self, command_name: str, userId: str) -> int:
@@ -171,8 +238,8 @@ class Commands:
         - `int` - The cooldown that was fetched.
         
         """
-        self.cooldowns[command_name].setdefault(userId, 0)
-        return self.cooldowns[command_name][userId]
+        remaining = self.cooldowns.remaining(CooldownStore.bucket(command_name, "user", userId))
+        return time() + remaining if remaining else 0
 
 
     def __help__(self):
@@ -0,0 +1,170 @@
+from time import time
+from threading import Lock
+from heapq import heappop, heappush
+from itertools import count
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+__all__ = (
+    "COOLDOWN_SCOPES",
+    "CooldownStore",
+    )
+
+COOLDOWN_SCOPES: Tuple[str, ...] = ("user", "chat", "global")
+
+class CooldownStore:
+    """
+    `CooldownStore` - Command cooldowns that expire on their own.
+
+    Every cooldown lives in a bucket keyed by command and scope: per user, per chat or one
+    global bucket per command. Expiries are kept in a dictionary for O(1) checks and in a heap
+    that is trimmed on every write, so expired buckets are dropped instead of piling up.
+
+    A shared `backend` lets several bot processes enforce the same cooldowns. It can be any
+    object with an atomic `add(key, value, expire=None) -> bool` and `get(key, default=None)`,
+    such as `diskcache.Cache` or a thin Redis `SET NX EX` wrapper. The backend is only asked
+    when the local store has no running cooldown for the bucket.
+
+    `**Parameters**``
+    - `backend` - The shared backend, `None` keeps cooldowns in this process. `Defaults` to `None`.
+    - `prefix` - The prefix of every backend key. `Defaults` to `"cooldown"`.
+
+    `**Example**`
+
+    ```py
+    from diskcache import Cache
+
+    bot.set_cooldown_backend(Cache("cooldowns"))
+
+    @bot.command("daily", cooldown=86400, cooldown_scope="user")
+    def daily(ctx: Context):
+        ctx.reply("Come back tomorrow!")
+    ```
+
+    """
+    def __init__(self, backend: Optional[Any] = None, prefix: str = "cooldown") -> None:
+        self.backend:       Optional[Any] = backend
+        self.prefix:        str = prefix
+        self._expiries:     Dict[Hashable, float] = {}
+        self._heap:         List[Tuple[float, int, Hashable]] = []
+        self._sequence:     count = count()
+        self._lock:         Lock = Lock()
+
+        self.checks:        int = 0
+        self.limited:       int = 0
+        self.expired:       int = 0
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    @staticmethod
+    def bucket(command_name: str, scope: str = "user", userId: Optional[str] = None, chatId: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+        """
+        `bucket` - Returns the bucket key of a command call.
+
+        `**Parameters**``
+        - `command_name` - The name of the command.
+        - `scope` - `user`, `chat` or `global`. `Defaults` to `user`.
+        - `userId` - The user who called the command. `Defaults` to `None`.
+        - `chatId` - The chat the command was called in. `Defaults` to `None`.
+
+        """
+        if scope == "user":
+            return (command_name, scope, userId)
+        if scope == "chat":
+            return (command_name, scope, chatId)
+        if scope == "global":
+            return (command_name, scope, None)
+        raise ValueError(f"Invalid cooldown scope: {scope}. Use one of {', '.join(COOLDOWN_SCOPES)}.")
+
+    def _trim(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            expires, _, key = heappop(self._heap)
+            if self._expiries.get(key) == expires:
+                del self._expiries[key]
+                self.expired += 1
+
+    def _store(self, key: Hashable, expires: float) -> None:
+        self._expiries[key] = expires
+        heappush(self._heap, (expires, next(self._sequence), key))
+
+    def _backend_key(self, key: Tuple) -> str:
+        return ":".join([self.prefix, *("" if part is None else str(part) for part in key)])
+
+    def remaining(self, key: Hashable) -> float:
+        """`remaining` - Returns the seconds left on a bucket's cooldown, `0` if it is not on cooldown."""
+        now = time()
+        expires = self._expiries.get(key, 0.0)
+
+        if expires <= now and self.backend is not None:
+            expires = self.backend.get(self._backend_key(key), 0.0) or 0.0
+
+        return max(0.0, expires - now)
+
+    def hit(self, key: Hashable, cooldown: float) -> float:
+        """
+        `hit` - Starts a bucket's cooldown unless it is already running.
+
+        `**Parameters**``
+        - `key` - The bucket, see `bucket`.
+        - `cooldown` - The cooldown in seconds.
+
+        `**Returns**``
+        - `float` - The seconds left on the running cooldown, `0` if the call is allowed and the cooldown started.
+
+        """
+        now = time()
+        with self._lock:
+            self.checks += 1
+            self._trim(now)
+
+            expires = self._expiries.get(key)
+            if expires is not None:
+                self.limited += 1
+                return expires - now
+
+            if self.backend is not None and not self.backend.add(self._backend_key(key), now + cooldown, expire=cooldown):
+                expires = self.backend.get(self._backend_key(key), 0.0) or 0.0
+                if expires > now:
+                    self._store(key, expires)
+                    self.limited += 1
+                    return expires - now
+
+            self._store(key, now + cooldown)
+            return 0.0
+
+    def set(self, key: Hashable, cooldown: float) -> None:
+        """`set` - Starts or restarts a bucket's cooldown."""
+        now = time()
+        with self._lock:
+            self._trim(now)
+            self._store(key, now + cooldown)
+
+        if self.backend is not None:
+            backend_key = self._backend_key(key)
+            if not self.backend.add(backend_key, now + cooldown, expire=cooldown) and hasattr(self.backend, "set"):
+                self.backend.set(backend_key, now + cooldown, expire=cooldown)
+
+    def reset(self, key: Hashable) -> None:
+        """`reset` - Ends a bucket's cooldown."""
+        with self._lock:
+            self._expiries.pop(key, None)
+
+        if self.backend is not None and hasattr(self.backend, "delete"):
+            self.backend.delete(self._backend_key(key))
+
+    def expire(self) -> int:
+        """`expire` - Drops every expired bucket and returns how many were dropped."""
+        with self._lock:
+            expired = self.expired
+            self._trim(time())
+            return self.expired - expired
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the number of running cooldowns and the check counters."""
+        return {
+            "active": len(self._expiries),
+            "checks": self.checks,
+            "limited": self.limited,
+            "expired": self.expired,
+            "shared": self.backend is not None
+            }
@@ -0,0 +1,153 @@
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Any, Optional
+
+from diskcache import Cache
+
+from .generate import Generator
+from ..entities.handlers import CACHE_NAME
+
+__all__ = (
+    "DeviceIdPool",
+    )
+
+class DeviceIdPool:
+    """
+    `DeviceIdPool` - Pre-generated device IDs and the device IDs pinned to accounts.
+
+    A background thread keeps `size` fresh IDs ready so `get` is a pop rather than a SHA1
+    and HMAC on the request path. `pin` gives every account a single device ID that
+    survives restarts. It is stored next to the account's `sid` in the same
+    `{"device": ..., "sid": ...}` record that the login cache uses.
+
+    `**Parameters**``
+    - `generator` - The generator the IDs are made with.
+    - `size` - The number of IDs kept ready. `Defaults` to `16`.
+    - `store` - The mapping pinned IDs are persisted in. `Defaults` to the login cache.
+    - `prefill` - Whether to start generating IDs right away. `Defaults` to `True`.
+
+    `**Example**`
+
+    ```py
+    device = bot.device_pool.pin("email@example.com")
+    bot.device_pool.bind("email@example.com", device, sid=bot.sid)
+    ```
+
+    """
+    def __init__(
+        self,
+        generator: Generator,
+        size: int = 16,
+        store: Optional[Any] = None,
+        prefill: bool = True
+        ) -> None:
+        self.generator:     Generator = generator
+        self.size:          int = max(1, size)
+        self._store:        Optional[Any] = store
+        self._ids:          deque = deque()
+        self._lock:         Lock = Lock()
+        self._wanted:       Event = Event()
+        self._thread:       Optional[Thread] = None
+
+        self.generated:     int = 0
+        self.misses:        int = 0
+
+        if prefill:
+            self._wanted.set()
+            self._start()
+
+    @property
+    def store(self) -> Any:
+        """The mapping pinned IDs are persisted in, opened on first use."""
+        if self._store is None:
+            self._store = Cache(CACHE_NAME)
+        return self._store
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(target=self._fill, name="pymino-device-pool", daemon=True)
+            self._thread.start()
+
+    def _fill(self) -> None:
+        while self._wanted.wait():
+            self._wanted.clear()
+            while len(self._ids) < self.size:
+                self._ids.append(self.generator.device_id())
+                self.generated += 1
+
+    def get(self) -> str:
+        """
+        `get` - Returns a fresh device ID.
+
+        IDs come from the pool when one is ready and are generated inline otherwise. The pool
+        is refilled in the background once it drops to half its size.
+
+        """
+        try:
+            device = self._ids.popleft()
+        except IndexError:
+            self.misses += 1
+            device = self.generator.device_id()
+
+        if len(self._ids) <= self.size // 2:
+            self._wanted.set()
+            self._start()
+
+        return device
+
+    def pin(self, account: str, device: Optional[str] = None) -> str:
+        """
+        `pin` - Returns the device ID pinned to `account`, pinning a new one if it has none.
+
+        `**Parameters**``
+        - `account` - The account the ID belongs to, usually its email.
+        - `device` - The ID to pin if none is pinned yet. `Defaults` to a fresh one from the pool.
+
+        """
+        with self._lock:
+            record = self._fetch(account)
+            if record.get("device"):
+                return record["device"]
+
+            record["device"] = device or self.get()
+            self.store[account] = record
+            return record["device"]
+
+    def bind(self, account: str, device: str, sid: Optional[str] = None) -> None:
+        """
+        `bind` - Pins `device` to `account` and stores the `sid` that was issued for it.
+
+        `**Parameters**``
+        - `account` - The account the ID belongs to, usually its email.
+        - `device` - The device ID the session was issued for.
+        - `sid` - The session ID. `Defaults` to keeping the stored one.
+
+        """
+        with self._lock:
+            record = self._fetch(account)
+            record["device"] = device
+            if sid is not None:
+                record["sid"] = sid
+            self.store[account] = record
+
+    def session(self, account: str) -> Optional[str]:
+        """`session` - Returns the `sid` stored for `account`, if any."""
+        return self._fetch(account).get("sid")
+
+    def forget(self, account: str) -> None:
+        """`forget` - Removes the device ID and `sid` stored for `account`."""
+        with self._lock:
+            try:
+                del self.store[account]
+            except KeyError:
+                pass
+
+    def _fetch(self, account: str) -> dict:
+        try:
+            record = self.store.get(account)
+        except Exception:
+            return {}
+        return dict(record) if isinstance(record, dict) else {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -2,20 +2,61 @@ from hmac import new
 from hashlib import sha1
 from base64 import b64encode
 from secrets import token_hex
-from typing import Union
+from functools import lru_cache
+from typing import BinaryIO, Union
 
 
 class Generator:
+    """
+    `Generator` - Generates device IDs and request signatures.
+
+    The keyed HMAC states are built once and copied for every digest, and signatures of
+    small bodies (heartbeats, `send_active` and other repeated payloads) are memoized.
+
+    `**Parameters**``
+    - `prefix` - The hash prefix as a hex string.
+    - `device_key` - The device key as a hex string.
+    - `signature_key` - The signature key as a hex string.
+    - `signature_cache_size` - The number of signatures to memoize, `0` to disable. `Defaults` to `256`.
+    - `signature_cache_limit` - The largest body in bytes whose signature is memoized. `Defaults` to `1024`.
+
+    """
     def __init__(
         self,
         prefix:        Union[str, int],
         device_key:    str,
-        signature_key: str
+        signature_key: str,
+        signature_cache_size: int = 256,
+        signature_cache_limit: int = 1024
         ) -> None:
         self.PREFIX = bytes.fromhex(str(prefix))
         self.DEVICE_KEY = bytes.fromhex(device_key)
         self.SIGNATURE_KEY = bytes.fromhex(signature_key)
 
+        self._device_mac = new(self.DEVICE_KEY, digestmod=sha1)
+        self._signature_mac = new(self.SIGNATURE_KEY, digestmod=sha1)
+        self._signature_prefix = self.PREFIX[:1]
+        self.signature_cache_limit = signature_cache_limit
+        self._cached_signature = lru_cache(maxsize=signature_cache_size)(self._sign) if signature_cache_size else self._sign
+
+    def _device_digest(self, data: bytes) -> str:
+        mac = self._device_mac.copy()
+        mac.update(self.PREFIX + data)
+        return mac.hexdigest()
+
+    def _sign(self, data: bytes) -> str:
+        mac = self._signature_mac.copy()
+        mac.update(data)
+        return b64encode(self._signature_prefix + mac.digest()).decode("ascii")
+
+    def _sign_stream(self, stream: BinaryIO, chunk_size: int = 65536) -> str:
+        mac = self._signature_mac.copy()
+        position = stream.tell()
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            mac.update(chunk)
+        stream.seek(position)
+        return b64encode(self._signature_prefix + mac.digest()).decode("ascii")
+
     def device_id(self) -> str:
         """
         `generate_device_id` Generates a device ID based on a specific string.
@@ -25,29 +66,30 @@ class Generator:
         """
         encoded_data = sha1(str(token_hex(20)).encode('utf-8')).hexdigest()
 
-        digest = new(
-            self.DEVICE_KEY,
-            self.PREFIX + bytes.fromhex(encoded_data),
-            sha1).hexdigest()
+        digest = self._device_digest(bytes.fromhex(encoded_data))
 
         return f"{bytes.hex(self.PREFIX)}{encoded_data}{digest}".upper()
 
-    def signature(self, data: str) -> str:
+    def signature(self, data: Union[str, bytes, BinaryIO]) -> str:
         """
         `signature` Generates a signature based on a specific string.
         
         `**Parameters**`
-        - `data` - Data to generate a signature from
+        - `data` - Data to generate a signature from, bytes are signed as they are sent and
+            readable streams are signed chunk by chunk from their current position.
         `**Returns**`
         - `str` - Returns a signature as a string.
         """
+        if hasattr(data, "read"):
+            return self._sign_stream(data)
+
+        if not isinstance(data, bytes):
+            data = str(data).encode("utf-8")
 
-        signature = [self.PREFIX[0]]  
-        signature.extend(new(
-            self.SIGNATURE_KEY,
-            str(data).encode("utf-8"), sha1).digest())
+        if len(data) <= self.signature_cache_limit:
+            return self._cached_signature(data)
 
-        return b64encode(bytes(signature)).decode("utf-8")
+        return self._sign(data)
     
     def update_device(self, device: str) -> str:
         """
@@ -60,9 +102,6 @@ class Generator:
         """
         encoded_data = sha1(str(bytes.fromhex(device[2:42])).encode('utf-8')).hexdigest()
 
-        digest = new(
-            self.DEVICE_KEY,
-            self.PREFIX + bytes.fromhex(encoded_data),
-            sha1).hexdigest()
+        digest = self._device_digest(bytes.fromhex(encoded_data))
 
         return f"{bytes.hex(self.PREFIX)}{encoded_data}{digest}".upper()
\ No newline at end of file
@@ -0,0 +1,246 @@
+from mmap import mmap
+from hashlib import blake2b
+from os import fstat, SEEK_END, SEEK_SET
+from io import BytesIO, IOBase
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+from ..entities.exceptions import InvalidImage
+
+__all__ = (
+    "MAGIC_TYPES",
+    "sniff_content_type",
+    "MediaStream",
+    )
+
+MAGIC_TYPES: Tuple[Tuple[int, bytes, str], ...] = (
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (8, b"WEBP", "image/webp"),
+    (0, b"BM", "image/bmp"),
+    (4, b"ftypM4A", "audio/aac"),
+    (4, b"ftyp", "video/mp4"),
+    (0, b"\xff\xf1", "audio/aac"),
+    (0, b"\xff\xf9", "audio/aac"),
+    (0, b"ID3", "audio/mpeg"),
+    (0, b"\xff\xfb", "audio/mpeg"),
+    (0, b"OggS", "audio/ogg"),
+    )
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """
+    `sniff_content_type` - Detects the content type of media from its first bytes.
+
+    `**Parameters**``
+    - `head` - At least the first 16 bytes of the media.
+
+    `**Returns**``
+    - `Optional[str]` - The content type, `None` if it is not recognized.
+
+    """
+    for offset, magic, content_type in MAGIC_TYPES:
+        if head[offset:offset + len(magic)] == magic:
+            return content_type
+    return None
+
+
+class MediaStream(IOBase):
+    """
+    `MediaStream` - A seekable upload body of known length that is read in chunks.
+
+    Files are read from disk as they are sent, and downloads are spooled to a temporary file
+    that stays in memory only up to `spool_limit` bytes. The content type is sniffed from the
+    first bytes, so a download that is not the expected kind of media is dropped before the
+    rest of it is fetched. The body can be rewound, so it is signed in one pass and sent again
+    when a request is retried.
+
+    Use `MediaStream.open` rather than the constructor.
+
+    `**Parameters**``
+    - `file` - A readable, seekable binary file.
+    - `length` - The number of bytes from the current position to the end.
+    - `content_type` - The sniffed content type. `Defaults` to `None`.
+    - `close_file` - Whether closing the stream closes `file`. `Defaults` to `True`.
+    - `chunk_size` - The number of bytes read at a time. `Defaults` to `65536`.
+
+    `**Example**`
+
+    ```py
+    with MediaStream.open("https://i.imgur.com/image.jpg", accept="image/") as stream:
+        print(stream.content_type, len(stream))
+    ```
+
+    """
+    def __init__(
+        self,
+        file: Union[BinaryIO, mmap],
+        length: int,
+        content_type: Optional[str] = None,
+        close_file: bool = True,
+        chunk_size: int = 65536
+        ) -> None:
+        self.file:              Union[BinaryIO, mmap] = file
+        self.length:            int = length
+        self.content_type:      Optional[str] = content_type
+        self.close_file:        bool = close_file
+        self.chunk_size:        int = chunk_size
+        self._start:            int = file.tell()
+        self._digest:           Optional[str] = None
+
+    @classmethod
+    def open(
+        cls,
+        media: Union[str, bytes, bytearray, memoryview, BinaryIO, mmap, "MediaStream"],
+        accept: Optional[str] = None,
+        spool_limit: int = 1 << 20,
+        chunk_size: int = 65536,
+        timeout: float = 30.0
+        ) -> "MediaStream":
+        """
+        `open` - Opens media as a stream.
+
+        `**Parameters**``
+        - `media` - A file path, an `http(s)` url, bytes, an open binary file or an `mmap`.
+        - `accept` - The content type prefix the media must have, e.g. `image/`. `Defaults` to `None`.
+        - `spool_limit` - The bytes of a download or unseekable file kept in memory before spilling to disk. `Defaults` to `1 MiB`.
+        - `chunk_size` - The number of bytes read at a time. `Defaults` to `65536`.
+        - `timeout` - The seconds to wait for a download to respond. `Defaults` to `30`.
+
+        `**Raises**``
+        - `InvalidImage` - The media cannot be read, or it is not of the `accept` type.
+
+        """
+        if isinstance(media, MediaStream):
+            return media
+
+        try:
+            if isinstance(media, str) and media.startswith("http"):
+                return cls._download(media, accept, spool_limit, chunk_size, timeout)
+
+            if isinstance(media, str):
+                stream = cls._from_file(open(media, "rb"), True, spool_limit, chunk_size)
+            elif isinstance(media, (bytes, bytearray, memoryview)):
+                stream = cls(BytesIO(media), len(media), chunk_size=chunk_size)
+            else:
+                stream = cls._from_file(media, False, spool_limit, chunk_size)
+        except InvalidImage:
+            raise
+        except Exception as e:
+            raise InvalidImage from e
+
+        stream.content_type = sniff_content_type(stream.peek())
+        if accept and stream.content_type and not stream.content_type.startswith(accept):
+            stream.close()
+            raise InvalidImage
+        return stream
+
+    @classmethod
+    def _from_file(cls, file: Union[BinaryIO, mmap], close_file: bool, spool_limit: int, chunk_size: int) -> "MediaStream":
+        if isinstance(file, mmap):
+            return cls(file, len(file) - file.tell(), close_file=close_file, chunk_size=chunk_size)
+
+        if getattr(file, "seekable", lambda: False)():
+            position = file.tell()
+            try:
+                length = fstat(file.fileno()).st_size - position
+            except Exception:
+                length = file.seek(0, SEEK_END) - position
+                file.seek(position, SEEK_SET)
+            return cls(file, length, close_file=close_file, chunk_size=chunk_size)
+
+        spool = SpooledTemporaryFile(max_size=spool_limit)
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            spool.write(chunk)
+
+        if close_file:
+            file.close()
+        length = spool.tell()
+        spool.seek(0)
+        return cls(spool, length, chunk_size=chunk_size)
+
+    @classmethod
+    def _download(cls, url: str, accept: Optional[str], spool_limit: int, chunk_size: int, timeout: float) -> "MediaStream":
+        from requests import get
+
+        with get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size)
+            head = next(chunks, b"")
+
+            content_type = sniff_content_type(head)
+            declared = (response.headers.get("content-type") or "").split(";")[0].strip() or None
+            if accept and not (content_type or declared or "").startswith(accept):
+                raise InvalidImage
+
+            spool = SpooledTemporaryFile(max_size=spool_limit)
+            spool.write(head)
+            for chunk in chunks:
+                spool.write(chunk)
+
+        length = spool.tell()
+        spool.seek(0)
+        return cls(spool, length, content_type or declared, chunk_size=chunk_size)
+
+    def peek(self, size: int = 16) -> bytes:
+        """`peek` - Returns the first `size` bytes without moving the stream."""
+        position = self.file.tell()
+        self.file.seek(self._start)
+        head = self.file.read(size)
+        self.file.seek(position)
+        return head
+
+    def digest(self) -> str:
+        """`digest` - Returns the BLAKE2b hex digest of the media, hashed once without moving the stream."""
+        if self._digest is None:
+            position = self.file.tell()
+            self.file.seek(self._start)
+            digest = blake2b(digest_size=32)
+            for chunk in iter(lambda: self.read(self.chunk_size), b""):
+                digest.update(chunk)
+            self.file.seek(position)
+            self._digest = digest.hexdigest()
+        return self._digest
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(self.chunk_size), b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._start + self.length - self.file.tell()
+        if remaining <= 0:
+            return b""
+        return self.file.read(remaining if size is None or size < 0 else min(size, remaining))
+
+    def tell(self) -> int:
+        return self.file.tell() - self._start
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            offset += self._start
+        elif whence == SEEK_END:
+            offset += self._start + self.length
+            whence = SEEK_SET
+        self.file.seek(offset, whence)
+        return self.tell()
+
+    def rewind(self) -> None:
+        """`rewind` - Moves back to the start of the media."""
+        self.file.seek(self._start)
+
+    def close(self) -> None:
+        if not self.closed and self.close_file:
+            self.file.close()
+        super().close()
+
+    def __repr__(self) -> str:
+        return f"<MediaStream length={self.length} content_type={self.content_type}>"
@@ -0,0 +1,227 @@
+from asyncio import ensure_future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Tuple
+
+__all__ = (
+    "offset_cursor",
+    "token_cursor",
+    "async_offset_cursor",
+    "async_token_cursor",
+    "iter_pages",
+    "iter_rows",
+    "aiter_pages",
+    "aiter_rows",
+    "paginate",
+    "apaginate",
+    )
+
+Page = Tuple[Any, Optional[Any]]
+
+def offset_cursor(fetch: Callable[[int, int], Any], size: int) -> Callable[[int], Page]:
+    """
+    `offset_cursor` - Wraps a `start`/`size` endpoint for `iter_pages`.
+
+    The next cursor is the next `start`, or `None` once a page comes back shorter than `size`.
+
+    `**Parameters**``
+    - `fetch` - Called with `start` and `size`, returns a page.
+    - `size` - The number of rows per page.
+
+    """
+    def cursor(start: int) -> Page:
+        page = fetch(start, size)
+        return page, None if page is None or len(page) < size else start + size
+    return cursor
+
+
+def token_cursor(
+    fetch: Callable[[Optional[str], int], Any],
+    size: int,
+    next_token: Callable[[Any], Optional[str]] = lambda page: page.next_page_token
+    ) -> Callable[[Optional[str]], Page]:
+    """
+    `token_cursor` - Wraps a `pageToken` endpoint for `iter_pages`.
+
+    The next cursor is the page's `nextPageToken`, or `None` on the last page.
+
+    `**Parameters**``
+    - `fetch` - Called with `pageToken` and `size`, returns a page.
+    - `size` - The number of rows per page.
+    - `next_token` - Returns the token of the next page. `Defaults` to `page.next_page_token`.
+
+    """
+    def cursor(token: Optional[str]) -> Page:
+        page = fetch(token, size)
+        if page is None or len(page) == 0:
+            return page, None
+        return page, next_token(page) or None
+    return cursor
+
+
+def async_offset_cursor(fetch: Callable[[int, int], Awaitable[Any]], size: int) -> Callable[[int], Awaitable[Page]]:
+    """`async_offset_cursor` - Async version of `offset_cursor`, `fetch` must be a coroutine function."""
+    async def cursor(start: int) -> Page:
+        page = await fetch(start, size)
+        return page, None if page is None or len(page) < size else start + size
+    return cursor
+
+
+def async_token_cursor(
+    fetch: Callable[[Optional[str], int], Awaitable[Any]],
+    size: int,
+    next_token: Callable[[Any], Optional[str]] = lambda page: page.next_page_token
+    ) -> Callable[[Optional[str]], Awaitable[Page]]:
+    """`async_token_cursor` - Async version of `token_cursor`, `fetch` must be a coroutine function."""
+    async def cursor(token: Optional[str]) -> Page:
+        page = await fetch(token, size)
+        if page is None or len(page) == 0:
+            return page, None
+        return page, next_token(page) or None
+    return cursor
+
+
+def iter_pages(cursor: Callable[[Any], Page], start: Any = None, prefetch: bool = True) -> Iterator[Any]:
+    """
+    `iter_pages` - Yields pages until the cursor runs out.
+
+    With `prefetch`, the next page is requested in a background thread while the current one is consumed.
+
+    `**Parameters**``
+    - `cursor` - A function from `offset_cursor` or `token_cursor`, returning a page and the next cursor.
+    - `start` - The first cursor, a `start` index or a `pageToken`. `Defaults` to `None`.
+    - `prefetch` - Whether to fetch the next page ahead of time. `Defaults` to `True`.
+
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pymino-prefetch") if prefetch else None
+
+    try:
+        page, next_cursor = cursor(start)
+
+        while True:
+            future = executor.submit(cursor, next_cursor) if executor and next_cursor is not None else None
+
+            if page is not None:
+                yield page
+
+            if next_cursor is None:
+                return None
+
+            page, next_cursor = future.result() if future else cursor(next_cursor)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_rows(pages: Iterable[Any], limit: Optional[int] = None) -> Iterator[Any]:
+    """
+    `iter_rows` - Flattens pages into their rows, stopping after `limit` rows if given.
+
+    `**Parameters**``
+    - `pages` - The pages to flatten, each must be iterable.
+    - `limit` - The maximum number of rows. `Defaults` to `None`.
+
+    """
+    if limit is not None and limit <= 0:
+        return None
+
+    count = 0
+    try:
+        for page in pages:
+            for row in page:
+                yield row
+                count += 1
+                if limit is not None and count >= limit:
+                    return None
+    finally:
+        if hasattr(pages, "close"):
+            pages.close()
+
+
+async def aiter_pages(cursor: Callable[[Any], Awaitable[Page]], start: Any = None, prefetch: bool = True) -> AsyncIterator[Any]:
+    """
+    `aiter_pages` - Async version of `iter_pages`, the cursor must be a coroutine function.
+
+    With `prefetch`, the next page is requested as a task while the current one is consumed.
+
+    """
+    page, next_cursor = await cursor(start)
+
+    while True:
+        task = ensure_future(cursor(next_cursor)) if prefetch and next_cursor is not None else None
+
+        try:
+            if page is not None:
+                yield page
+        except BaseException:
+            if task is not None:
+                task.cancel()
+            raise
+
+        if next_cursor is None:
+            return
+
+        page, next_cursor = await task if task else await cursor(next_cursor)
+
+
+async def aiter_rows(pages: AsyncIterator[Any], limit: Optional[int] = None) -> AsyncIterator[Any]:
+    """`aiter_rows` - Async version of `iter_rows`."""
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    try:
+        async for page in pages:
+            for row in page:
+                yield row
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        if hasattr(pages, "aclose"):
+            await pages.aclose()
+
+
+def paginate(
+    fetch: Callable[[Any, int], Any],
+    size: int = 100,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+    token: bool = False,
+    next_token: Callable[[Any], Optional[str]] = lambda page: page.next_page_token
+    ) -> Iterator[Any]:
+    """
+    `paginate` - Streams the rows of a paged endpoint.
+
+    `**Parameters**``
+    - `fetch` - Called with the cursor (`start` or `pageToken`) and `size`, returns an iterable page.
+    - `size` - The number of rows per page. `Defaults` to `100`.
+    - `limit` - The maximum number of rows. `Defaults` to `None`.
+    - `prefetch` - Whether to fetch the next page while the current one is consumed. `Defaults` to `True`.
+    - `token` - Whether the endpoint pages with `pageToken` instead of `start`. `Defaults` to `False`.
+    - `next_token` - Returns the token of the next page when `token` is set. `Defaults` to `page.next_page_token`.
+
+    `**Example**`
+
+    ```py
+    for user in paginate(lambda start, size: community.fetch_users(start=start, size=size), limit=500):
+        print(user.userId)
+    ```
+
+    """
+    if token:
+        return iter_rows(iter_pages(token_cursor(fetch, size, next_token), None, prefetch), limit)
+    return iter_rows(iter_pages(offset_cursor(fetch, size), 0, prefetch), limit)
+
+
+def apaginate(
+    fetch: Callable[[Any, int], Awaitable[Any]],
+    size: int = 100,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+    token: bool = False,
+    next_token: Callable[[Any], Optional[str]] = lambda page: page.next_page_token
+    ) -> AsyncIterator[Any]:
+    """`apaginate` - Async version of `paginate`, `fetch` must be a coroutine function."""
+    if token:
+        return aiter_rows(aiter_pages(async_token_cursor(fetch, size, next_token), None, prefetch), limit)
+    return aiter_rows(aiter_pages(async_offset_cursor(fetch, size), 0, prefetch), limit)
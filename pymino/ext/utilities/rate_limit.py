@@ -0,0 +1,257 @@
+from re import compile as re_compile
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+from asyncio import sleep as async_sleep
+from typing import Dict, Optional, Set
+
+__all__ = (
+    "TokenBucket",
+    "RateLimiter",
+    "endpoint_family",
+    )
+
+_API_PREFIX = "/api/v1"
+_COMMUNITY_SEGMENT = re_compile(r"^(s-)?x\d+$")
+_ID_SEGMENT = re_compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$|^\d+$")
+
+def endpoint_family(url: str) -> str:
+    """
+    `endpoint_family` - Reduces a request url to the endpoint it belongs to.
+
+    Community IDs become `{comId}` and object IDs become `*`, so every chat shares one family.
+
+    `**Parameters**``
+    - `url` - A full service url or an endpoint path.
+
+    `**Returns**``
+    - `str` - The endpoint family, e.g. `/x{comId}/s/chat/thread/*/message`.
+
+    """
+    path = urlsplit(url).path
+    if path.startswith(_API_PREFIX):
+        path = path[len(_API_PREFIX):]
+
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if _COMMUNITY_SEGMENT.match(segment):
+            segments.append("s-x{comId}" if segment.startswith("s-") else "x{comId}")
+        elif _ID_SEGMENT.match(segment):
+            segments.append("*")
+        else:
+            segments.append(segment)
+
+    return "/" + "/".join(segments)
+
+
+class TokenBucket:
+    """
+    `TokenBucket` - A thread-safe token bucket whose refill rate adapts to the server.
+
+    The rate grows by `increase` after every successful response and is multiplied by
+    `backoff` after every throttling response, staying between `min_rate` and `max_rate`.
+
+    `**Parameters**``
+    - `rate` - The starting number of requests per second.
+    - `capacity` - The largest burst allowed.
+    - `min_rate` - The lowest rate the bucket backs off to.
+    - `max_rate` - The highest rate the bucket speeds up to.
+    - `increase` - How much the rate grows after a success.
+    - `backoff` - The factor the rate is multiplied by after a throttling response.
+
+    """
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        backoff: float
+        ) -> None:
+        self.rate:          float = rate
+        self.capacity:      float = capacity
+        self.min_rate:      float = min_rate
+        self.max_rate:      float = max_rate
+        self.increase:      float = increase
+        self.backoff:       float = backoff
+        self.tokens:        float = capacity
+        self.updated_at:    float = monotonic()
+        self._lock:         Lock = Lock()
+
+        self.requests:      int = 0
+        self.successes:     int = 0
+        self.throttled:     int = 0
+        self.waited:        float = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """
+        `reserve` - Takes a token and returns how long the caller has to wait before using it.
+
+        `**Returns**``
+        - `float` - The number of seconds to wait, `0` if a token was available.
+
+        """
+        with self._lock:
+            self._refill(monotonic())
+            self.tokens -= 1
+            self.requests += 1
+
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            self.waited += wait
+            return wait
+
+    def success(self) -> None:
+        """`success` - Speeds the bucket up after a successful response."""
+        with self._lock:
+            self._refill(monotonic())
+            self.successes += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttle(self) -> None:
+        """`throttle` - Backs the bucket off after a throttling response."""
+        with self._lock:
+            self._refill(monotonic())
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.backoff)
+            self.tokens = min(self.tokens, 0.0)
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the current rate, available tokens and counters."""
+        with self._lock:
+            self._refill(monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "tokens": round(self.tokens, 3),
+                "requests": self.requests,
+                "successes": self.successes,
+                "throttled": self.throttled,
+                "waited": round(self.waited, 3)
+                }
+
+
+class RateLimiter:
+    """
+    `RateLimiter` - Adaptive token buckets keyed by endpoint family.
+
+    Every request takes a token from the bucket of its endpoint family (see `endpoint_family`) and
+    waits when the bucket is empty. Responses feed back into the bucket: throttling status codes
+    halve its rate, successes slowly raise it again.
+
+    `**Parameters**``
+    - `rate` - The starting number of requests per second of each family. `Defaults` to `10`.
+    - `capacity` - The largest burst of each family. `Defaults` to `20`.
+    - `min_rate` - The lowest rate a family backs off to. `Defaults` to `0.5`.
+    - `max_rate` - The highest rate a family speeds up to. `Defaults` to `50`.
+    - `increase` - How much a family's rate grows after a success. `Defaults` to `0.5`.
+    - `backoff` - The factor a family's rate is multiplied by after throttling. `Defaults` to `0.5`.
+    - `overrides` - Starting rates for specific families, e.g. `{"/x{comId}/s/chat/thread/*/message": 2}`. `Defaults` to `None`.
+    - `enabled` - Whether requests are limited at all. `Defaults` to `True`.
+
+    `**Example**`
+
+    ```py
+    bot.request.rate_limiter = RateLimiter(rate=5, overrides={"/g/s/user-profile/*": 2})
+    print(bot.request.rate_limiter.metrics())
+    ```
+
+    """
+    THROTTLE_STATUS_CODES: Set[int] = {403, 429, 502, 503}
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        capacity: float = 20.0,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase: float = 0.5,
+        backoff: float = 0.5,
+        overrides: Optional[Dict[str, float]] = None,
+        enabled: bool = True
+        ) -> None:
+        self.rate:          float = rate
+        self.capacity:      float = capacity
+        self.min_rate:      float = min_rate
+        self.max_rate:      float = max_rate
+        self.increase:      float = increase
+        self.backoff:       float = backoff
+        self.overrides:     Dict[str, float] = overrides or {}
+        self.enabled:       bool = enabled
+        self._buckets:      Dict[str, TokenBucket] = {}
+        self._lock:         Lock = Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        `bucket` - Returns the bucket of the endpoint family of `url`, creating it if needed.
+
+        `**Parameters**``
+        - `url` - The request url.
+
+        """
+        family = endpoint_family(url)
+        bucket = self._buckets.get(family)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            if family not in self._buckets:
+                self._buckets[family] = TokenBucket(
+                    rate=self.overrides.get(family, self.rate),
+                    capacity=self.capacity,
+                    min_rate=self.min_rate,
+                    max_rate=self.max_rate,
+                    increase=self.increase,
+                    backoff=self.backoff
+                    )
+            return self._buckets[family]
+
+    def acquire(self, url: str) -> float:
+        """
+        `acquire` - Blocks until a request to `url` may be sent.
+
+        `**Returns**``
+        - `float` - The number of seconds waited.
+
+        """
+        if not self.enabled:
+            return 0.0
+
+        wait = self.bucket(url).reserve()
+        if wait: sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """`acquire_async` - Awaitable version of `acquire`."""
+        if not self.enabled:
+            return 0.0
+
+        wait = self.bucket(url).reserve()
+        if wait: await async_sleep(wait)
+        return wait
+
+    def feedback(self, url: str, status_code: int) -> None:
+        """
+        `feedback` - Adapts the rate of the endpoint family of `url` to a response.
+
+        `**Parameters**``
+        - `url` - The request url.
+        - `status_code` - The status code of the response.
+
+        """
+        if not self.enabled:
+            return None
+
+        if status_code in self.THROTTLE_STATUS_CODES:
+            self.bucket(url).throttle()
+        elif status_code < 400:
+            self.bucket(url).success()
+
+    def metrics(self) -> Dict[str, dict]:
+        """`metrics` - Returns the rate and counters of every endpoint family, by family."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {family: bucket.metrics() for family, bucket in buckets.items()}
@@ -1,11 +1,19 @@
 from uuid import uuid4
-from json import loads, dumps
+from time import sleep
+from threading import BoundedSemaphore
+from asyncio import TimeoutError as AsyncTimeoutError, Semaphore, get_running_loop, sleep as async_sleep
 from colorama import Fore, Style
-from typing import Optional, Union, Tuple, Callable
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, Optional, Union, Tuple
 
 from .generate import Generator
-from ..entities.handlers import orjson_exists
-from requests import Session as Http, Response as HttpResponse
+from .retry import RetryPolicy
+from .device import DeviceIdPool
+from .rate_limit import RateLimiter
+from .codec import JSONCodec, fetch_codec
+from .media import MediaStream
+from .cache import CacheNamespace
+from .transport import Transport, RequestsTransport
+from requests import Session as Http
 
 from ..entities import (
     Forbidden,
@@ -14,19 +22,8 @@ from ..entities import (
     ServiceUnavailable
     )
 
-from requests.exceptions import (
-    ConnectionError,
-    ReadTimeout,
-    SSLError,
-    ProxyError,
-    ConnectTimeout
-    )
-
-if orjson_exists():
-    from orjson import (
-        loads as orjson_loads,
-        dumps as orjson_dumps
-        )
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 
 class RequestHandler:
     """
@@ -36,22 +33,47 @@ class RequestHandler:
     - `bot` - The main bot class.
     - `generator` - The generator class.    
     - `proxy` - The proxy to use for requests.
+    - `rate_limiter` - The rate limiter requests wait on. `Defaults` to a new `RateLimiter`.
+    - `retry_policy` - Decides which failed requests are retried. `Defaults` to a new `RetryPolicy`.
+    - `device_pool` - Supplies device IDs for requests sent without one. `Defaults` to a new `DeviceIdPool`.
+    - `codec` - The JSON codec bodies and responses are encoded with. `Defaults` to `fetch_codec()`.
+    - `upload_limit` - The number of media uploads sent at once. `Defaults` to `4`.
+    - `media_cache` - Maps the BLAKE2b digest of uploaded media to its `mediaValue`, so the same
+        media is only uploaded once. `Defaults` to `None`, which uploads every time.
+    - `transport` - Sends the requests, e.g. an `HTTP2Transport`. `Defaults` to a `RequestsTransport`
+        over `http_handler`.
 
     """
+
     def __init__(
         self,
         bot,
         generator: Generator,
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        device_pool: Optional[DeviceIdPool] = None,
+        codec: Optional[JSONCodec] = None,
+        upload_limit: int = 4,
+        media_cache: Optional[CacheNamespace] = None,
+        transport: Optional[Transport] = None
         ) -> None:
         self.bot             = bot
         self.generate        = generator
         self.api_url:        str = "http://service.aminoapps.com/api/v1"
         self.http_handler:   Http = Http()
+        self.transport:      Transport = transport or RequestsTransport(self.http_handler)
         self.sid:            Optional[str] = None
         self.device:         Optional[str] = None
         self.userId:         Optional[str] = None
-        self.orjson:         bool = orjson_exists()
+        self.codec:          JSONCodec = codec or fetch_codec()
+        self.orjson:         bool = self.codec.name == "orjson"
+        self.rate_limiter:   RateLimiter = rate_limiter or RateLimiter()
+        self.retry_policy:   RetryPolicy = retry_policy or RetryPolicy()
+        self.device_pool:    DeviceIdPool = device_pool or DeviceIdPool(generator)
+        self.upload_limit:   int = upload_limit
+        self.upload_slots:   BoundedSemaphore = BoundedSemaphore(upload_limit)
+        self.media_cache:    Optional[CacheNamespace] = media_cache
 
         self.proxy = {
             "http": proxy,
@@ -90,29 +112,11 @@ class RequestHandler:
             "AUID": self.userId or str(uuid4())
             }
     
-    def fetch_request(self, method: str) -> Callable:
-        """
-        `fetch_request` - Returns the request method
-        
-        `**Parameters**``
-        - `method` - The request method to return.
-        
-        `**Returns**``
-        - `Callable` - The request method.
-        
-        """
-        request_methods = {
-            "GET": self.http_handler.get,
-            "POST": self.http_handler.post,
-            "DELETE": self.http_handler.delete,
-            }
-        return request_methods[method]
-    
     def send_request(
             self,
             method: str,
             url: str,
-            data: Union[dict, bytes, None],
+            data: Union[dict, bytes, MediaStream, None],
             headers: dict,
             content_type: Optional[str]
         ) -> Tuple[int, str]:
@@ -130,20 +134,65 @@ class RequestHandler:
         - `Tuple[int, str]` - The status code and response from the request.
         
         """
-        try:
-            response: HttpResponse = self.fetch_request(method)(
-                url, data=data, headers=headers, proxies=self.proxy
-            )
-            return response.status_code, response.text
-        except (
-            ConnectionError,
-            ReadTimeout,
-            SSLError,
-            ProxyError,
-            ConnectTimeout,
-        ) as e:
-            self.bot._log(f"Failed to send request: {e}")
-            return self.handler(method, url, data, content_type)
+        self.rate_limiter.acquire(url)
+
+        status_code, content = self.transport.request(
+            method, url, data=data, headers=headers, proxies=self.proxy
+        )
+        self.rate_limiter.feedback(url, status_code)
+        return status_code, content
+
+    def prepare_request(
+        self,
+        method: str,
+        url: str,
+        data: Union[dict, bytes, None] = None,
+        content_type: Optional[str] = None,
+        is_login_required: bool = True
+    ) -> Tuple[str, dict, Union[dict, bytes, None]]:
+        """
+        `prepare_request` - Signs the request and builds its headers, once per attempt
+
+        `**Parameters**``
+        - `method` - The request method to use.
+        - `url` - The service url to send the request to.
+        - `data` - The data to send with the request.
+        - `content_type` - The content type of the data.
+        - `is_login_required` - Whether or not the request requires a login.
+
+        `**Returns**``
+        - `Tuple[str, dict, Union[dict, bytes, None]]` - The service url, headers and data.
+
+        """
+        url, headers, binary_data = self.service_handler(url, data, content_type)
+
+        if all([method=="POST", data is None]):
+            headers["CONTENT-TYPE"] = "application/octet-stream"
+
+        if not is_login_required:
+            headers.pop("NDCAUTH")
+            headers.pop("AUID")
+
+        return url, headers, binary_data
+
+    def retry_delay(self, method: str, url: str, attempt: int, status_code: Optional[int] = None) -> Optional[float]:
+        """
+        `retry_delay` - Returns how long to wait before the next attempt, `None` if the request should not be retried
+
+        `**Parameters**``
+        - `method` - The request method used.
+        - `url` - The url the request was sent to.
+        - `attempt` - The number of attempts made so far.
+        - `status_code` - The status code of the response, `None` if the request failed to send.
+
+        """
+        if status_code is not None and status_code not in self.retry_policy.retry_status_codes:
+            return None
+
+        delay = self.retry_policy.next_delay(method, url, attempt)
+        if delay is not None:
+            self.bot._log(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt + 1}/{self.retry_policy.max_attempts})")
+        return delay
 
     def handler(
         self,
@@ -168,31 +217,43 @@ class RequestHandler:
         
         """
         url = self.service_url(url)
+        data = self.serialize(data) if data or content_type else data
+        attempt = 0
 
-        url, headers, binary_data = self.service_handler(url, data, content_type)
+        while True:
+            attempt += 1
+            url, headers, binary_data = self.prepare_request(
+                method, url, data, content_type, is_login_required
+            )
 
-        if all([method=="POST", data is None]):
-            headers["CONTENT-TYPE"] = "application/octet-stream"
+            try:
+                status_code, content = self.send_request(
+                    method, url, binary_data, headers, content_type
+                )
+            except self.transport.errors as e:
+                self.bot._log(f"Failed to send request: {e}")
+                delay = self.retry_delay(method, url, attempt)
+                if delay is None:
+                    raise
+                sleep(delay)
+                continue
 
-        if not is_login_required:
-            headers.pop("NDCAUTH")
-            headers.pop("AUID")
+            self.print_response(method=method, url=url, status_code=status_code)
 
-        try:
-            status_code, content = self.send_request(
-                method, url, binary_data, headers, content_type
-            )
-        except TypeError: # NOTE: Not sure if this is even needed.
-            return self.handler(method, url, data, content_type)
+            delay = self.retry_delay(method, url, attempt, status_code)
+            if delay is not None:
+                sleep(delay)
+                continue
 
-        self.print_response(method=method, url=url, status_code=status_code)
+            response = self.handle_response(status_code=status_code, response=content)
 
-        response = self.handle_response(status_code=status_code, response=content)
+            if response is not None:
+                return response
 
-        if response is None:
-            return self.handler(method, url, data, content_type)
-        
-        return response
+            # The session was refreshed after it expired, so the request is sent again
+            # with the new sid without waiting, but still within `max_attempts`.
+            if self.retry_policy.next_delay(method, url, attempt, idempotent_only=False) is None:
+                raise APIException(self.codec.loads(content))
 
     def service_handler(
         self,
@@ -213,7 +274,7 @@ class RequestHandler:
 
         """
         
-        headers = {"NDCDEVICEID": self.device or self.generate.device_id(), **self.service_headers()}
+        headers = {"NDCDEVICEID": self.device or self.device_pool.get(), **self.service_headers()}
 
         if data or content_type:
             headers, data = self.fetch_signature(data, headers, content_type)
@@ -232,7 +293,7 @@ class RequestHandler:
         
         """
 
-        if data is None: return data
+        if data is None or isinstance(data, (bytes, MediaStream)): return data
 
         def handle_dict(data: dict):
             return {key: self.ensure_utf8(value) for key, value in data.items()}
@@ -247,6 +308,29 @@ class RequestHandler:
 
         return handlers.get(type(data), lambda x: x)(data)
 
+    def serialize(self, data: Union[dict, str, bytes, BinaryIO, None]) -> Union[bytes, MediaStream, None]:
+        """
+        `serialize` - Serializes the request body to the bytes that are signed and sent
+
+        `**Parameters**``
+        - `data` - The data to serialize, bytes are returned as they are and file objects are
+            wrapped in a `MediaStream` so they are signed and sent in chunks.
+
+        `**Returns**``
+        - `Union[bytes, MediaStream, None]` - The serialized body.
+
+        """
+        if data is None or isinstance(data, (bytes, MediaStream)):
+            return data
+
+        if hasattr(data, "read"):
+            return MediaStream.open(data)
+
+        if isinstance(data, str):
+            return data.encode("utf-8")
+
+        return self.codec.dumps(data)
+
     def fetch_signature(
         self,
         data: Union[dict, bytes, None],
@@ -266,8 +350,10 @@ class RequestHandler:
 
         """
 
-        if not isinstance(data, bytes):
-            data = orjson_dumps(data).decode("utf-8") if self.orjson else dumps(data)
+        data = self.serialize(data)
+
+        if isinstance(data, MediaStream):
+            data.rewind()
 
         headers.update({
             "CONTENT-LENGTH": f"{len(data)}",
@@ -278,6 +364,64 @@ class RequestHandler:
         })
         return headers, data
 
+    def upload_media(
+        self,
+        media: Union[str, bytes, BinaryIO, MediaStream],
+        content_type: Optional[str] = None,
+        accept: Optional[str] = None
+        ) -> dict:
+        """
+        `upload_media` - Streams media to `/g/s/media/upload`, at most `upload_limit` uploads at a time
+
+        `**Parameters**``
+        - `media` - A file path, an `http(s)` url, bytes, an open binary file or a `MediaStream`.
+        - `content_type` - The content type of the media. `Defaults` to the sniffed type, or `image/jpg`.
+        - `accept` - The content type prefix the media must have, e.g. `image/`. `Defaults` to `None`.
+
+        `**Returns**``
+        - `dict` - The response from the request, or `{"mediaValue": ...}` if `media_cache` has the media.
+
+        """
+        stream = self.open_media(media, accept)
+        try:
+            cached = self.cached_media(stream)
+            if cached is not None:
+                return cached
+
+            with self.upload_slots:
+                response = self.handler(
+                    method="POST",
+                    url="/g/s/media/upload",
+                    data=stream,
+                    content_type=content_type or stream.content_type or "image/jpg"
+                    )
+            self.cache_media(stream, response)
+            return response
+        finally:
+            if stream is not media:
+                stream.close()
+
+    def open_media(self, media: Union[str, bytes, BinaryIO, MediaStream], accept: Optional[str] = None) -> MediaStream:
+        """`open_media` - Opens media as a `MediaStream`, hashing it when `media_cache` is set."""
+        stream = MediaStream.open(media, accept=accept)
+        if self.media_cache is not None:
+            stream.digest()
+        return stream
+
+    def cached_media(self, stream: MediaStream) -> Optional[dict]:
+        """`cached_media` - Returns `{"mediaValue": ...}` if the media was uploaded before, otherwise `None`."""
+        if self.media_cache is None:
+            return None
+
+        media_value = self.media_cache.get(stream.digest())
+        return {"mediaValue": media_value} if media_value is not None else None
+
+    def cache_media(self, stream: MediaStream, response: dict) -> None:
+        """`cache_media` - Remembers the `mediaValue` an upload of the media returned."""
+        media_value = response.get("mediaValue") if isinstance(response, dict) else None
+        if self.media_cache is not None and media_value:
+            self.media_cache.set(stream.digest(), media_value)
+
     def raise_error(self, response: dict) -> None:
         """
         `raise_error` - Raises an error if an error is in the response
@@ -318,10 +462,7 @@ class RequestHandler:
         if status_code in self.response_map:
             raise self.response_map[status_code]
 
-        try:
-            response = orjson_loads(response) if self.orjson else loads(response)
-        except Exception:
-            response = loads(response)
+        response = self.codec.loads(response)
 
         if status_code != 200:
             check_response = self.raise_error(response)
@@ -348,4 +489,219 @@ class RequestHandler:
                 "DELETE": Fore.MAGENTA,
                 "LITE": Fore.YELLOW
                 }.get(method, Fore.RED)
-            print(f"{color}{Style.BRIGHT}{method}{Style.RESET_ALL} - {url}")
\ No newline at end of file
+            print(f"{color}{Style.BRIGHT}{method}{Style.RESET_ALL} - {url}")
+
+
+class AsyncRequestHandler:
+    """
+    `AsyncRequestHandler` - An asyncio request handler backed by a pooled `aiohttp` session.
+
+    It shares the identity (sid, device, userId), signing and response handling of the
+    `RequestHandler` it wraps, so both can be used side by side by the same client.
+
+    `**Parameters**``
+    - `session` - The `RequestHandler` to share identity and signing with.
+    - `limit` - The maximum number of open connections in the pool. `Defaults` to `100`.
+    - `limit_per_host` - The maximum number of open connections per host, `0` for no limit. `Defaults` to `0`.
+    - `keepalive_timeout` - The number of seconds an idle connection is kept alive. `Defaults` to `30`.
+    - `http_handler` - An existing `aiohttp.ClientSession` to share between handlers. `Defaults` to `None`.
+
+    """
+    def __init__(
+        self,
+        session: RequestHandler,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        http_handler: Optional["ClientSession"] = None
+        ) -> None:
+        self.session            = session
+        self.limit:             int = limit
+        self.limit_per_host:    int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.http_handler:      Optional["ClientSession"] = http_handler
+        self.upload_slots:      Optional[Semaphore] = None
+
+    @property
+    def bot(self):
+        """The bot or client the wrapped `RequestHandler` belongs to."""
+        return self.session.bot
+
+    @property
+    def proxy(self) -> Optional[str]:
+        """The proxy to use for requests."""
+        return self.session.proxy["http"] if self.session.proxy else None
+
+    def fetch_http_handler(self) -> "ClientSession":
+        """
+        `fetch_http_handler` - Returns the pooled `aiohttp` session, creating it on first use
+
+        `**Returns**``
+        - `ClientSession` - The pooled session.
+
+        """
+        if self.http_handler is None or self.http_handler.closed:
+            from aiohttp import ClientSession, TCPConnector
+
+            self.http_handler = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout
+                    ),
+                auto_decompress=True
+                )
+        return self.http_handler
+
+    async def send_request(
+            self,
+            method: str,
+            url: str,
+            data: Union[dict, bytes, MediaStream, None],
+            headers: dict,
+            content_type: Optional[str]
+        ) -> Tuple[int, str]:
+        """
+        `send_request` - Sends a request
+
+        `**Parameters**``
+        - `method` - The request method to use.
+        - `url` - The url to send the request to.
+        - `data` - The data to send with the request.
+        - `headers` - The headers to send with the request.
+        - `content_type` - The content type of the data.
+
+        `**Returns**``
+        - `Tuple[int, str]` - The status code and response from the request.
+
+        """
+        await self.session.rate_limiter.acquire_async(url)
+
+        if isinstance(data, MediaStream):
+            # aiohttp closes file bodies once they are sent, which would stop a retry
+            # from rewinding the stream, so it is sent as an iterator of chunks instead.
+            data = self.iter_stream(data)
+
+        async with self.fetch_http_handler().request(
+            method, url, data=data, headers=headers, proxy=self.proxy
+        ) as response:
+            self.session.rate_limiter.feedback(url, response.status)
+            return response.status, await response.text()
+
+    @staticmethod
+    async def iter_stream(stream: MediaStream) -> AsyncIterator[bytes]:
+        """`iter_stream` - Yields the chunks of a `MediaStream` from its current position."""
+        for chunk in stream:
+            yield chunk
+
+    async def handler(
+        self,
+        method: str,
+        url: str,
+        data: Union[dict, bytes, None] = None,
+        content_type: Optional[str] = None,
+        is_login_required: bool = True
+    ) -> dict:
+        """
+        `handler` - Handles all requests
+
+        `**Parameters**``
+        - `method` - The request method to use.
+        - `url` - The url to send the request to.
+        - `data` - The data to send with the request.
+        - `content_type` - The content type of the data.
+        - `is_login_required` - Whether or not the request requires a login.
+
+        `**Returns**``
+        - `dict` - The response from the request.
+
+        """
+        from aiohttp import ClientError
+
+        url = self.session.service_url(url)
+        data = self.session.serialize(data) if data or content_type else data
+        attempt = 0
+
+        while True:
+            attempt += 1
+            url, headers, binary_data = self.session.prepare_request(
+                method, url, data, content_type, is_login_required
+            )
+
+            try:
+                status_code, content = await self.send_request(
+                    method, url, binary_data, headers, content_type
+                )
+            except (ClientError, AsyncTimeoutError) as e:
+                self.bot._log(f"Failed to send request: {e}")
+                delay = self.session.retry_delay(method, url, attempt)
+                if delay is None:
+                    raise
+                await async_sleep(delay)
+                continue
+
+            self.session.print_response(method=method, url=url, status_code=status_code)
+
+            delay = self.session.retry_delay(method, url, attempt, status_code)
+            if delay is not None:
+                await async_sleep(delay)
+                continue
+
+            response = self.session.handle_response(status_code=status_code, response=content)
+
+            if response is not None:
+                return response
+
+            if self.session.retry_policy.next_delay(method, url, attempt, idempotent_only=False) is None:
+                raise APIException(self.session.codec.loads(content))
+
+    async def upload_media(
+        self,
+        media: Union[str, bytes, BinaryIO, MediaStream],
+        content_type: Optional[str] = None,
+        accept: Optional[str] = None
+        ) -> dict:
+        """
+        `upload_media` - Awaitable version of `RequestHandler.upload_media`, opening files and downloads in a worker thread
+
+        `**Parameters**``
+        - `media` - A file path, an `http(s)` url, bytes, an open binary file or a `MediaStream`.
+        - `content_type` - The content type of the media. `Defaults` to the sniffed type, or `image/jpg`.
+        - `accept` - The content type prefix the media must have, e.g. `image/`. `Defaults` to `None`.
+
+        `**Returns**``
+        - `dict` - The response from the request.
+
+        """
+        if self.upload_slots is None:
+            self.upload_slots = Semaphore(self.session.upload_limit)
+
+        stream: MediaStream = await get_running_loop().run_in_executor(None, self.session.open_media, media, accept)
+        try:
+            cached = self.session.cached_media(stream)
+            if cached is not None:
+                return cached
+
+            async with self.upload_slots:
+                response = await self.handler(
+                    method="POST",
+                    url="/g/s/media/upload",
+                    data=stream,
+                    content_type=content_type or stream.content_type or "image/jpg"
+                    )
+            self.session.cache_media(stream, response)
+            return response
+        finally:
+            if stream is not media:
+                stream.close()
+
+    async def close(self) -> None:
+        """`close` - Closes the pooled session and its connections."""
+        if self.http_handler is not None and not self.http_handler.closed:
+            await self.http_handler.close()
+
+    async def __aenter__(self) -> "AsyncRequestHandler":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,138 @@
+from random import uniform
+from threading import Lock
+from collections import deque
+from time import monotonic
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from .rate_limit import endpoint_family
+
+__all__ = (
+    "RetryPolicy",
+    )
+
+class RetryPolicy:
+    """
+    `RetryPolicy` - Decides whether and when a failed request is sent again.
+
+    Retries wait an exponentially growing, jittered delay and are capped per request by
+    `max_attempts` and across all requests by a budget of `budget` retries per `budget_window`
+    seconds, so an outage does not turn into a retry storm. Connection errors and retryable
+    status codes may leave a request half-applied, so they are only retried for idempotent
+    methods unless `retry_non_idempotent` is set.
+
+    `**Parameters**``
+    - `max_attempts` - The maximum number of attempts per request, including the first one. `Defaults` to `5`.
+    - `base_delay` - The delay before the first retry in seconds. `Defaults` to `0.5`.
+    - `max_delay` - The longest delay between two attempts in seconds. `Defaults` to `30`.
+    - `jitter` - Whether to pick a random delay between `0` and the backoff ("full jitter"). `Defaults` to `True`.
+    - `budget` - The maximum number of retries per `budget_window`, `None` for no budget. `Defaults` to `30`.
+    - `budget_window` - The length of the budget window in seconds. `Defaults` to `60`.
+    - `retry_status_codes` - The status codes that are retried. `Defaults` to `{502, 503}`.
+    - `idempotent_methods` - The methods that are safe to send twice. `Defaults` to `{"GET", "DELETE"}`.
+    - `retry_non_idempotent` - Whether `POST` requests are retried after connection errors and retryable statuses. `Defaults` to `False`.
+
+    `**Example**`
+
+    ```py
+    bot.request.retry_policy = RetryPolicy(max_attempts=3, base_delay=1)
+    print(bot.request.retry_policy.metrics())
+    ```
+
+    """
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        budget: Optional[int] = 30,
+        budget_window: float = 60.0,
+        retry_status_codes: Iterable[int] = (502, 503),
+        idempotent_methods: Iterable[str] = ("GET", "DELETE"),
+        retry_non_idempotent: bool = False
+        ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts:          int = max_attempts
+        self.base_delay:            float = base_delay
+        self.max_delay:             float = max_delay
+        self.jitter:                bool = jitter
+        self.budget:                Optional[int] = budget
+        self.budget_window:         float = budget_window
+        self.retry_status_codes:    FrozenSet[int] = frozenset(retry_status_codes)
+        self.idempotent_methods:    FrozenSet[str] = frozenset(method.upper() for method in idempotent_methods)
+        self.retry_non_idempotent:  bool = retry_non_idempotent
+
+        self._history:              deque = deque()
+        self._lock:                 Lock = Lock()
+
+        self.retries:               Dict[str, int] = {}
+        self.exhausted:             Dict[str, int] = {}
+        self.budget_exceeded:       int = 0
+
+    def is_idempotent(self, method: str) -> bool:
+        """Whether `method` can be sent twice without side effects."""
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        `backoff` - Returns the delay before the next attempt.
+
+        `**Parameters**``
+        - `attempt` - The number of attempts made so far, starting at `1`.
+
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return uniform(0, delay) if self.jitter else delay
+
+    def _take_budget(self) -> bool:
+        if self.budget is None:
+            return True
+
+        now = monotonic()
+        with self._lock:
+            while self._history and now - self._history[0] > self.budget_window:
+                self._history.popleft()
+
+            if len(self._history) >= self.budget:
+                self.budget_exceeded += 1
+                return False
+
+            self._history.append(now)
+            return True
+
+    def next_delay(self, method: str, url: str, attempt: int, idempotent_only: bool = True) -> Optional[float]:
+        """
+        `next_delay` - Returns how long to wait before retrying, or `None` if the request should not be retried.
+
+        `**Parameters**``
+        - `method` - The request method.
+        - `url` - The request url, counted per endpoint family.
+        - `attempt` - The number of attempts made so far, starting at `1`.
+        - `idempotent_only` - Whether the failure only allows retrying idempotent methods. `Defaults` to `True`.
+
+        """
+        family = endpoint_family(url)
+
+        if idempotent_only and not (self.retry_non_idempotent or self.is_idempotent(method)):
+            return None
+
+        if attempt >= self.max_attempts or not self._take_budget():
+            with self._lock:
+                self.exhausted[family] = self.exhausted.get(family, 0) + 1
+            return None
+
+        with self._lock:
+            self.retries[family] = self.retries.get(family, 0) + 1
+        return self.backoff(attempt)
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the retry and exhaustion counts per endpoint family and the budget usage."""
+        with self._lock:
+            return {
+                "retries": dict(self.retries),
+                "exhausted": dict(self.exhausted),
+                "budget_used": len(self._history),
+                "budget_exceeded": self.budget_exceeded
+                }
@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Type
+
+from requests import Session as Http
+from requests.exceptions import (
+    ConnectionError,
+    ReadTimeout,
+    SSLError,
+    ProxyError,
+    ConnectTimeout
+    )
+
+__all__ = (
+    "Transport",
+    "RequestsTransport",
+    "HTTP2Transport",
+    )
+
+class Transport(ABC):
+    """
+    `Transport` - Sends one HTTP request and returns its status code and body.
+
+    `RequestHandler.send_request` waits on the rate limiter and hands every attempt to its
+    transport, while signing, retries and response handling stay in the handler, so any client
+    library can be plugged in by implementing `request`. Errors in `errors` are treated as failed
+    sends and retried by the handler's `RetryPolicy`.
+
+    `**Example**`
+
+    ```py
+    from pymino.ext.utilities import HTTP2Transport
+
+    bot.request.transport = HTTP2Transport(max_connections=2)
+    ```
+
+    """
+    name: str = "transport"
+    errors: Tuple[Type[BaseException], ...] = ()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        headers: Dict[str, str],
+        proxies: Optional[Dict[str, Optional[str]]] = None
+        ) -> Tuple[int, str]:
+        """
+        `request` - Sends a request.
+
+        `**Parameters**``
+        - `method` - The request method to use.
+        - `url` - The url to send the request to.
+        - `data` - The body, `bytes`, a `MediaStream` or `None`.
+        - `headers` - The headers to send with the request.
+        - `proxies` - The `requests` style proxies of the handler. `Defaults` to `None`.
+
+        `**Returns**``
+        - `Tuple[int, str]` - The status code and response from the request.
+
+        """
+
+    def close(self) -> None:
+        """`close` - Closes the connections of the transport."""
+        return None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name}>"
+
+
+class RequestsTransport(Transport):
+    """
+    `RequestsTransport` - HTTP/1.1 over a pooled `requests.Session`, the default transport.
+
+    `**Parameters**``
+    - `session` - The session to send requests with. `Defaults` to a new `requests.Session`.
+
+    """
+    name = "requests"
+    errors = (
+        ConnectionError,
+        ReadTimeout,
+        SSLError,
+        ProxyError,
+        ConnectTimeout
+        )
+
+    def __init__(self, session: Optional[Http] = None) -> None:
+        self.session: Http = session or Http()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        headers: Dict[str, str],
+        proxies: Optional[Dict[str, Optional[str]]] = None
+        ) -> Tuple[int, str]:
+        response = self.session.request(method, url, data=data, headers=headers, proxies=proxies)
+        return response.status_code, response.text
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """
+    `HTTP2Transport` - HTTP/2 over `httpx`, multiplexing concurrent requests on a few connections.
+
+    Every thread that sends a request opens a stream on a shared connection instead of taking
+    a connection of its own, so a bot sending from many handlers at once keeps one or two TLS
+    connections to the API instead of one per thread.
+
+    HTTP/2 is negotiated during the TLS handshake, so `http://` urls are sent over `https://`.
+    With `tls` disabled, requests are sent in cleartext with HTTP/2 prior knowledge (h2c), which
+    only servers that expect it understand, such as a local benchmark server.
+
+    Connection-specific headers like `CONNECTION` and `HOST` are not allowed in HTTP/2 and are
+    dropped from every request.
+
+    Needs `httpx` with HTTP/2 support: `pip install "httpx[http2]"`.
+
+    `**Parameters**``
+    - `max_connections` - The maximum number of open connections. `Defaults` to `4`.
+    - `keepalive_expiry` - The number of seconds an idle connection is kept alive. `Defaults` to `30`.
+    - `timeout` - The number of seconds to wait for a response. `Defaults` to `30`.
+    - `tls` - Whether `http://` urls are upgraded to `https://`. `Defaults` to `True`.
+    - `proxy` - The proxy to send requests through. `Defaults` to `None`.
+
+    The `httpx` client is built with one proxy, so the `proxies` of the handler are not applied
+    per request. A request whose `proxies` name a different proxy raises `ValueError` instead of
+    being sent directly, so a bot created with `proxy=...` needs `HTTP2Transport(proxy=...)`.
+
+    `http_version` is the protocol of the last response, `HTTP/2` once it was negotiated.
+
+    """
+    name = "http2"
+    HOP_HEADERS = frozenset({"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade", "host"})
+
+    def __init__(
+        self,
+        max_connections: int = 4,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 30.0,
+        tls: bool = True,
+        proxy: Optional[str] = None
+        ) -> None:
+        try:
+            from httpx import Client, Limits, TransportError
+
+            client = Client(
+                http1=tls,
+                http2=True,
+                limits=Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=keepalive_expiry
+                    ),
+                timeout=timeout,
+                proxy=proxy
+                )
+        except ImportError as e:
+            raise ImportError('HTTP2Transport needs httpx with HTTP/2 support, run `pip install "httpx[http2]"`.') from e
+
+        self.tls:           bool = tls
+        self.proxy:         Optional[str] = proxy
+        self.client:        Client = client
+        self.errors:        Tuple[Type[BaseException], ...] = (TransportError,)
+        self.http_version:  Optional[str] = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        headers: Dict[str, str],
+        proxies: Optional[Dict[str, Optional[str]]] = None
+        ) -> Tuple[int, str]:
+        proxy = (proxies.get("https") or proxies.get("http")) if proxies else None
+        if proxy != self.proxy:
+            raise ValueError(f"HTTP2Transport was created with proxy {self.proxy!r} and cannot send through {proxy!r}.")
+
+        if self.tls and url.startswith("http://"):
+            url = f"https://{url[7:]}"
+
+        headers = {key: value for key, value in headers.items() if key.lower() not in self.HOP_HEADERS}
+        if isinstance(data, dict):
+            response = self.client.request(method, url, data=data, headers=headers)
+        else:
+            response = self.client.request(method, url, content=data, headers=headers)
+        self.http_version = response.http_version
+        return response.status_code, response.text
+
+    def close(self) -> None:
+        self.client.close()
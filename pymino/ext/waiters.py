@@ -0,0 +1,208 @@
+from threading import Event, Lock
+from contextlib import suppress
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from asyncio import AbstractEventLoop, Future, get_running_loop, wait_for, TimeoutError as AsyncTimeoutError
+
+from .utilities.cache import CacheNamespace, MemoryCache
+
+__all__ = (
+    "MessageWaiter",
+    "WaiterRegistry",
+    )
+
+class MessageWaiter:
+    """
+    `MessageWaiter` - A pending wait for the next message of a user in a chat.
+
+    `**Parameters**``
+    - `predicate` - Only messages for which this returns `True` resolve the waiter. `Defaults` to `None`.
+    - `loop` - The event loop to resolve `future` on, for async waiters. `Defaults` to `None`.
+
+    """
+    __slots__ = ("predicate", "event", "content", "loop", "future")
+
+    def __init__(self, predicate: Optional[Callable[[str], bool]] = None, loop: Optional[AbstractEventLoop] = None) -> None:
+        self.predicate: Optional[Callable[[str], bool]] = predicate
+        self.event:     Event = Event()
+        self.content:   Optional[str] = None
+        self.loop:      Optional[AbstractEventLoop] = loop
+        self.future:    Optional[Future] = loop.create_future() if loop else None
+
+    def matches(self, content: str) -> bool:
+        """Whether the message content resolves this waiter."""
+        if self.predicate is None:
+            return True
+        try:
+            return bool(self.predicate(content))
+        except Exception:
+            return False
+
+    def resolve(self, content: str) -> None:
+        """Resolves the waiter with the message content."""
+        self.content = content
+        self.event.set()
+
+        if self.future is not None:
+            self.loop.call_soon_threadsafe(self._set_future, content)
+
+    def _set_future(self, content: str) -> None:
+        if not self.future.done():
+            self.future.set_result(content)
+
+
+class WaiterRegistry:
+    """
+    `WaiterRegistry` - Resolves waiters keyed by (chatId, userId) as messages arrive.
+
+    Messages that no waiter is interested in are kept for `buffer_ttl` seconds, so a message
+    that arrives just before `wait` is called is not missed. Waiting costs no CPU: waiters block
+    on a `threading.Event` or an `asyncio.Future` until `feed` resolves them or they time out.
+
+    `**Parameters**``
+    - `buffer_ttl` - How long unclaimed messages are kept, in seconds. `Defaults` to `90`.
+    - `max_buffer_size` - The maximum number of unclaimed messages kept. `Defaults` to `10000`.
+    - `buffer` - Where unclaimed messages are kept, such as the `messages` namespace of a `TieredCache`.
+        `Defaults` to a `MemoryCache` built from `buffer_ttl` and `max_buffer_size`.
+
+    `**Example**`
+
+    ```py
+    registry = WaiterRegistry()
+
+    # In the websocket thread
+    registry.feed(chatId, userId, "$verify")
+
+    # In a handler
+    content = registry.wait(chatId, userId, timeout=15)
+    ```
+
+    """
+    def __init__(
+        self,
+        buffer_ttl: float = 90,
+        max_buffer_size: int = 10000,
+        buffer: Optional[Union[MemoryCache, CacheNamespace]] = None
+        ) -> None:
+        self._waiters:      Dict[Tuple[str, str], List[MessageWaiter]] = {}
+        self._buffer:       Union[MemoryCache, CacheNamespace] = buffer if buffer is not None else MemoryCache(max_buffer_size, buffer_ttl)
+        self._lock:         Lock = Lock()
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def feed(self, chatId: str, userId: str, content: str) -> bool:
+        """
+        `feed` - Resolves the waiters of a user in a chat, or buffers the message if there are none.
+
+        `**Parameters**``
+        - `chatId` - The chat the message was sent in.
+        - `userId` - The author of the message.
+        - `content` - The content of the message.
+
+        `**Returns**``
+        - `bool` - `True` if at least one waiter was resolved.
+
+        """
+        key = (chatId, userId)
+
+        with self._lock:
+            waiters = self._waiters.get(key, [])
+            resolved = [waiter for waiter in waiters if waiter.matches(content)]
+
+            if not resolved:
+                self._buffer.set(key, content)
+                return False
+
+            remaining = [waiter for waiter in waiters if waiter not in resolved]
+            if remaining:
+                self._waiters[key] = remaining
+            else:
+                self._waiters.pop(key, None)
+
+        for waiter in resolved:
+            waiter.resolve(content)
+        return True
+
+    def _register(self, key: Tuple[str, str], waiter: MessageWaiter) -> Optional[str]:
+        with self._lock:
+            buffered = self._buffer.pop(key, None)
+            if buffered is not None and waiter.matches(buffered):
+                return buffered
+
+            self._waiters.setdefault(key, []).append(waiter)
+            return None
+
+    def _unregister(self, key: Tuple[str, str], waiter: MessageWaiter) -> None:
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters is None:
+                return None
+            with suppress(ValueError):
+                waiters.remove(waiter)
+            if waiters == []:
+                self._waiters.pop(key, None)
+
+    def wait(
+        self,
+        chatId: str,
+        userId: str,
+        timeout: Optional[float] = None,
+        predicate: Optional[Callable[[str], bool]] = None
+        ) -> Optional[str]:
+        """
+        `wait` - Blocks until the user sends a message in the chat.
+
+        `**Parameters**``
+        - `chatId` - The chat to wait in.
+        - `userId` - The user to wait for.
+        - `timeout` - The maximum time to wait in seconds. `Defaults` to `None`.
+        - `predicate` - Only messages for which this returns `True` are accepted. `Defaults` to `None`.
+
+        `**Returns**``
+        - `Optional[str]` - The message content, or `None` if the timeout was reached.
+
+        """
+        key = (chatId, userId)
+        waiter = MessageWaiter(predicate)
+
+        buffered = self._register(key, waiter)
+        if buffered is not None:
+            return buffered
+
+        if not waiter.event.wait(timeout):
+            self._unregister(key, waiter)
+        return waiter.content
+
+    async def wait_async(
+        self,
+        chatId: str,
+        userId: str,
+        timeout: Optional[float] = None,
+        predicate: Optional[Callable[[str], bool]] = None
+        ) -> Optional[str]:
+        """
+        `wait_async` - Awaitable version of `wait`.
+
+        `**Returns**``
+        - `Optional[str]` - The message content, or `None` if the timeout was reached.
+
+        """
+        key = (chatId, userId)
+        waiter = MessageWaiter(predicate, get_running_loop())
+
+        buffered = self._register(key, waiter)
+        if buffered is not None:
+            return buffered
+
+        try:
+            return await wait_for(waiter.future, timeout)
+        except AsyncTimeoutError:
+            self._unregister(key, waiter)
+            return waiter.content
+
+    def clear_expired(self) -> None:
+        """`clear_expired` - Removes buffered messages older than `buffer_ttl`."""
+        if isinstance(self._buffer, MemoryCache):
+            self._buffer.expire()
+        else:
+            self._buffer.memory.expire()
@@ -0,0 +1,188 @@
+from contextlib import suppress
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from requests import Session as Http
+from requests.adapters import HTTPAdapter
+
+from .bot import Bot
+from .ext.waiters import WaiterRegistry
+from .ext.keepalive import KeepaliveScheduler
+from .ext.utilities.bulk import BulkResult, fetch_bulk
+from .ext.utilities.cache import TieredCache
+from .ext.utilities.device import DeviceIdPool
+from .ext.utilities.generate import Generator
+from .ext.utilities.transport import Transport, RequestsTransport
+
+__all__ = (
+    "Fleet",
+    )
+
+class Fleet:
+    """
+    `Fleet` - Runs many bot accounts in one process.
+
+    All bots in a fleet share:
+    - one HTTP connection pool, or one `Transport` such as an `HTTP2Transport`
+    - one signing `Generator` and `DeviceIdPool`
+    - one `TieredCache`
+    - a single `KeepaliveScheduler` for heartbeats and `send_active`, so no bot needs its own alive thread
+
+    The bots' websockets are spread round-robin over the ws1-ws4 endpoints.
+
+    Each bot keeps its own `sid`, device ID, community, event handlers and dispatch pool.
+
+    `**Parameters**``
+    - `cache_directory` - The directory of the shared disk cache. `Defaults` to `"cache"`.
+    - `pool_connections` - The number of hosts the HTTP pool keeps connections to. `Defaults` to `10`.
+    - `pool_maxsize` - The number of connections kept per host. `Defaults` to `100`.
+    - `keepalive_workers` - The number of threads heartbeats and activity updates run on. `Defaults` to `4`.
+    - `transport` - The transport every bot sends requests with. `Defaults` to a `RequestsTransport` over the shared pool.
+    - `**bot_options` - Default keyword arguments for every `Bot` the fleet creates.
+
+    `**Example**`
+
+    ```py
+    fleet = Fleet(command_prefix="!", intents=True, dispatch_workers=2)
+
+    @fleet.command("ping")
+    def ping(ctx: Context):
+        ctx.reply("pong")
+
+    results = fleet.run([
+        {"email": "first@example.com", "password": "password"},
+        {"email": "second@example.com", "password": "password"}
+        ])
+    ```
+
+    """
+    def __init__(
+        self,
+        cache_directory: str = "cache",
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+        keepalive_workers: int = 4,
+        transport: Optional[Transport] = None,
+        **bot_options
+        ) -> None:
+        self.bot_options:   Dict[str, Any] = bot_options
+        self.bots:          List[Bot] = []
+        self.cache:         TieredCache = TieredCache(cache_directory)
+        self.keepalive:     KeepaliveScheduler = KeepaliveScheduler(workers=keepalive_workers)
+        self.generate:      Optional[Generator] = None
+        self.device_pool:   Optional[DeviceIdPool] = None
+        self.http:          Http = Http()
+        self._setups:       List[Any] = []
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.transport:     Transport = transport or RequestsTransport(self.http)
+
+    def add(self, bot: Optional[Bot] = None, **options) -> Bot:
+        """
+        `add` - Adds a bot to the fleet, creating it from the fleet's `bot_options` if not given.
+
+        `**Parameters**``
+        - `bot` - An existing bot to adopt. `Defaults` to `None`.
+        - `**options` - Keyword arguments for the new `Bot`, overriding `bot_options`.
+
+        `**Returns**``
+        - `Bot` - The bot, now sharing the fleet's resources.
+
+        """
+        if bot is None:
+            bot = Bot(**{**self.bot_options, **options})
+
+        if self.generate is None:
+            self.generate, self.device_pool = bot.generate, bot.device_pool
+
+        bot.generate = bot.request.generate = self.generate
+        bot.device_pool = bot.request.device_pool = self.device_pool
+        bot.request.http_handler = self.http
+        bot.request.transport = self.transport
+        bot.cache = self.cache
+        bot.request.media_cache = self.cache.namespace("media")
+        bot.waiters = WaiterRegistry(buffer=self.cache.namespace("messages"))
+        bot.keepalive = self.keepalive
+
+        if not any(shard.running for shard in bot.shards):
+            bot.configure_shards(len(bot.shards), offset=len(self.bots))
+
+        for setup in self._setups:
+            setup(bot)
+
+        self.bots.append(bot)
+        return bot
+
+    def setup(self, function):
+        """
+        `setup` - Registers a function that is called with every bot added to the fleet.
+
+        Use it to register the same commands and events on every bot.
+
+        `**Example**`
+
+        ```py
+        @fleet.setup
+        def register(bot: Bot):
+            @bot.on_text_message()
+            def log_message(ctx: Context):
+                print(f"{bot.profile.username}: {ctx.message.content}")
+        ```
+
+        """
+        self._setups.append(function)
+        for bot in self.bots:
+            function(bot)
+        return function
+
+    def command(self, *args, **kwargs):
+        """`command` - Registers a command on every bot of the fleet, same arguments as `Bot.command`."""
+        def decorator(function):
+            self.setup(lambda bot: bot.command(*args, **kwargs)(function))
+            return function
+        return decorator
+
+    def run(
+        self,
+        accounts: Iterable[Dict[str, Any]],
+        concurrency: int = 4,
+        logins_per_second: Optional[float] = 1.0
+        ) -> List[BulkResult]:
+        """
+        `run` - Creates a bot for every account and logs them in.
+
+        `**Parameters**``
+        - `accounts` - Keyword arguments for `Bot.run` per account, e.g. `{"email": ..., "password": ...}`.
+        - `concurrency` - The number of accounts logged in at once. `Defaults` to `4`.
+        - `logins_per_second` - The maximum number of logins started per second. `Defaults` to `1`.
+
+        `**Returns**``
+        - `List[BulkResult]` - One result per account with the running bot, or the error that stopped it.
+
+        """
+        accounts = list(accounts)
+        bots = [self.add() for _ in accounts]
+
+        def start(index: int) -> Bot:
+            bots[index].run(**accounts[index])
+            return bots[index]
+
+        return fetch_bulk(start, range(len(accounts)), concurrency=concurrency, rate_limit=logins_per_second)
+
+    def stop(self) -> None:
+        """`stop` - Stops the keepalive scheduler and closes every bot's websocket."""
+        self.keepalive.stop()
+        for bot in self.bots:
+            with suppress(Exception):
+                bot.stop_websocket()
+
+    def metrics(self) -> dict:
+        """`metrics` - Returns the number of bots and the keepalive counters."""
+        return {"bots": len(self.bots), "keepalive": self.keepalive.metrics()}
+
+    def __iter__(self) -> Iterator[Bot]:
+        return iter(self.bots)
+
+    def __len__(self) -> int:
+        return len(self.bots)